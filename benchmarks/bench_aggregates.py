@@ -0,0 +1,121 @@
+"""Benchmark `Dataset.check_aggregates` against a cell-by-cell Python loop.
+
+Builds a time × geo cube of `--cells` cells (1M by default) whose geo
+dimension is a three-level hierarchy (world, regions, countries) with
+consistent totals, breaks a few of them, then checks every parent against
+the sum of its children: by hand, one cell at a time, and with
+`check_aggregates` for list and compact values (NumPy when installed, pure
+Python otherwise). Usage:
+
+    uv run python benchmarks/bench_aggregates.py [--cells N] [--regions N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from unittest import mock
+
+from jsonstat_validator import Dataset
+from jsonstat_validator.arrays import optional_numpy
+from jsonstat_validator.values import CompactValues
+
+# Countries in each region.
+COUNTRIES = 9
+
+
+def make_dataset(cells: int, regions: int) -> Dataset:
+    """Return a time × geo dataset of about `cells` cells with totals."""
+    geo = ["W"] + [f"R{r}" for r in range(regions)]
+    child = {"W": geo[1:]}
+    for r in range(regions):
+        child[f"R{r}"] = [f"R{r}C{c}" for c in range(COUNTRIES)]
+        geo.extend(child[f"R{r}"])
+    periods = max(1, cells // len(geo))
+    rng = random.Random(0)
+    value = []
+    for _ in range(periods):
+        countries = [rng.randrange(1000) for _ in range(regions * COUNTRIES)]
+        totals = [
+            sum(countries[r * COUNTRIES : (r + 1) * COUNTRIES]) for r in range(regions)
+        ]
+        value.extend([sum(totals), *totals, *countries])
+    for position in rng.sample(range(0, len(value), len(geo)), 5):
+        value[position] += 1  # A world total off by one.
+    return Dataset.from_trusted(
+        {
+            "version": "2.0",
+            "class": "dataset",
+            "id": ["time", "geo"],
+            "size": [periods, len(geo)],
+            "value": value,
+            "dimension": {
+                "time": {"category": {"index": [str(i) for i in range(periods)]}},
+                "geo": {"category": {"index": geo, "child": child}},
+            },
+        }
+    )
+
+
+def naive_check(dataset: Dataset) -> list[int]:
+    """Return the positions of mismatched parent cells, one cell at a time."""
+    category = dataset.dimension["geo"].category
+    positions = category.positions
+    n_geo = dataset.size[1]
+    found = []
+    for period in range(dataset.size[0]):
+        for parent, children in category.child.items():
+            position = period * n_geo + positions[parent]
+            total = sum(
+                dataset.value[period * n_geo + positions[kid]] for kid in children
+            )
+            if dataset.value[position] != total:
+                found.append(position)
+    return sorted(found)
+
+
+def timed(label: str, func: Callable[[], object]) -> object:
+    """Run `func`, printing how long it took, and return its result."""
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<32} {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cells", type=int, default=1_000_000)
+    parser.add_argument("--regions", type=int, default=50)
+    args = parser.parse_args()
+
+    optional_numpy()  # Import NumPy, if installed, before timing.
+    dataset = make_dataset(args.cells, args.regions)
+    print(f"{dataset.n_cells} cells, {dataset.size[1]} geo categories")
+
+    expected = timed("naive cell-by-cell", lambda: naive_check(dataset))
+    result = timed("check_aggregates (list)", lambda: dataset.check_aggregates("geo"))
+    assert list(result.positions) == expected
+    patch = mock.patch("jsonstat_validator.aggregates.optional_numpy", lambda: None)
+    with patch:
+        result = timed(
+            "check_aggregates (list, Python)", lambda: dataset.check_aggregates("geo")
+        )
+    assert list(result.positions) == expected
+
+    compact = dataset._replace(value=CompactValues.from_list(dataset.value))
+    result = timed(
+        "check_aggregates (compact)", lambda: compact.check_aggregates("geo")
+    )
+    assert list(result.positions) == expected
+    with patch:
+        result = timed(
+            "check_aggregates (compact, Python)",
+            lambda: compact.check_aggregates("geo"),
+        )
+    assert list(result.positions) == expected
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark the validation of dimensions with very large codelists.
+
+Validates a dataset whose single dimension holds N categories grouped under
+regions, with labels, a `child` hierarchy and coordinates, in model and check
+modes. Every check is a constant number of passes over the categories, so time
+per category should grow no faster than that of building a plain dict of the
+IDs (shown as a baseline), which slows down as the table outgrows the CPU
+caches. Usage:
+
+    uv run python benchmarks/bench_category_validation.py [--categories 1e4 1e5 1e6]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from jsonstat_validator import validate_jsonstat
+
+
+def make_dataset(categories: int) -> dict:
+    regions = [f"R{i}" for i in range(max(1, categories // 10_000))]
+    areas = [f"A{i:07d}" for i in range(categories - len(regions))]
+    ids = regions + areas
+    category = {
+        "index": ids,
+        "label": {category_id: f"Area {category_id}" for category_id in ids},
+        "child": {region: areas[i :: len(regions)] for i, region in enumerate(regions)},
+        "coordinates": {area: [1.5, 42.25] for area in areas},
+    }
+    return {
+        "class": "dataset",
+        "id": ["geo"],
+        "size": [len(ids)],
+        "value": {"0": 1},
+        "dimension": {"geo": {"category": category}},
+    }
+
+
+def dict_baseline(data: dict) -> float:
+    ids = data["dimension"]["geo"]["category"]["index"]
+    start = time.perf_counter()
+    dict(zip(ids, range(len(ids)), strict=True))
+    return time.perf_counter() - start
+
+
+def timed(data: dict, mode: str) -> float:
+    start = time.perf_counter()
+    validate_jsonstat(data, mode=mode)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--categories", type=float, nargs="+", default=[1e4, 1e5, 1e6], metavar="N"
+    )
+    args = parser.parse_args()
+
+    print(f"{'categories':>12} {'µs/category: model':>19} {'check':>7} {'dict':>7}")
+    for categories in map(int, args.categories):
+        data = make_dataset(categories)
+        per_category = [
+            seconds / categories * 1e6
+            for seconds in (timed(data, "model"), timed(data, "check"))
+        ]
+        per_category.append(dict_baseline(data) / categories * 1e6)
+        print(
+            f"{categories:>12,} {per_category[0]:>19.2f} {per_category[1]:>7.2f} "
+            f"{per_category[2]:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark the memory held by a dataset with and without compact values.
+
+Validates the JSON of a numeric dataset with a few nulls into a `Dataset` model,
+once with plain list storage and once with `context={"compact_values": True}`,
+and reports the memory retained by the model. Usage:
+
+    uv run python benchmarks/bench_compact_values.py [--cells N] [--ints]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+
+from jsonstat_validator import Dataset
+
+
+def make_dataset(cells: int, ints: bool) -> dict:
+    cols = 1000
+    rows = max(1, cells // cols)
+    cells = rows * cols
+    rng = random.Random(0)
+    if ints:
+        value = [rng.randrange(10**6) for _ in range(cells)]
+    else:
+        value = [round(rng.uniform(0, 1000), 2) for _ in range(cells)]
+    for i in range(0, cells, 97):
+        value[i] = None
+    return {
+        "class": "dataset",
+        "id": ["row", "col"],
+        "size": [rows, cols],
+        "value": value,
+        "dimension": {
+            "row": {"category": {"index": [f"r{i}" for i in range(rows)]}},
+            "col": {"category": {"index": [f"c{i}" for i in range(cols)]}},
+        },
+    }
+
+
+def retained(payload: bytes, context: dict | None) -> tuple[int, Dataset]:
+    gc.collect()
+    tracemalloc.start()
+    model = Dataset.model_validate_json(payload, context=context)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, model
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cells", type=int, default=2_000_000)
+    parser.add_argument("--ints", action="store_true")
+    args = parser.parse_args()
+
+    data = make_dataset(args.cells, args.ints)
+    payload = json.dumps(data).encode()
+
+    plain, plain_model = retained(payload, None)
+    compact, compact_model = retained(payload, {"compact_values": True})
+    assert plain_model.model_dump() == compact_model.model_dump()
+    cells = len(data["value"])
+    print(f"{cells:,} {'integer' if args.ints else 'float'} cells")
+    print(f"list storage:    {plain / 1e6:8.1f} MB")
+    print(f"compact storage: {compact / 1e6:8.1f} MB")
+    print(f"reduction: {plain / compact:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark `to_csv` on a large cube, reporting time and peak memory.
+
+Builds a dataset of `--cells` cells (20M by default) with compact value storage,
+then exports it with `to_csv` and reports the throughput and how much the
+process peak memory (max RSS) grew during the export. Usage:
+
+    uv run python benchmarks/bench_csv_export.py [--cells N] [--chunk-rows N] [--out PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import resource
+import time
+from array import array
+
+from jsonstat_validator import CompactValues, Dataset, to_csv
+from jsonstat_validator.values import FLOAT
+
+
+def max_rss_mb() -> float:
+    """Return the peak resident set size of the process in MB (Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def make_dataset(cells: int) -> Dataset:
+    countries = 1000
+    periods = max(1, cells // countries)
+    geo = [f"C{i:04d}" for i in range(countries)]
+    time_ids = [str(i) for i in range(periods)]
+    value = CompactValues(array(FLOAT, range(countries * periods)), FLOAT)
+    return Dataset.from_trusted(
+        {
+            "version": "2.0",
+            "class": "dataset",
+            "id": ["geo", "time"],
+            "size": [countries, periods],
+            "value": value,
+            "status": "e",
+            "dimension": {
+                "geo": {
+                    "category": {
+                        "index": geo,
+                        "label": {g: f"Area {g}" for g in geo},
+                    }
+                },
+                "time": {"category": {"index": time_ids}},
+            },
+        }
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cells", type=int, default=20_000_000)
+    parser.add_argument("--chunk-rows", type=int, default=10_000)
+    parser.add_argument("--labels", action="store_true")
+    parser.add_argument("--out", default=os.devnull)
+    args = parser.parse_args()
+
+    dataset = make_dataset(args.cells)
+    before = max_rss_mb()
+    start = time.perf_counter()
+    rows = to_csv(dataset, args.out, chunk_rows=args.chunk_rows, labels=args.labels)
+    elapsed = time.perf_counter() - start
+    after = max_rss_mb()
+    print(f"{rows} rows, chunks of {args.chunk_rows} -> {args.out}")
+    print(f"time:    {elapsed:8.2f} s ({rows / elapsed / 1e6:.2f}M rows/s)")
+    print(f"peak memory before export: {before:8.1f} MB")
+    print(f"peak memory growth:        {after - before:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark dataset validation with and without a `DimensionCache`.
+
+Validates a series of datasets that share their dimension definitions (a
+monthly time dimension and a country codelist with regions and coordinates), as
+a statistical API serving many slices of the same cube would. Usage:
+
+    uv run python benchmarks/bench_dimension_cache.py [--datasets N] [--countries N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+
+from jsonstat_validator import DimensionCache, validate_jsonstat
+
+
+def make_datasets(count: int, countries: int) -> list[dict]:
+    months = [f"{y}-{m:02d}" for y in range(2000, 2025) for m in range(1, 13)]
+    regions = [f"R{i}" for i in range(max(1, countries // 25))]
+    geo = [f"C{i:04d}" for i in range(countries)]
+    children = {region: geo[i :: len(regions)] for i, region in enumerate(regions)}
+    shared = {
+        "time": {
+            "label": "Month",
+            "category": {"index": months, "label": {m: m for m in months}},
+        },
+        "geo": {
+            "label": "Country",
+            "category": {
+                "index": regions + geo,
+                "label": {g: f"Area {g}" for g in regions + geo},
+                "child": children,
+                "coordinates": {g: [i % 180, i % 90] for i, g in enumerate(geo)},
+            },
+        },
+    }
+    size = [1, len(months), len(regions) + len(geo)]
+    datasets = []
+    for i in range(count):
+        data = {
+            "class": "dataset",
+            "id": ["metric", "time", "geo"],
+            "size": size,
+            "value": {"0": i},
+            "role": {"time": ["time"], "geo": ["geo"], "metric": ["metric"]},
+            "dimension": {
+                "metric": {"category": {"label": {f"M{i}": f"Indicator {i}"}}},
+                **shared,
+            },
+        }
+        # Decode each dataset separately, as if from separate responses.
+        datasets.append(json.loads(json.dumps(data)))
+    return datasets
+
+
+def best_of(
+    datasets: list[dict], cache: Callable[[], DimensionCache | None], repeat: int
+) -> float:
+    """Return the best time to validate all datasets, with the cache `cache()`."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for data in datasets:
+            validate_jsonstat(data, dimension_cache=cache())
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--datasets", type=int, default=200)
+    parser.add_argument("--countries", type=int, default=250)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    datasets = make_datasets(args.datasets, args.countries)
+    cache = DimensionCache()
+    plain = best_of(datasets, lambda: None, args.repeat)
+    # An empty cache for each dataset: every lookup misses and stores.
+    cold = best_of(datasets, DimensionCache, args.repeat)
+    validate_jsonstat(datasets[0], dimension_cache=cache)
+    warm = best_of(datasets, lambda: cache, args.repeat)
+    print(f"{args.datasets} datasets, {args.countries} countries")
+    print(f"no cache:   {plain * 1000:8.1f} ms")
+    print(f"cold cache: {cold * 1000:8.1f} ms (every lookup misses)")
+    print(f"warm cache: {warm * 1000:8.1f} ms (every lookup hits)")
+    print(f"speedup (warm vs no cache): {plain / warm:.2f}x")
+    print(f"cold-fill overhead (cold vs no cache): {cold / plain:.2f}x")
+    print(cache.info())
+
+
+if __name__ == "__main__":
+    main()
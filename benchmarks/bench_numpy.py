@@ -0,0 +1,60 @@
+"""Benchmark `Dataset.to_numpy` and `Dataset.from_numpy` against list code.
+
+Builds a float cube of `--cells` cells (10M by default) with a share of null
+cells, then times converting its values to a reshaped array by hand and with
+`to_numpy` (list and compact storage), and building it with `from_numpy`.
+Requires NumPy. Usage:
+
+    uv run python benchmarks/bench_numpy.py [--cells N] [--null-share F]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from jsonstat_validator import Dataset
+
+
+def timed(label: str, func: Callable[[], object]) -> object:
+    """Run `func`, printing how long it took, and return its result."""
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<32} {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cells", type=int, default=10_000_000)
+    parser.add_argument("--null-share", type=float, default=0.1)
+    args = parser.parse_args()
+
+    countries = 1000
+    periods = max(1, args.cells // countries)
+    rng = np.random.default_rng(0)
+    cube = rng.random((countries, periods))
+    cube[rng.random(cube.shape) < args.null_share] = np.nan
+    dimensions = {"geo": range(countries), "time": range(periods)}
+    print(f"{cube.size} cells, {args.null_share:.0%} null")
+
+    compact = timed("from_numpy", lambda: Dataset.from_numpy(cube, dimensions))
+    listed = compact._replace(value=compact.value.tolist())
+    size = tuple(listed.size)
+    timed(
+        "list -> reshaped array by hand",
+        lambda: np.array(
+            [np.nan if cell is None else cell for cell in listed.value]
+        ).reshape(size),
+    )
+    timed("to_numpy (list)", listed.to_numpy)
+    timed("to_numpy (compact)", compact.to_numpy)
+    dense = Dataset.from_numpy(np.nan_to_num(cube), dimensions)
+    timed("to_numpy (compact, no nulls)", dense.to_numpy)
+
+
+if __name__ == "__main__":
+    main()
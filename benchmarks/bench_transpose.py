@@ -0,0 +1,103 @@
+"""Benchmark `Dataset.transpose` against a naive row-by-row rebuild.
+
+Builds a 3-dimensional cube of `--cells` cells (1M by default), then moves its
+first dimension last: by hand, computing the source position of every cell in
+Python, and with `transpose` for list, compact (NumPy when installed, pure
+Python otherwise) and dict-form values. Usage:
+
+    uv run python benchmarks/bench_transpose.py [--cells N] [--null-share F]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from itertools import product
+from unittest import mock
+
+from jsonstat_validator import Dataset
+from jsonstat_validator.arrays import optional_numpy
+from jsonstat_validator.values import CompactValues, sparse_values
+
+
+def make_dataset(cells: int, null_share: float) -> Dataset:
+    """Return a geo × sex × time dataset of about `cells` cells."""
+    geo, sex = 100, 2
+    periods = max(1, cells // (geo * sex))
+    size = [geo, sex, periods]
+    rng = random.Random(0)
+    n_cells = geo * sex * periods
+    value = [
+        None if rng.random() < null_share else rng.random() for _ in range(n_cells)
+    ]
+    dims = {
+        "geo": [f"C{i:03d}" for i in range(geo)],
+        "sex": ["F", "M"],
+        "time": [str(i) for i in range(periods)],
+    }
+    return Dataset.from_trusted(
+        {
+            "version": "2.0",
+            "class": "dataset",
+            "id": list(dims),
+            "size": size,
+            "value": value,
+            "dimension": {
+                dim_id: {"category": {"index": ids}} for dim_id, ids in dims.items()
+            },
+        }
+    )
+
+
+def naive_transpose(dataset: Dataset, new_id: list[str]) -> list:
+    """Rebuild `value` in the new dimension order, one cell at a time."""
+    order = [dataset.id.index(dim_id) for dim_id in new_id]
+    strides = dataset.strides
+    value = []
+    for coords in product(*(range(dataset.size[dim]) for dim in order)):
+        position = 0
+        for dim, coord in zip(order, coords, strict=True):
+            position += coord * strides[dim]
+        value.append(dataset.value[position])
+    return value
+
+
+def timed(label: str, func: Callable[[], object]) -> object:
+    """Run `func`, printing how long it took, and return its result."""
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<28} {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cells", type=int, default=1_000_000)
+    parser.add_argument("--null-share", type=float, default=0.1)
+    args = parser.parse_args()
+
+    optional_numpy()  # Import NumPy, if installed, before timing.
+    dataset = make_dataset(args.cells, args.null_share)
+    new_id = ["sex", "time", "geo"]
+    print(f"{dataset.n_cells} cells, {dataset.id} -> {new_id}")
+
+    expected = timed("naive row-by-row", lambda: naive_transpose(dataset, new_id))
+    result = timed("transpose (list)", lambda: dataset.transpose(new_id))
+    assert result.value == expected
+
+    compact = dataset._replace(value=CompactValues.from_list(dataset.value))
+    result = timed("transpose (compact)", lambda: compact.transpose(new_id))
+    assert result.value == expected
+    with mock.patch("jsonstat_validator.models.dataset.optional_numpy", lambda: None):
+        result = timed("transpose (compact, Python)", lambda: compact.transpose(new_id))
+    assert result.value == expected
+
+    sparse = dataset._replace(value=sparse_values(dataset.value))
+    result = timed("transpose (dict)", lambda: sparse.transpose(new_id))
+    assert result.to_dense().value == expected
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark `Dataset.from_trusted` against full validation.
+
+Builds a dataset with a labelled time dimension, a country codelist with
+regions and coordinates, and a metric dimension with units, dumps it with
+`model_dump()` (a payload the library produced itself) and rebuilds it with
+`Dataset.model_validate` and with `Dataset.from_trusted`, with and without a
+checksum. Usage:
+
+    uv run python benchmarks/bench_trusted.py [--countries N] [--cells-per-country N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+from jsonstat_validator import Dataset
+from jsonstat_validator.utils import payload_checksum
+
+
+def make_payload(countries: int, years: int) -> dict:
+    periods = [str(2000 + i) for i in range(years)]
+    regions = [f"R{i}" for i in range(max(1, countries // 25))]
+    geo = [f"C{i:04d}" for i in range(countries)]
+    metrics = ["pop", "gdp"]
+    size = [len(metrics), len(periods), len(regions) + len(geo)]
+    dataset = Dataset.model_validate(
+        {
+            "version": "2.0",
+            "class": "dataset",
+            "id": ["metric", "time", "geo"],
+            "size": size,
+            "value": [float(i) for i in range(size[0] * size[1] * size[2])],
+            "role": {"time": ["time"], "geo": ["geo"], "metric": ["metric"]},
+            "dimension": {
+                "metric": {
+                    "category": {
+                        "index": metrics,
+                        "unit": {m: {"decimals": 1, "label": m} for m in metrics},
+                    }
+                },
+                "time": {"category": {"index": periods}},
+                "geo": {
+                    "category": {
+                        "index": regions + geo,
+                        "label": {g: f"Area {g}" for g in regions + geo},
+                        "child": {
+                            r: geo[i :: len(regions)] for i, r in enumerate(regions)
+                        },
+                        "coordinates": {
+                            g: [i % 180, i % 90] for i, g in enumerate(geo)
+                        },
+                    }
+                },
+            },
+        }
+    )
+    return dataset.model_dump()
+
+
+def best_of(build: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--countries", type=int, default=1000)
+    parser.add_argument("--cells-per-country", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = make_payload(args.countries, args.cells_per_country // 2)
+    checksum = payload_checksum(payload)
+    validated = best_of(lambda: Dataset.model_validate(payload), args.repeat)
+    trusted = best_of(lambda: Dataset.from_trusted(payload), args.repeat)
+    checked = best_of(
+        lambda: Dataset.from_trusted(payload, checksum=checksum), args.repeat
+    )
+    print(f"{args.countries} countries, {len(payload['value'])} cells")
+    print(f"model_validate:          {validated * 1000:8.2f} ms")
+    print(f"from_trusted:            {trusted * 1000:8.2f} ms")
+    print(f"from_trusted + checksum: {checked * 1000:8.2f} ms")
+    print(f"speedup: {validated / trusted:.1f}x ({validated / checked:.1f}x checked)")
+
+
+if __name__ == "__main__":
+    main()
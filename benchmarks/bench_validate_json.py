@@ -0,0 +1,57 @@
+"""Benchmark validating raw JSON against `json.load` + dict validation.
+
+Runs both paths over every official sample under `tests/samples` and reports
+the throughput of each. Usage:
+
+    uv run python benchmarks/bench_validate_json.py [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from jsonstat_validator import validate_jsonstat, validate_jsonstat_json
+
+SAMPLES_DIR = Path(__file__).parent.parent / "tests" / "samples"
+
+
+def via_dict(payloads: list[bytes]) -> None:
+    for payload in payloads:
+        validate_jsonstat(json.loads(payload))
+
+
+def via_json(payloads: list[bytes]) -> None:
+    for payload in payloads:
+        validate_jsonstat_json(payload)
+
+
+def best_of(func, payloads: list[bytes], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(payloads)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = [path.read_bytes() for path in sorted(SAMPLES_DIR.rglob("*.json"))]
+    megabytes = sum(map(len, payloads)) / 1e6
+    print(f"{len(payloads)} samples, {megabytes:.2f} MB per pass")
+
+    dict_time = best_of(via_dict, payloads, args.repeat)
+    json_time = best_of(via_json, payloads, args.repeat)
+    print(f"json.loads + validate_jsonstat: {megabytes / dict_time:8.2f} MB/s")
+    print(f"validate_jsonstat_json:         {megabytes / json_time:8.2f} MB/s")
+    print(f"speedup: {dict_time / json_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
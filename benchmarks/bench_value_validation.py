@@ -0,0 +1,62 @@
+"""Benchmark `value` validation against pydantic's per-cell union matching.
+
+Validates numeric `value` lists (with a few nulls) with the union type the
+`value` field used to be validated with, and with `validate_values`. Usage:
+
+    uv run python benchmarks/bench_value_validation.py [--cells 1e6 1e7 5e7]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+
+from pydantic import TypeAdapter
+
+from jsonstat_validator.models.dataset import ValueType
+from jsonstat_validator.values import validate_values
+
+UNION = TypeAdapter(ValueType)
+
+
+def make_values(cells: int) -> list:
+    # Repeat a small block so that large inputs share their number objects.
+    block = [float(i) + 0.5 if i % 10 else None for i in range(1000)]
+    block[1::2] = range(1, 1000, 2)
+    return block * (cells // len(block)) + block[: cells % len(block)]
+
+
+def timed(func, values: list) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    result = func(values)
+    elapsed = time.perf_counter() - start
+    del result
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--cells", type=float, nargs="+", default=[1e6, 1e7, 5e7], metavar="N"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'cells':>12} {'union':>10} {'one-pass':>10} {'compact':>10} {'speedup':>8}"
+    )
+    for cells in map(int, args.cells):
+        values = make_values(cells)
+        union = timed(UNION.validate_python, values)
+        one_pass = timed(validate_values, values)
+        compact = timed(lambda v: validate_values(v, compact=True), values)
+        print(
+            f"{cells:>12,} {union:>9.3f}s {one_pass:>9.3f}s {compact:>9.3f}s "
+            f"{union / one_pass:>7.1f}x"
+        )
+        del values
+
+
+if __name__ == "__main__":
+    main()
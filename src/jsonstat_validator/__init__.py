@@ -9,6 +9,16 @@ dimensions are organized in categories.
 For more information on JSON-stat, see: https://json-stat.org/
 """
 
+from jsonstat_validator.aggregates import AggregateMismatches
+from jsonstat_validator.aio import (
+    AsyncValidator,
+    avalidate_jsonstat,
+    configure_async_validation,
+)
+from jsonstat_validator.batch import validate_many
+from jsonstat_validator.cache import DimensionCache
+from jsonstat_validator.diff import DatasetDiff
+from jsonstat_validator.export import to_csv
 from jsonstat_validator.models.base import JSONStatBaseModel, JSONStatSchema
 from jsonstat_validator.models.category import Category
 from jsonstat_validator.models.collection import Collection
@@ -16,8 +26,14 @@ from jsonstat_validator.models.dataset import Dataset
 from jsonstat_validator.models.dimension import Dimension
 from jsonstat_validator.models.link import Link
 from jsonstat_validator.models.unit import Unit
-from jsonstat_validator.utils import JSONStatValidationError
-from jsonstat_validator.validator import validate_jsonstat
+from jsonstat_validator.stream import validate_jsonstat_stream
+from jsonstat_validator.utils import JSONStatValidationError, payload_checksum
+from jsonstat_validator.validator import (
+    parse_jsonstat_json,
+    validate_jsonstat,
+    validate_jsonstat_json,
+)
+from jsonstat_validator.values import CompactValues
 
 # Rebuild models to resolve forward references
 Link.model_rebuild()
@@ -28,14 +44,27 @@ JSONStatSchema.model_rebuild()
 
 __version__ = "0.4.5"
 __all__ = [
+    "AggregateMismatches",
+    "AsyncValidator",
     "Category",
     "Collection",
+    "CompactValues",
     "Dataset",
+    "DatasetDiff",
     "Dimension",
+    "DimensionCache",
     "JSONStatBaseModel",
     "JSONStatSchema",
     "JSONStatValidationError",
     "Link",
     "Unit",
+    "avalidate_jsonstat",
+    "configure_async_validation",
+    "parse_jsonstat_json",
+    "payload_checksum",
+    "to_csv",
     "validate_jsonstat",
+    "validate_jsonstat_json",
+    "validate_jsonstat_stream",
+    "validate_many",
 ]
@@ -0,0 +1,173 @@
+"""Checking that parent categories total their children.
+
+Along a dimension, the cube is a stack of slabs, one per category, each the
+cells of that category across every other dimension. A parent of the `child`
+hierarchy must equal the sum of its children slab by slab, so the check adds
+whole slabs: with NumPy, the values are viewed as an array of shape
+(outer, categories, inner) and the children of every parent are summed in one
+`add.reduceat`; otherwise the slabs are cut with (strided) slices and summed
+cell by cell. Each parent is checked against its direct children,
+so a deep hierarchy is checked level by level in the same pass.
+
+Null and non-numeric cells are read as NaN: a parent cell is not checked if it,
+or a cell of one of its children, is not a number.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from itertools import chain, compress, repeat
+from operator import gt, sub
+from typing import TYPE_CHECKING
+
+from jsonstat_validator.arrays import mismatched_sums, optional_numpy
+from jsonstat_validator.cube import unravel
+from jsonstat_validator.values import CompactValues, dense_values
+
+if TYPE_CHECKING:
+    from jsonstat_validator.models.dataset import Dataset
+
+# Cell types summed; others (including bool) are read as NaN.
+_NUMBER_TYPES = frozenset((int, float))
+
+
+@dataclass(frozen=True)
+class AggregateMismatches:
+    """Cells of parent categories that differ from the sum of their children.
+
+    Attributes:
+        dataset: The dataset checked
+        dim_id: The dimension whose `child` hierarchy was checked
+        positions: Positions of the parent cells that do not match, in order
+        totals: The value of each of these cells
+        sums: The sum of the matching cells of the children
+    """
+
+    dataset: Dataset
+    dim_id: str
+    positions: array
+    totals: array
+    sums: array
+
+    def __repr__(self) -> str:
+        return f"AggregateMismatches(dim_id={self.dim_id!r}, cells={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __bool__(self) -> bool:
+        """Return whether any parent cell does not match."""
+        return bool(self.positions)
+
+    def iter_rows(self, labels: bool = False) -> Iterator[tuple]:
+        """Yield a tuple per mismatch: the categories, the total and the sum.
+
+        Args:
+            labels: Yield category labels instead of IDs, where defined
+        """
+        dataset = self.dataset
+        categories = [dataset._row_categories(dim_id, labels) for dim_id in dataset.id]
+        for position, total, children_sum in zip(
+            self.positions, self.totals, self.sums, strict=True
+        ):
+            coords = unravel(position, dataset.strides)
+            row = [categories[dim][coord] for dim, coord in enumerate(coords)]
+            yield (*row, total, children_sum)
+
+
+def _numbers(values: Sequence) -> list:
+    """Return the cells of a dense `value` list, with NaN for non-numbers."""
+    if set(map(type, values)) <= _NUMBER_TYPES:
+        return values if isinstance(values, list) else list(values)
+    return [cell if type(cell) in _NUMBER_TYPES else math.nan for cell in values]
+
+
+def _slab(cells: Sequence, size: Sequence[int], dim: int, category: int) -> list:
+    """Return the cells of a category along `dim`, with slices of `cells`.
+
+    The slab is taken a block of consecutive cells at a time, or, when there
+    are fewer cells in a block than blocks, a strided slice per offset in the
+    block; any `cells` of the cube's length is sliced in the same order.
+    """
+    outer = math.prod(size[:dim])
+    inner = math.prod(size[dim + 1 :])
+    block = size[dim] * inner
+    start = category * inner
+    if inner > outer:
+        slices = (
+            cells[first : first + inner] for first in range(start, outer * block, block)
+        )
+    else:
+        slices = (cells[first::block] for first in range(start, start + inner))
+    return list(chain.from_iterable(slices))
+
+
+def _mismatched_sums_python(
+    values: Sequence,
+    size: Sequence[int],
+    dim: int,
+    children: Mapping[int, Sequence[int]],
+    tolerance: float,
+) -> tuple[array, array, array]:
+    """Return the mismatches found by `mismatched_sums`, without NumPy."""
+    cells = _numbers(values.tolist() if isinstance(values, CompactValues) else values)
+    cube = range(len(cells))
+    positions: list[int] = []
+    totals: list = []
+    sums: list = []
+    for parent, kids in children.items():
+        total = _slab(cells, size, dim, parent)
+        slabs = [_slab(cells, size, dim, kid) for kid in kids]
+        children_sum = list(map(sum, zip(*slabs, strict=True)))
+        # NaN differences compare False: those cells are not checked.
+        differ = list(
+            map(gt, map(abs, map(sub, total, children_sum)), repeat(tolerance))
+        )
+        positions.extend(compress(_slab(cube, size, dim, parent), differ))
+        totals.extend(compress(total, differ))
+        sums.extend(compress(children_sum, differ))
+    order = sorted(range(len(positions)), key=positions.__getitem__)
+    return (
+        array("q", map(positions.__getitem__, order)),
+        array("d", map(totals.__getitem__, order)),
+        array("d", map(sums.__getitem__, order)),
+    )
+
+
+def check_aggregates(
+    dataset: Dataset, dim_id: str, tolerance: float = 0.0
+) -> AggregateMismatches:
+    """Return the parent cells of `dim_id` that differ from their children's sum.
+
+    Raises:
+        KeyError: If the dimension is unknown
+    """
+    cube = dataset._cube_index()
+    cube._check_dimensions([dim_id])
+    dim = cube.id.index(dim_id)
+    category = dataset.dimension[dim_id].category
+    children: dict[int, list[int]] = {}
+    if category is not None and category.child:
+        hierarchy = category.hierarchy
+        position = category.positions
+        for parent in category.child:
+            kids = hierarchy.children(parent)
+            if kids:
+                children[position[parent]] = list(map(position.__getitem__, kids))
+    mismatches = array("q"), array("d"), array("d")
+    if children and cube.n_cells:
+        values = dense_values(dataset.value, cube.n_cells)
+        if optional_numpy() is None:
+            check = _mismatched_sums_python
+        else:
+            check = mismatched_sums
+            if not isinstance(values, CompactValues):
+                values = _numbers(values)
+        mismatches = check(values, cube.size, dim, children, tolerance)
+    positions, totals, sums = mismatches
+    return AggregateMismatches(
+        dataset=dataset, dim_id=dim_id, positions=positions, totals=totals, sums=sums
+    )
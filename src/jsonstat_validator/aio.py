@@ -0,0 +1,233 @@
+"""Asyncio-native validation for web services.
+
+Validating a large cube takes long enough to stall an event loop, so
+`avalidate_jsonstat` offloads the work to a bounded thread or process pool.
+A semaphore caps the number of documents queued or running in the pool, and
+documents below a size threshold are validated inline, where the executor
+round trip would cost more than the validation itself. Paths are never
+validated inline: reading the file would block the loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Literal
+
+from jsonstat_validator.batch import (
+    Document,
+    encode_document,
+    validate_document,
+    warm_up_worker,
+)
+
+# Rough number of bytes a cell or category takes in JSON, used to size dicts.
+_BYTES_PER_CELL = 16
+
+
+def _length(members: object) -> int:
+    return len(members) if isinstance(members, list | dict) else 0
+
+
+def _estimated_cells(data: object) -> int:
+    """Return the number of cells and categories of a decoded document, roughly.
+
+    A dataset counts the cells of its cube (the product of `size`), or its
+    `value` entries if `size` is not a list of ints, plus the categories of its
+    dimensions; a collection counts those of its embedded documents.
+    """
+    if not isinstance(data, dict):
+        return 0
+    cells = _length(data.get("value"))
+    size = data.get("size")
+    if isinstance(size, list) and all(type(n) is int for n in size):
+        cells = max(cells, math.prod(size))
+    dimensions = data.get("dimension")
+    if data.get("class") == "dimension":
+        dimensions = {"": data}
+    if isinstance(dimensions, dict):
+        for dimension in dimensions.values():
+            if isinstance(dimension, dict):
+                category = dimension.get("category")
+                if isinstance(category, dict):
+                    cells += max(
+                        _length(category.get("index")), _length(category.get("label"))
+                    )
+    links = data.get("link")
+    if isinstance(links, dict):
+        for entries in links.values():
+            if isinstance(entries, list):
+                cells += sum(map(_estimated_cells, entries))
+    return cells
+
+
+def _estimated_size(data: Document) -> int:
+    """Return the size of a raw document in bytes, estimated for dicts."""
+    if isinstance(data, bytes | str):
+        return len(data)
+    return _BYTES_PER_CELL * _estimated_cells(data)
+
+
+class AsyncValidator:
+    """Validate documents from coroutines without blocking the event loop.
+
+    Args:
+        executor: Executor to run validations on. Defaults to a pool owned by
+            the validator, created on first use.
+        max_workers: Size of the owned pool (defaults to the CPU count)
+        use_processes: Own a process pool instead of a thread pool. Validation
+            holds the GIL, so only processes validate in parallel; threads
+            just keep the event loop responsive.
+        max_concurrency: Maximum number of documents queued or running in the
+            executor; further calls wait for a slot
+        inline_threshold: Documents smaller than this many bytes (estimated
+            for dicts, from their cells and categories) are validated inline on
+            the event loop; paths never are
+        mode: Validation mode, see `validate_jsonstat`
+    """
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        *,
+        max_workers: int | None = None,
+        use_processes: bool = False,
+        max_concurrency: int = 16,
+        inline_threshold: int = 64 * 1024,
+        mode: Literal["model", "check"] = "model",
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._use_processes = use_processes
+        self._max_concurrency = max_concurrency
+        self.inline_threshold = inline_threshold
+        self.mode = mode
+        # asyncio primitives belong to one event loop.
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    def executor(self) -> Executor:
+        """The executor validations are offloaded to."""
+        if self._executor is None:
+            if self._use_processes:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers, initializer=warm_up_worker
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="jsonstat-validator",
+                )
+        return self._executor
+
+    def _semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(
+                self._max_concurrency
+            )
+        return semaphore
+
+    async def validate(self, data: Document) -> bool:
+        """Validate a dict, raw JSON (bytes or str) or path.
+
+        Cancelling the call cancels the validation if it has not started yet;
+        a validation already running finishes in the background, and its
+        concurrency slot is released only then.
+
+        Returns:
+            bool: True if valid, raises JSONStatValidationError otherwise
+
+        Raises:
+            JSONStatValidationError: If the data does not conform to the
+                                     JSON-stat specification
+        """
+        if not isinstance(data, Path) and _estimated_size(data) < self.inline_threshold:
+            return validate_document(data, self.mode)
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore(loop)
+        await semaphore.acquire()
+        try:
+            executor = self.executor
+            if isinstance(executor, ProcessPoolExecutor):
+                data = encode_document(data)
+            future = executor.submit(validate_document, data, self.mode)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        def release(_: object) -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(semaphore.release)
+
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    def close(self, *, wait: bool = True) -> None:
+        """Shut down the executor if the validator owns it.
+
+        Validations already submitted still run, and their callers get their
+        results; with `wait=False`, the executor drains in the background.
+        """
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    async def __aenter__(self) -> AsyncValidator:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close(wait=False)
+
+
+_default_validator: AsyncValidator | None = None
+
+
+def configure_async_validation(**kwargs: object) -> AsyncValidator:
+    """Replace the validator used by `avalidate_jsonstat`.
+
+    Takes the arguments of `AsyncValidator`. New calls go to the new
+    validator; the previous default one is closed once the validations it was
+    given have run, without cancelling them.
+    """
+    global _default_validator
+    if _default_validator is not None:
+        _default_validator.close(wait=False)
+    _default_validator = AsyncValidator(**kwargs)
+    return _default_validator
+
+
+async def avalidate_jsonstat(
+    data: Document, *, validator: AsyncValidator | None = None
+) -> bool:
+    """Validate a JSON-stat 2.0 document without blocking the event loop.
+
+    Args:
+        data: A dictionary containing JSON-stat data, the raw JSON (bytes or
+            str) or the path of a JSON-stat file
+        validator: Validator to use instead of the default one (see
+            `configure_async_validation`)
+
+    Returns:
+        bool: True if valid, raises JSONStatValidationError otherwise
+
+    Raises:
+        JSONStatValidationError: If the data does not conform to the JSON-stat
+                                 specification
+    """
+    global _default_validator
+    if validator is None:
+        if _default_validator is None:
+            _default_validator = AsyncValidator()
+        validator = _default_validator
+    return await validator.validate(data)
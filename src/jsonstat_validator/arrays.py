@@ -0,0 +1,313 @@
+"""NumPy interop for dataset values.
+
+NumPy is an optional dependency (the `numpy` extra), imported on first use.
+
+`CompactValues` keeps numbers in an `array`, which NumPy reads through the
+buffer protocol: `to_ndarray` returns a read-only view of that memory when
+there are no nulls to fill in. `from_ndarray` copies numeric arrays into a new
+`array` once, finding nulls (NaN, or masked cells) with vectorized operations,
+without building Python lists. `transpose_compact` reorders the dimensions of
+compact values with a single transposed copy, and `mismatched_sums` adds the
+slabs of the children of each parent category in one pass.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Mapping, Sequence
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from jsonstat_validator.cube import strides
+from jsonstat_validator.values import (
+    FLOAT,
+    INT,
+    CompactValues,
+    dense_values,
+    validate_values,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def optional_numpy() -> ModuleType | None:
+    """Return NumPy if it is installed, for code with a pure Python fallback."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def import_numpy() -> ModuleType:
+    """Import NumPy, explaining how to install it if it is missing.
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    numpy = optional_numpy()
+    if numpy is None:
+        raise ImportError(
+            "NumPy is required for array conversions: "
+            "pip install 'jsonstat-validator[numpy]'"
+        )
+    return numpy
+
+
+def _to_array(cells: np.ndarray, typecode: str) -> array:
+    """Copy a C-contiguous array of the `typecode` item type into an `array`."""
+    data = array(typecode)
+    data.frombytes(memoryview(cells).cast("B"))
+    return data
+
+
+def to_ndarray(
+    value: Sequence | Mapping,
+    size: Sequence[int],
+    dtype: Any = None,
+    null: Any = math.nan,
+) -> np.ndarray:
+    """Return dataset values as an array of shape `size`.
+
+    Args:
+        value: A dataset `value`, in either form
+        size: The size of each dimension
+        dtype: The array dtype; by default int64 or float64 for numbers (float64
+            when there are nulls to fill in with NaN), object otherwise
+        null: The fill value of null cells
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    np = import_numpy()
+    value = dense_values(value, math.prod(size))
+    view = None
+    if isinstance(value, CompactValues):
+        cells = view = np.frombuffer(value.data, dtype=value.data.typecode)
+        mask = None
+        if value.nulls is not None:
+            bits = np.frombuffer(value.nulls, dtype=np.uint8)
+            mask = np.unpackbits(bits, count=len(cells), bitorder="little")
+            mask = mask.view(bool)
+    else:
+        types = set(map(type, value))
+        if str in types:
+            cells = np.array(value, dtype=object)
+            mask = np.equal(cells, None)
+        elif type(None) in types or float in types:
+            # NumPy reads None as NaN.
+            cells = np.array(value, dtype=np.float64)
+            mask = np.isnan(cells) if type(None) in types else None
+        else:
+            cells = np.array(value)
+            mask = None
+
+    if mask is not None:
+        if dtype is None and cells.dtype == object:
+            dtype = object
+        elif dtype is None:
+            dtype = np.result_type(cells.dtype, null)
+        # Copy before filling in nulls, unless the array is already ours.
+        cells = cells.astype(dtype, copy=view is not None)
+        cells[mask] = null
+    elif dtype is not None:
+        cells = cells.astype(dtype, copy=False)
+    if view is not None and np.may_share_memory(cells, view):
+        # Writing would change the dataset behind its back.
+        cells.flags.writeable = False
+    return cells.reshape(tuple(size))
+
+
+def from_ndarray(arr: Any) -> CompactValues | list:
+    """Return the cells of an array, in row-major order, as a dataset `value`.
+
+    Integer and float arrays are stored as `CompactValues`, with NaN and masked
+    cells as nulls; other arrays are validated as a list of their items.
+
+    Raises:
+        ImportError: If NumPy is not installed
+        ValidationError: If an item is not a valid value
+    """
+    np = import_numpy()
+    mask = None
+    if isinstance(arr, np.ma.MaskedArray):
+        mask = np.ma.getmaskarray(arr).ravel()
+        arr = arr.filled(0)
+    flat = np.ravel(arr)
+    kind = flat.dtype.kind
+    if kind == "f":
+        nan = np.isnan(flat)
+        mask = nan if mask is None else mask | nan
+        typecode = FLOAT
+    elif kind == "i" or (
+        kind == "u" and (not flat.size or flat.max() <= np.iinfo(np.int64).max)
+    ):
+        typecode = INT
+    else:
+        cells = flat.tolist()
+        if mask is not None:
+            cells = [
+                None if masked else cell
+                for masked, cell in zip(mask, cells, strict=True)
+            ]
+        return validate_values(cells)
+
+    nulls = None
+    if mask is not None and mask.any():
+        # Nulls are stored as 0, as in `CompactValues.from_list`.
+        flat = np.where(mask, 0, flat)
+        nulls = bytearray(np.packbits(mask, bitorder="little"))
+    data = _to_array(np.ascontiguousarray(flat, dtype=typecode), typecode)
+    return CompactValues(data, typecode, nulls)
+
+
+def transpose_compact(
+    values: CompactValues, size: Sequence[int], order: Sequence[int]
+) -> CompactValues:
+    """Return compact values with the dimensions of the cube reordered, with NumPy.
+
+    The numbers and the null bitmap are viewed as arrays of shape `size`,
+    transposed and copied once each.
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    np = import_numpy()
+    shape = tuple(size)
+    typecode = values.data.typecode
+    cells = np.frombuffer(values.data, dtype=typecode).reshape(shape)
+    data = _to_array(np.ascontiguousarray(cells.transpose(order)), typecode)
+    nulls = None
+    if values.nulls is not None:
+        bits = np.frombuffer(values.nulls, dtype=np.uint8)
+        mask = np.unpackbits(bits, count=len(data), bitorder="little").reshape(shape)
+        nulls = bytearray(np.packbits(mask.transpose(order), bitorder="little"))
+    return CompactValues(data, values.kind, nulls)
+
+
+def _cube_view(np: ModuleType, values: CompactValues, size: Sequence[int]) -> tuple:
+    """Return the numbers and null flags of compact values, shaped by `size`."""
+    shape = tuple(size)
+    cells = np.frombuffer(values.data, dtype=values.data.typecode).reshape(shape)
+    if values.nulls is None:
+        return cells, np.zeros(shape, dtype=bool)
+    bits = np.frombuffer(values.nulls, dtype=np.uint8)
+    nulls = np.unpackbits(bits, count=len(values), bitorder="little")
+    return cells, nulls.view(bool).reshape(shape)
+
+
+def changed_compact(
+    old: CompactValues,
+    new: CompactValues,
+    old_size: Sequence[int],
+    new_size: Sequence[int],
+    order: Sequence[int],
+    old_common: Sequence[Sequence[int]],
+    new_common: Sequence[Sequence[int]],
+) -> tuple[array, array]:
+    """Return the positions in each cube of the aligned cells that differ.
+
+    Args:
+        old: The values of the old cube
+        new: The values of the new cube
+        old_size: The size of the old cube
+        new_size: The size of the new cube
+        order: The dimension of the new cube matching each old dimension
+        old_common: For each old dimension, the positions of the categories
+            found in both cubes
+        new_common: For each old dimension, the positions of the same
+            categories in the new cube
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    np = import_numpy()
+    old_cells, old_nulls = _cube_view(np, old, old_size)
+    new_cells, new_nulls = _cube_view(np, new, new_size)
+    old_index = np.ix_(*old_common)
+    new_index = np.ix_(*new_common)
+    old_cells, old_nulls = old_cells[old_index], old_nulls[old_index]
+    new_cells = new_cells.transpose(order)[new_index]
+    new_nulls = new_nulls.transpose(order)[new_index]
+    differ = (old_nulls != new_nulls) | (~old_nulls & (old_cells != new_cells))
+    coords = np.nonzero(differ)
+    new_strides = strides(new_size)
+    aligned = (
+        (old_common, strides(old_size)),
+        (new_common, [new_strides[dim] for dim in order]),
+    )
+    old_positions, new_positions = (
+        _to_array(_positions(np, coords, common, cube_strides), INT)
+        for common, cube_strides in aligned
+    )
+    return old_positions, new_positions
+
+
+def _positions(
+    np: ModuleType,
+    coords: tuple,
+    common: Sequence[Sequence[int]],
+    cube_strides: Sequence[int],
+) -> np.ndarray:
+    """Return the cube positions of cells given by coordinates among `common`."""
+    positions = np.zeros(len(coords[0]), dtype=np.int64)
+    for dim_coords, dim_common, stride in zip(
+        coords, common, cube_strides, strict=True
+    ):
+        positions += np.asarray(dim_common, dtype=np.int64)[dim_coords] * stride
+    return positions
+
+
+def mismatched_sums(
+    values: CompactValues | list,
+    size: Sequence[int],
+    dim: int,
+    children: Mapping[int, Sequence[int]],
+    tolerance: float,
+) -> tuple[array, array, array]:
+    """Return the parent cells along `dim` that differ from their children's sum.
+
+    The values are viewed as a float array of shape (outer, categories, inner);
+    the children of every parent are gathered along the middle axis and summed
+    with a single `add.reduceat`. Nulls are NaN, whose differences compare
+    False, so cells with a null parent or child are not checked.
+
+    Args:
+        values: The dataset values, dense, with NaN (or None) for non-numbers
+        size: The size of each dimension of the cube
+        dim: The dimension of the hierarchy
+        children: The positions of the children of each parent, by position
+        tolerance: The largest absolute difference allowed
+
+    Returns:
+        The positions of the mismatched parent cells in row-major order, their
+        values and the sums of their children
+
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    np = import_numpy()
+    outer = math.prod(size[:dim])
+    inner = math.prod(size[dim + 1 :])
+    cells = to_ndarray(values, [len(values)], dtype=np.float64)
+    cells = cells.reshape(outer, size[dim], inner)
+    parents = sorted(children)
+    kids = [kid for parent in parents for kid in children[parent]]
+    starts = np.cumsum([0] + [len(children[parent]) for parent in parents[:-1]])
+    sums = np.add.reduceat(cells[:, kids, :], starts, axis=1)
+    totals = cells[:, parents, :]
+    with np.errstate(invalid="ignore"):
+        differ = np.abs(totals - sums) > tolerance
+    block, parent_index, offset = np.nonzero(differ)
+    positions = (
+        block * (size[dim] * inner)
+        + np.asarray(parents, dtype=np.int64)[parent_index] * inner
+        + offset
+    )
+    return (
+        _to_array(positions.astype(np.int64), INT),
+        _to_array(np.ascontiguousarray(totals[differ]), FLOAT),
+        _to_array(np.ascontiguousarray(sums[differ]), FLOAT),
+    )
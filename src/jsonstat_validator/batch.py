@@ -0,0 +1,162 @@
+"""Batch validation of many JSON-stat documents across worker processes."""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+from typing import Literal
+
+from jsonstat_validator.utils import JSONStatValidationError, validation_error
+from jsonstat_validator.validator import validate_jsonstat, validate_jsonstat_json
+
+Document = dict | bytes | str | Path
+Result = tuple[Hashable, bool, str | None]
+
+# Chunks submitted ahead of the results being consumed, per worker.
+_PREFETCH = 2
+
+_WARM_UP_DOCUMENT = (
+    b'{"class": "dataset", "id": ["d"], "size": [1], "value": [1], '
+    b'"dimension": {"d": {"category": {"index": ["c"]}}}}'
+)
+
+
+def warm_up_worker() -> None:
+    """Import the models and build their validators once per worker."""
+    validate_jsonstat_json(_WARM_UP_DOCUMENT)
+
+
+def encode_document(doc: Document) -> bytes | Path:
+    """Encode a document as raw bytes so it crosses processes cheaply.
+
+    Paths are sent as-is and read by the worker.
+    """
+    if isinstance(doc, Path):
+        return doc
+    if isinstance(doc, str):
+        return doc.encode("utf-8")
+    if isinstance(doc, bytes):
+        return doc
+    return json.dumps(doc).encode("utf-8")
+
+
+def validate_document(doc: Document, mode: str = "model") -> bool:
+    """Validate a document given as a dict, raw JSON (bytes or str) or a path.
+
+    Raises:
+        JSONStatValidationError: If the document is not valid JSON-stat
+    """
+    if isinstance(doc, dict):
+        return validate_jsonstat(doc, mode=mode)
+    if mode != "check":
+        return validate_jsonstat_json(doc)
+    if isinstance(doc, Path):
+        doc = doc.read_bytes()
+    try:
+        data = json.loads(doc)
+    except ValueError as e:
+        raise validation_error("", f"Invalid JSON: {e}", "json_invalid") from e
+    return validate_jsonstat(data, mode="check")
+
+
+def _validate_one(payload: bytes | Path, mode: str) -> tuple[bool, str | None]:
+    try:
+        validate_document(payload, mode)
+    except JSONStatValidationError as e:
+        return False, e.message
+    except OSError as e:
+        return False, str(e)
+    return True, None
+
+
+def _validate_chunk(
+    payloads: list[bytes | Path], mode: str
+) -> list[tuple[bool, str | None]]:
+    return [_validate_one(payload, mode) for payload in payloads]
+
+
+def _chunks(
+    docs: Iterable[Document] | Mapping[Hashable, Document], chunksize: int
+) -> Iterator[tuple[list[Hashable], list[bytes | Path]]]:
+    """Split the input into chunks of keys and payloads."""
+    if isinstance(docs, Mapping):
+        items = iter(docs.items())
+    else:
+        items = (
+            (doc if isinstance(doc, Path) else i, doc) for i, doc in enumerate(docs)
+        )
+    while chunk := list(islice(items, chunksize)):
+        keys = [key for key, _ in chunk]
+        yield keys, [encode_document(doc) for _, doc in chunk]
+
+
+def validate_many(
+    docs: Iterable[Document] | Mapping[Hashable, Document],
+    workers: int | None = None,
+    chunksize: int = 1,
+    *,
+    ordered: bool = True,
+    mode: Literal["model", "check"] = "model",
+) -> Iterator[Result]:
+    """Validate many JSON-stat documents in parallel.
+
+    Documents are sent to the workers as raw bytes (paths are read by the
+    workers themselves) and validated with `validate_jsonstat_json`, or with
+    the check-only engine when `mode="check"`. Every worker builds the
+    validators once at start-up. Input is consumed lazily, with a bounded
+    number of chunks in flight.
+
+    Args:
+        docs: Documents as dicts, raw JSON (bytes or str) or file paths, or a
+            mapping of keys to documents
+        workers: Number of worker processes (defaults to the CPU count);
+            with 1 worker the documents are validated in this process
+        chunksize: Number of documents sent to a worker at a time
+        ordered: Yield results in input order; otherwise in completion order
+        mode: Validation mode, see `validate_jsonstat`
+
+    Yields:
+        tuple: `(key, ok, errors)` where `key` is the mapping key, the path of
+        a file or the position of the document in `docs`, and `errors` is the
+        validation error message, or None if the document is valid
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(docs, chunksize)
+
+    if workers == 1:
+        for keys, payloads in chunks:
+            for key, result in zip(keys, _validate_chunk(payloads, mode), strict=True):
+                yield (key, *result)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=warm_up_worker)
+    pending: deque[tuple[list[Hashable], Future]] = deque()
+
+    def submit(limit: int) -> None:
+        for keys, payloads in islice(chunks, limit):
+            pending.append((keys, executor.submit(_validate_chunk, payloads, mode)))
+
+    try:
+        submit(workers * _PREFETCH)
+        while pending:
+            if ordered:
+                keys, future = pending.popleft()
+            else:
+                done, _ = wait([f for _, f in pending], return_when=FIRST_COMPLETED)
+                index = next(i for i, (_, f) in enumerate(pending) if f in done)
+                keys, future = pending[index]
+                del pending[index]
+            results = future.result()
+            submit(1)
+            for key, result in zip(keys, results, strict=True):
+                yield (key, *result)
+    finally:
+        # Stopping early must not wait for the chunks still queued.
+        executor.shutdown(cancel_futures=True)
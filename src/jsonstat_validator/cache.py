@@ -0,0 +1,97 @@
+"""Cache of validated dataset dimensions.
+
+The same dimension definitions (time periods, geographic codelists...) repeat
+across many datasets. A `DimensionCache` passed to the validator maps a hash of
+each raw dimension dict to the `DatasetDimension` already validated for it, so
+repeated definitions are validated once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from jsonstat_validator.models.dimension import DatasetDimension
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `DimensionCache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class DimensionCache:
+    """Size-bounded LRU cache of validated `DatasetDimension` instances.
+
+    Cached instances are shared by every dataset that uses the same definition,
+    so they must be treated as read-only.
+
+    Args:
+        maxsize: Maximum number of dimensions kept; the least recently used
+            entry is evicted first
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, DatasetDimension] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(raw: dict) -> bytes | None:
+        """Return the canonical hash of a raw dimension dict.
+
+        The dict is serialized with marshal format 2, which (unlike later
+        formats) writes no back-references, so equal JSON data always gives the
+        same bytes. Key order is kept, as the order of `index` and `label` is
+        meaningful. Returns None for data marshal cannot serialize.
+        """
+        try:
+            encoded = marshal.dumps(raw, 2)
+        except ValueError:
+            return None
+        return hashlib.blake2b(encoded, digest_size=16).digest()
+
+    def get(self, key: bytes) -> DatasetDimension | None:
+        """Return the dimension cached under `key`, counting hits and misses."""
+        with self._lock:
+            dimension = self._entries.get(key)
+            if dimension is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return dimension
+
+    def put(self, key: bytes, dimension: DatasetDimension) -> None:
+        """Cache a validated dimension, evicting the least recently used one."""
+        with self._lock:
+            self._entries[key] = dimension
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
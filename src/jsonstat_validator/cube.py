@@ -0,0 +1,215 @@
+"""Addressing the cells of a dataset cube.
+
+JSON-stat stores a cube in row-major order: the position of a cell is the sum,
+over the dimensions in `id`, of the position of its category times the stride
+of the dimension (the product of the sizes of the dimensions after it).
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping, Sequence
+from itertools import chain, repeat
+from operator import add, floordiv, methodcaller, mod, mul
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from jsonstat_validator.models.dimension import DatasetDimension
+
+
+def strides(size: Sequence[int]) -> tuple[int, ...]:
+    """Return the row-major stride of each dimension of a cube of `size`."""
+    result = [1] * len(size)
+    for i in range(len(size) - 2, -1, -1):
+        result[i] = result[i + 1] * size[i + 1]
+    return tuple(result)
+
+
+def cell_positions(
+    strides: Sequence[int], positions: Sequence[Sequence[int]]
+) -> list[int]:
+    """Return the cube positions of the cells of a sub-cube, in row-major order.
+
+    Args:
+        strides: The stride of each dimension of the cube
+        positions: For each dimension, the positions of the categories kept
+    """
+    result = [0]
+    for stride, dim_positions in zip(strides, positions, strict=True):
+        scaled = [position * stride for position in dim_positions]
+        result = list(
+            map(
+                add,
+                chain.from_iterable(map(repeat, result, repeat(len(scaled)))),
+                chain.from_iterable(repeat(scaled, len(result))),
+            )
+        )
+    return result
+
+
+def transposed_positions(size: Sequence[int], order: Sequence[int]) -> list[int]:
+    """Return, for each cell of the transposed cube, its position in the cube.
+
+    Args:
+        size: The size of each dimension of the cube
+        order: The dimensions (by index) of the transposed cube
+    """
+    old_strides = strides(size)
+    return cell_positions(
+        [old_strides[dim] for dim in order], [range(size[dim]) for dim in order]
+    )
+
+
+def moved_positions(
+    positions: Iterable[int], size: Sequence[int], order: Sequence[int]
+) -> list[int]:
+    """Return the positions of some cells in the transposed cube.
+
+    Each category position is extracted with `(position // stride) % size` and
+    scaled by the new stride, a dimension at a time.
+    """
+    positions = list(positions)
+    old_strides = strides(size)
+    new_strides = strides([size[dim] for dim in order])
+    result = [0] * len(positions)
+    for dim, new_stride in zip(order, new_strides, strict=True):
+        categories = map(
+            mod,
+            map(floordiv, positions, repeat(old_strides[dim])),
+            repeat(size[dim]),
+        )
+        result = list(map(add, result, map(mul, categories, repeat(new_stride))))
+    return result
+
+
+def unravel(position: int, strides: Sequence[int]) -> list[int]:
+    """Return the category position in each dimension of the cell at `position`."""
+    result = []
+    for stride in strides:
+        category, position = divmod(position, stride)
+        result.append(category)
+    return result
+
+
+class CubeIndex:
+    """Cell count, strides and category positions of a dataset, computed once.
+
+    Args:
+        id: The dataset `id`
+        size: The dataset `size`
+        dimension: The dataset `dimension`
+    """
+
+    __slots__ = ("dimension", "id", "n_cells", "positions", "size", "strides")
+
+    def __init__(
+        self,
+        id: Sequence[str],
+        size: Sequence[int],
+        dimension: Mapping[str, DatasetDimension],
+    ) -> None:
+        self.id = tuple(id)
+        self.size = tuple(size)
+        self.dimension = dimension
+        self.n_cells = math.prod(size)
+        self.strides = strides(size)
+        self.positions = [
+            category.positions if (category := dimension[dim_id].category) else {}
+            for dim_id in id
+        ]
+
+    def _check_dimensions(self, dim_ids: Iterable[str]) -> None:
+        unknown = set(dim_ids).difference(self.id)
+        if unknown:
+            raise KeyError(f"Unknown dimension(s): {', '.join(sorted(unknown))}")
+
+    def _default(self, dim: int) -> str | None:
+        """Return the category a lookup may omit for dimension `dim`, if any."""
+        if self.size[dim] == 1 and len(self.positions[dim]) == 1:
+            return next(iter(self.positions[dim]))
+        return None
+
+    def _unknown(self, dim: int, category_id: str | None) -> KeyError:
+        dim_id = self.id[dim]
+        if category_id is None:
+            return KeyError(f"Missing category for dimension '{dim_id}'")
+        return KeyError(f"Unknown category '{category_id}' in dimension '{dim_id}'")
+
+    def position(self, coords: Mapping[str, str]) -> int:
+        """Return the position of the cell at `coords` (dimension → category ID).
+
+        Dimensions with a single category may be omitted.
+
+        Raises:
+            KeyError: If a dimension or category is unknown, or a dimension is
+                missing
+        """
+        self._check_dimensions(coords)
+        position = 0
+        for dim, (dim_id, stride, positions) in enumerate(
+            zip(self.id, self.strides, self.positions, strict=True)
+        ):
+            category_id = coords.get(dim_id, self._default(dim))
+            try:
+                position += stride * positions[category_id]
+            except KeyError:
+                raise self._unknown(dim, category_id) from None
+        return position
+
+    def order(self, new_id: Sequence[str]) -> list[int]:
+        """Return the index of each dimension of `new_id`, a reordering of `id`.
+
+        Raises:
+            ValueError: If `new_id` is not a reordering of `id`
+        """
+        if len(new_id) != len(self.id) or set(new_id) != set(self.id):
+            raise ValueError(
+                f"Dimension order must list each of {', '.join(self.id)} once, "
+                f"got: {', '.join(new_id)}"
+            )
+        return list(map(self.id.index, new_id))
+
+    def select(self, selection: Mapping[str, Sequence[str]]) -> list[list[int]]:
+        """Return, for each dimension, the positions of the selected categories.
+
+        Dimensions missing from `selection` keep all their categories.
+
+        Raises:
+            KeyError: If a dimension or category is unknown
+            ValueError: If a category is selected twice
+        """
+        self._check_dimensions(selection)
+        result = []
+        for dim, (dim_id, positions) in enumerate(
+            zip(self.id, self.positions, strict=True)
+        ):
+            if dim_id not in selection:
+                result.append(list(range(self.size[dim])))
+                continue
+            category_ids = selection[dim_id]
+            try:
+                result.append(list(map(positions.__getitem__, category_ids)))
+            except KeyError as e:
+                raise self._unknown(dim, e.args[0]) from None
+            if len(set(category_ids)) != len(category_ids):
+                raise ValueError(f"Duplicate category in selection of '{dim_id}'")
+        return result
+
+    def positions_of(self, coords: Sequence[Mapping[str, str]]) -> list[int]:
+        """Return the positions of many cells, computed a dimension at a time.
+
+        Raises:
+            KeyError: As `position`
+        """
+        self._check_dimensions(set().union(*coords))
+        result = [0] * len(coords)
+        for dim, (dim_id, stride, positions) in enumerate(
+            zip(self.id, self.strides, self.positions, strict=True)
+        ):
+            category_ids = map(methodcaller("get", dim_id, self._default(dim)), coords)
+            try:
+                column = list(map(positions.__getitem__, category_ids))
+            except KeyError as e:
+                raise self._unknown(dim, e.args[0]) from None
+            result = list(map(add, result, map(mul, column, repeat(stride))))
+        return result
@@ -0,0 +1,322 @@
+"""Cell-level differences between two versions of a dataset.
+
+The cubes are aligned through their category position maps, so the versions
+may order categories and dimensions differently: the cells of the categories
+found in both are located in each cube with `cell_positions`, and their values
+and statuses are compared in bulk. Cells of categories found in one version
+only are added or removed.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from itertools import compress, repeat
+from operator import is_not, ne
+from typing import TYPE_CHECKING
+
+from jsonstat_validator.arrays import changed_compact, optional_numpy
+from jsonstat_validator.cube import CubeIndex, cell_positions, unravel
+from jsonstat_validator.utils import JSONStatValidationError
+from jsonstat_validator.values import CompactValues, dense_values
+
+if TYPE_CHECKING:
+    from jsonstat_validator.models.dataset import Dataset
+
+# Marks a status given cell by cell.
+_PER_CELL = object()
+
+# Translates 0/1 flags into 1/0 flags.
+_INVERT = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+
+
+@dataclass(frozen=True)
+class DatasetDiff:
+    """Cell-level differences from an old to a new version of a dataset.
+
+    Positions are cell positions in the `old` or the `new` cube; the arrays of
+    a pair list the same cells, in the same order.
+
+    Attributes:
+        old: The old version
+        new: The new version
+        changed_old: Positions in `old` of the cells whose value changed
+        changed_new: Positions in `new` of the cells whose value changed
+        added: Positions in `new` of the non-null cells of new categories
+        removed: Positions in `old` of the non-null cells of dropped categories
+        status_old: Positions in `old` of the cells whose status changed
+        status_new: Positions in `new` of the cells whose status changed
+    """
+
+    old: Dataset
+    new: Dataset
+    changed_old: array
+    changed_new: array
+    added: array
+    removed: array
+    status_old: array
+    status_new: array
+
+    def __repr__(self) -> str:
+        return (
+            f"DatasetDiff(changed={len(self.changed_old)}, added={len(self.added)}, "
+            f"removed={len(self.removed)}, status={len(self.status_old)})"
+        )
+
+    def __bool__(self) -> bool:
+        """Return whether the versions differ at all."""
+        return bool(self.changed_old or self.added or self.removed or self.status_old)
+
+    def iter_rows(self, labels: bool = False) -> Iterator[tuple]:
+        """Yield a tuple per difference: the change, categories, old and new.
+
+        The change is "changed", "added", "removed" or "status"; categories
+        follow the dimension order of `old`; old and new are the values (the
+        statuses for "status"), None for the missing side of added and removed
+        cells.
+
+        Args:
+            labels: Yield category labels instead of IDs, where defined
+        """
+        old, new = self.old, self.new
+        old_values = _values(old)
+        new_values = _values(new)
+        yield from self._rows(
+            "changed",
+            self.changed_old,
+            map(old_values.__getitem__, self.changed_old),
+            map(new_values.__getitem__, self.changed_new),
+            old,
+            labels,
+        )
+        yield from self._rows(
+            "added",
+            self.added,
+            repeat(None),
+            map(new_values.__getitem__, self.added),
+            new,
+            labels,
+        )
+        yield from self._rows(
+            "removed",
+            self.removed,
+            map(old_values.__getitem__, self.removed),
+            repeat(None),
+            old,
+            labels,
+        )
+        yield from self._rows(
+            "status",
+            self.status_old,
+            _status_at(old.status, self.status_old),
+            _status_at(new.status, self.status_new),
+            old,
+            labels,
+        )
+
+    def _rows(
+        self,
+        change: str,
+        positions: array,
+        old_cells: Iterator,
+        new_cells: Iterator,
+        cube: Dataset,
+        labels: bool,
+    ) -> Iterator[tuple]:
+        """Yield the rows of `positions` in `cube`, in the dimension order of `old`."""
+        strides = cube.strides
+        categories = [cube._row_categories(dim_id, labels) for dim_id in cube.id]
+        order = list(map(cube.id.index, self.old.id))
+        for position, old_cell, new_cell in zip(
+            positions, old_cells, new_cells, strict=False
+        ):
+            coords = unravel(position, strides)
+            row = [categories[dim][coords[dim]] for dim in order]
+            yield (change, *row, old_cell, new_cell)
+
+
+def _values(dataset: Dataset) -> list:
+    """Return the values of a dataset as a list with a cell per position."""
+    values = dense_values(dataset.value, dataset.n_cells)
+    if isinstance(values, CompactValues):
+        return values.tolist()
+    return values
+
+
+def _status_at(status: object, positions: Sequence[int]) -> Iterator:
+    """Iterate over the status of the cells at `positions` (None for none)."""
+    if isinstance(status, list) and len(status) == 1:
+        status = status[0]
+    if status is None or isinstance(status, str):
+        return repeat(status, len(positions))
+    if isinstance(status, Mapping):
+        return map(status.get, map(str, positions))
+    return map(status.__getitem__, positions)
+
+
+def _uniform_status(status: object) -> object:
+    """Return the status shared by every cell (a string or None), or `_PER_CELL`."""
+    if isinstance(status, list) and len(status) == 1:
+        return status[0]
+    if status is None or isinstance(status, str):
+        return status
+    return _PER_CELL
+
+
+def _positions(
+    dim_id: str, old_cube: CubeIndex, old_dim: int, new_cube: CubeIndex, new_dim: int
+) -> tuple[Mapping, Mapping]:
+    """Return the category positions of a dimension in both versions.
+
+    A dimension without categories (only an `href`) in either version is
+    compared position by position.
+
+    Raises:
+        JSONStatValidationError: If such a dimension differs in size
+    """
+    old_positions = old_cube.positions[old_dim]
+    new_positions = new_cube.positions[new_dim]
+    if old_positions and new_positions:
+        return old_positions, new_positions
+    size = old_cube.size[old_dim]
+    if size != new_cube.size[new_dim]:
+        raise JSONStatValidationError(
+            f"Dimension '{dim_id}' has no categories, only an `href`, and its "
+            f"size differs between the versions: {size} != {new_cube.size[new_dim]}"
+        )
+    positions = dict(zip(range(size), range(size), strict=True))
+    return positions, positions
+
+
+def _cells(
+    cube: CubeIndex, common: list[list[int]], strides: Sequence[int]
+) -> Sequence[int]:
+    """Return the positions of the common cells, in a cube with `strides`.
+
+    A range stands for every cell in order, the common case of versions with
+    the same categories and dimension order.
+    """
+    whole = all(
+        positions == list(range(size))
+        for positions, size in zip(common, cube.size, strict=True)
+    )
+    if whole and tuple(strides) == cube.strides:
+        return range(cube.n_cells)
+    return cell_positions(strides, common)
+
+
+def _gather(values: list, positions: Sequence[int]) -> Iterator:
+    """Iterate over the cells of `values` at `positions`."""
+    if isinstance(positions, range) and len(positions) == len(values):
+        return iter(values)
+    return map(values.__getitem__, positions)
+
+
+def _others(n_cells: int, positions: Sequence[int]) -> Iterator[int]:
+    """Yield the positions below `n_cells` that are not in `positions`."""
+    flags = bytearray(n_cells)
+    for position in positions:
+        flags[position] = 1
+    return compress(range(n_cells), flags.translate(_INVERT))
+
+
+def diff_datasets(old: Dataset, new: Dataset) -> DatasetDiff:
+    """Return the cell-level differences from `old` to `new`.
+
+    Raises:
+        ValueError: If the versions do not have the same dimensions
+        JSONStatValidationError: If a dimension without categories differs in
+            size between the versions
+    """
+    if set(old.id) != set(new.id) or len(old.id) != len(new.id):
+        raise ValueError(
+            "Datasets must have the same dimensions: "
+            f"{', '.join(old.id)} != {', '.join(new.id)}"
+        )
+    old_cube = old._cube_index()
+    new_cube = new._cube_index()
+    old_common: list[list[int]] = []
+    new_common: list[list[int]] = []
+    new_strides = []
+    for dim, dim_id in enumerate(old.id):
+        new_dim = new.id.index(dim_id)
+        old_positions, new_positions = _positions(
+            dim_id, old_cube, dim, new_cube, new_dim
+        )
+        common = [key for key in old_positions if key in new_positions]
+        common.sort(key=old_positions.__getitem__)
+        old_common.append(list(map(old_positions.__getitem__, common)))
+        new_common.append(list(map(new_positions.__getitem__, common)))
+        new_strides.append(new_cube.strides[new_dim])
+    n_common = math.prod(map(len, old_common))
+    compact = (
+        isinstance(old.value, CompactValues)
+        and isinstance(new.value, CompactValues)
+        and bool(old.id)
+        and optional_numpy() is not None
+    )
+    same_status = _uniform_status(old.status)
+    if same_status is _PER_CELL or same_status != _uniform_status(new.status):
+        same_status = _PER_CELL
+    old_cells = new_cells = range(0)
+    partial = n_common < new_cube.n_cells or n_common < old_cube.n_cells
+    if not compact or same_status is _PER_CELL or partial:
+        # The cells of the common categories, in the same order in both cubes.
+        old_cells = _cells(old_cube, old_common, old_cube.strides)
+        new_cells = _cells(new_cube, new_common, new_strides)
+
+    if compact:
+        changed_old, changed_new = changed_compact(
+            old.value,
+            new.value,
+            old_cube.size,
+            new_cube.size,
+            list(map(new.id.index, old.id)),
+            old_common,
+            new_common,
+        )
+    else:
+        old_values, new_values = _values(old), _values(new)
+        changed = list(
+            map(ne, _gather(old_values, old_cells), _gather(new_values, new_cells))
+        )
+        changed_old = array("q", compress(old_cells, changed))
+        changed_new = array("q", compress(new_cells, changed))
+    status_old = status_new = array("q")
+    if same_status is _PER_CELL:
+        status_changed = list(
+            map(
+                ne,
+                _status_at(old.status, old_cells),
+                _status_at(new.status, new_cells),
+            )
+        )
+        status_old = array("q", compress(old_cells, status_changed))
+        status_new = array("q", compress(new_cells, status_changed))
+
+    added = removed = ()
+    if n_common < new_cube.n_cells:
+        others = _others(new_cube.n_cells, new_cells)
+        added = _non_null(_values(new), others)
+    if n_common < old_cube.n_cells:
+        others = _others(old_cube.n_cells, old_cells)
+        removed = _non_null(_values(old), others)
+    return DatasetDiff(
+        old=old,
+        new=new,
+        changed_old=changed_old,
+        changed_new=changed_new,
+        added=array("q", added),
+        removed=array("q", removed),
+        status_old=status_old,
+        status_new=status_new,
+    )
+
+
+def _non_null(values: Sequence, positions: Iterator[int]) -> list[int]:
+    """Return the positions of the non-null cells among `positions`."""
+    positions = list(positions)
+    cells = map(values.__getitem__, positions)
+    return list(compress(positions, map(is_not, cells, repeat(None))))
@@ -0,0 +1,95 @@
+"""Export of datasets to CSV and other delimited text formats.
+
+Rows are produced lazily by `Dataset.iter_rows` and written in batches of
+`chunk_rows` with the `csv` module, so the memory used on top of the dataset is
+bounded by the batch size, however large the cube is.
+"""
+
+from __future__ import annotations
+
+import csv
+from itertools import islice
+from pathlib import Path
+from typing import IO
+
+from jsonstat_validator.models.dataset import Dataset
+from jsonstat_validator.utils import JSONStatValidationError
+from jsonstat_validator.validator import parse_jsonstat_json
+
+CHUNK_ROWS = 10_000
+
+
+def load_dataset(path: str | Path) -> Dataset:
+    """Validate a JSON-stat dataset file, storing numeric values compactly.
+
+    Raises:
+        JSONStatValidationError: If the file is not a valid JSON-stat dataset
+    """
+    document = parse_jsonstat_json(Path(path), context={"compact_values": True})
+    if not isinstance(document.root, Dataset):
+        raise JSONStatValidationError(
+            f"Expected a dataset, got a {document.root.class_}: {path}"
+        )
+    return document.root
+
+
+def to_csv(
+    dataset: Dataset | str | Path,
+    out: IO[str] | str | Path,
+    *,
+    chunk_rows: int = CHUNK_ROWS,
+    labels: bool = False,
+    include_status: bool = True,
+    skip_null: bool = False,
+    delimiter: str = ",",
+) -> int:
+    """Write a dataset as CSV, with a header and a row per cell.
+
+    The columns are the dimensions, in `id` order, then `value` and `status`.
+    Nulls are written as empty fields.
+
+    Args:
+        dataset: A validated dataset, or the path of a JSON-stat dataset file
+            (validated, see `load_dataset`)
+        out: A text file object (opened with `newline=""`) or a path
+        chunk_rows: Number of rows written at a time
+        labels: Write category labels instead of IDs
+        include_status: Write the `status` column
+        skip_null: Leave out null cells
+        delimiter: Field delimiter, e.g. "\\t" for TSV
+
+    Returns:
+        int: The number of rows written, not counting the header
+
+    Raises:
+        JSONStatValidationError: If `dataset` is a path to an invalid file
+    """
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be at least 1")
+    if isinstance(dataset, str | Path):
+        dataset = load_dataset(dataset)
+    if isinstance(out, str | Path):
+        with Path(out).open("w", newline="", encoding="utf-8") as f:
+            return to_csv(
+                dataset,
+                f,
+                chunk_rows=chunk_rows,
+                labels=labels,
+                include_status=include_status,
+                skip_null=skip_null,
+                delimiter=delimiter,
+            )
+
+    writer = csv.writer(out, delimiter=delimiter)
+    header = [*dataset.id, "value"]
+    if include_status:
+        header.append("status")
+    writer.writerow(header)
+    rows = dataset.iter_rows(
+        labels=labels, include_status=include_status, skip_null=skip_null
+    )
+    count = 0
+    while chunk := list(islice(rows, chunk_rows)):
+        writer.writerows(chunk)
+        count += len(chunk)
+    return count
@@ -0,0 +1,250 @@
+"""Ancestor and descendant queries over the `child` hierarchy of a category.
+
+A depth-first tour from the roots numbers the categories in pre-order, each
+the first time it is reached, and records where the tour leaves it: the
+categories reached below a category fill the interval of the tour between the
+two, so "is X below Y" is a pair of comparisons (Euler-tour intervals).
+
+JSON-stat hierarchies need not be trees: a country may belong to two country
+groups. A category with several parents, or below one, is reached through
+more than one path, so the tour alone cannot tell all its ancestors; these
+categories keep their set of ancestors instead, built once from their parents.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from itertools import chain, compress, repeat
+from operator import eq, not_
+
+
+class Hierarchy:
+    """Roots, leaves, depths, ancestors and descendants of categories, computed once.
+
+    Args:
+        ids: The category IDs in position order
+        positions: The position of each category ID
+        child: The category `child` (parent → children); it must not have a
+            cycle, as checked by validation
+
+    Raises:
+        ValueError: If `child` has a cycle
+    """
+
+    __slots__ = (
+        "_ancestors",
+        "_children",
+        "_depths",
+        "_end",
+        "_ids",
+        "_parent",
+        "_parents",
+        "_positions",
+        "_start",
+        "_tour",
+        "leaves",
+        "roots",
+    )
+
+    def __init__(
+        self,
+        ids: Sequence[str],
+        positions: Mapping[str, int],
+        child: Mapping[str, Sequence[str]] | None,
+    ) -> None:
+        n = len(ids)
+        self._ids = tuple(ids)
+        self._positions = positions
+        children: dict[int, list[int]] = {}
+        for parent, kids in (child or {}).items():
+            if kids:
+                children[positions[parent]] = list(
+                    dict.fromkeys(map(positions.__getitem__, kids))
+                )
+        # The parent of each category (-1 for none), and all the parents of
+        # the categories with several.
+        parent_of = [-1] * n
+        for parent, kids in children.items():
+            for kid in kids:
+                parent_of[kid] = parent
+        counts = Counter(chain.from_iterable(children.values()))
+        shared = {category for category, count in counts.items() if count > 1}
+        parents: dict[int, list[int]] = {category: [] for category in sorted(shared)}
+        if shared:
+            for parent, kids in sorted(children.items()):
+                for category in shared.intersection(kids):
+                    parents[category].append(parent)
+        self._children = children
+        self._parent = parent_of
+        self._parents = parents
+        self.roots = tuple(compress(self._ids, map(eq, parent_of, repeat(-1))))
+        self.leaves = tuple(
+            compress(self._ids, map(not_, map(children.__contains__, range(n))))
+        )
+
+        # Depth-first tour from the roots, each category toured once; `~c`
+        # marks where the tour leaves parent `c`. In a tree, the depth of a
+        # category is the number of parents the tour is inside of.
+        start = [-1] * n
+        end = [0] * n
+        depths = [0] * n
+        tour: list[int] = []
+        stack = [root for root in range(n - 1, -1, -1) if parent_of[root] < 0]
+        level = 0
+        while stack:
+            category = stack.pop()
+            if category < 0:
+                end[~category] = len(tour)
+                level -= 1
+            elif start[category] < 0:
+                start[category] = len(tour)
+                depths[category] = level
+                tour.append(category)
+                kids = children.get(category)
+                if kids:
+                    stack.append(~category)
+                    stack.extend(reversed(kids))
+                    level += 1
+                else:
+                    end[category] = len(tour)
+        if len(tour) < n:
+            raise ValueError("The `child` hierarchy has a cycle")
+        self._start = start
+        self._end = end
+        self._tour = tour
+
+        ancestors: dict[int, frozenset[int]] = {}
+        if shared:
+            # Parents first, the longest chain of parents deciding the depth,
+            # so that every category is deeper than each of its parents; the
+            # categories reached through several paths keep their ancestors.
+            for category in _top_down(parent_of, parents, children):
+                category_parents = self._parents_of(category)
+                if not category_parents:
+                    continue
+                depths[category] = 1 + max(map(depths.__getitem__, category_parents))
+                if len(category_parents) > 1 or not ancestors.keys().isdisjoint(
+                    category_parents
+                ):
+                    found = set(category_parents)
+                    for parent in category_parents:
+                        found.update(self._ancestor_positions(parent, ancestors))
+                    ancestors[category] = frozenset(found)
+        self._depths = depths
+        self._ancestors = ancestors
+
+    def _parents_of(self, category: int) -> list[int]:
+        """Return the positions of the parents of a category."""
+        if category in self._parents:
+            return self._parents[category]
+        parent = self._parent[category]
+        return [parent] if parent >= 0 else []
+
+    def _ancestor_positions(
+        self, category: int, ancestors: Mapping[int, frozenset[int]]
+    ) -> frozenset[int] | list[int]:
+        """Return the positions of the ancestors of a category."""
+        if category in ancestors:
+            return ancestors[category]
+        # A single chain of parents up to a root.
+        found = []
+        parent_of = self._parent
+        while parent_of[category] >= 0:
+            category = parent_of[category]
+            found.append(category)
+        return found
+
+    def _position(self, category_id: str) -> int:
+        try:
+            return self._positions[category_id]
+        except KeyError:
+            raise KeyError(f"Unknown category '{category_id}'") from None
+
+    def _ids_of(self, positions: Iterable[int]) -> tuple[str, ...]:
+        """Return the IDs of category positions, in position order."""
+        return tuple(map(self._ids.__getitem__, sorted(positions)))
+
+    def parents(self, category_id: str) -> tuple[str, ...]:
+        """Return the parents of a category, in position order.
+
+        Raises:
+            KeyError: If the category is unknown
+        """
+        return self._ids_of(self._parents_of(self._position(category_id)))
+
+    def children(self, category_id: str) -> tuple[str, ...]:
+        """Return the children of a category, in position order.
+
+        Raises:
+            KeyError: If the category is unknown
+        """
+        return self._ids_of(self._children.get(self._position(category_id), ()))
+
+    def depth(self, category_id: str) -> int:
+        """Return the number of levels above a category (0 for a root).
+
+        Below several parents, the longest chain of parents counts, so every
+        category is deeper than each of its parents.
+
+        Raises:
+            KeyError: If the category is unknown
+        """
+        return self._depths[self._position(category_id)]
+
+    def ancestors(self, category_id: str) -> tuple[str, ...]:
+        """Return every category above a category, in position order.
+
+        Raises:
+            KeyError: If the category is unknown
+        """
+        category = self._position(category_id)
+        return self._ids_of(self._ancestor_positions(category, self._ancestors))
+
+    def descendants(self, category_id: str) -> tuple[str, ...]:
+        """Return every category below a category, in position order.
+
+        Raises:
+            KeyError: If the category is unknown
+        """
+        category = self._position(category_id)
+        found = set(self._tour[self._start[category] + 1 : self._end[category]])
+        # Categories with several parents may be toured below another one.
+        found.update(
+            other for other, above in self._ancestors.items() if category in above
+        )
+        return self._ids_of(found)
+
+    def is_descendant(self, category_id: str, ancestor_id: str) -> bool:
+        """Return whether a category is below another one.
+
+        Raises:
+            KeyError: If either category is unknown
+        """
+        category = self._position(category_id)
+        ancestor = self._position(ancestor_id)
+        above = self._ancestors.get(category)
+        if above is not None:
+            return ancestor in above
+        return self._start[ancestor] < self._start[category] < self._end[ancestor]
+
+
+def _top_down(
+    parent_of: list[int],
+    parents: Mapping[int, list[int]],
+    children: Mapping[int, list[int]],
+) -> list[int]:
+    """Return the category positions ordered so that parents come first."""
+    pending = [int(parent >= 0) for parent in parent_of]
+    for category, category_parents in parents.items():
+        pending[category] = len(category_parents)
+    stack = [category for category, count in enumerate(pending) if not count]
+    order = []
+    while stack:
+        category = stack.pop()
+        order.append(category)
+        for kid in children.get(category, ()):
+            pending[kid] -= 1
+            if not pending[kid]:
+                stack.append(kid)
+    return order
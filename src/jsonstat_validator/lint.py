@@ -0,0 +1,392 @@
+"""Check-only validation engine for JSON-stat.
+
+Runs the rules from `jsonstat_validator.rules` directly against a decoded
+document (dicts, lists, strings and numbers) without building any model
+instance. The members of every object are taken from the models' fields and
+checked against the field annotations (as `TypeAdapter`s) and field validators,
+so both engines accept the same documents and report the same first error. Select it with
+`validate_jsonstat(data, mode="check")` when only a yes/no answer is needed.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Annotated, Any, ForwardRef, Literal, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from jsonstat_validator import rules
+from jsonstat_validator.models.category import Category
+from jsonstat_validator.models.collection import Collection
+from jsonstat_validator.models.dataset import Dataset, DatasetRole
+from jsonstat_validator.models.dimension import DatasetDimension, Dimension
+from jsonstat_validator.models.link import Link
+from jsonstat_validator.models.unit import Unit
+from jsonstat_validator.utils import validation_error
+
+_CLASSES = ("dataset", "dimension", "collection")
+
+
+class _InvalidInput(Exception):  # noqa: N818
+    """A type error, recoverable while trying the members of a union."""
+
+    def __init__(self, loc: str, msg: str, type_str: str) -> None:
+        self.loc = loc
+        self.msg = msg
+        self.type_str = type_str
+        super().__init__(msg)
+
+
+def _has_model(annotation: Any) -> bool:
+    """Return whether an annotation holds a model, checked by hand here."""
+    if get_origin(annotation) is Literal:
+        return False
+    if isinstance(annotation, str | ForwardRef):
+        return True
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(map(_has_model, get_args(annotation)))
+
+
+@dataclass(frozen=True)
+class _Field:
+    """A model field: its member name, the type check and its field validators.
+
+    Attributes:
+        key: The member name (the alias, if any)
+        required: Whether the member must be present
+        nullable: Whether `null` is accepted without further checks
+        adapter: The field annotation as a `TypeAdapter`, or None when the field
+            holds a model or has a plain/wrap validator, both checked by hand
+        before: Bound `mode="before"` validators, run on the raw member
+        after: Bound `mode="after"` validators, run on the checked member
+    """
+
+    key: str
+    required: bool
+    nullable: bool
+    adapter: TypeAdapter | None
+    before: tuple[Callable[[Any], Any], ...]
+    after: tuple[Callable[[Any], Any], ...]
+
+
+@dataclass(frozen=True)
+class _Fields:
+    """Members accepted by a model: every alias and name, and their fields."""
+
+    aliases: dict[str, str]
+    fields: tuple[_Field, ...]
+
+    @classmethod
+    def of(cls, model: type[BaseModel]) -> _Fields:
+        validators: dict[str, dict[str, list]] = {}
+        for decorator in model.__pydantic_decorators__.field_validators.values():
+            bound = getattr(model, decorator.cls_var_name)
+            for name in decorator.info.fields:
+                modes = validators.setdefault(name, {})
+                modes.setdefault(decorator.info.mode, []).append(bound)
+        aliases = {}
+        fields = []
+        for name, field in model.model_fields.items():
+            key = field.alias or name
+            aliases[key] = key
+            aliases[name] = key
+            modes = validators.get(name, {})
+            annotation = field.annotation
+            by_hand = _has_model(annotation) or "plain" in modes or "wrap" in modes
+            if field.metadata:
+                annotation = Annotated[annotation, *field.metadata]
+            fields.append(
+                _Field(
+                    key=key,
+                    required=field.is_required(),
+                    nullable=type(None) in get_args(field.annotation),
+                    adapter=None if by_hand else TypeAdapter(annotation),
+                    before=tuple(modes.get("before", ())),
+                    after=tuple(modes.get("after", ())),
+                )
+            )
+        return cls(aliases, tuple(fields))
+
+
+_FIELDS = {
+    model: _Fields.of(model)
+    for model in (
+        Category,
+        Collection,
+        Dataset,
+        DatasetDimension,
+        DatasetRole,
+        Dimension,
+        Link,
+        Unit,
+    )
+}
+
+
+def _loc(parent: str, key: str | int) -> str:
+    if isinstance(key, int):
+        return f"{parent}[{key}]"
+    return f"{parent}.{key}" if parent else key
+
+
+def _validate(adapter: TypeAdapter, value: Any, loc: str) -> Any:
+    """Validate a member against its field annotation, as the model does."""
+    try:
+        return adapter.validate_python(value)
+    except ValidationError as e:
+        error = e.errors()[0]
+        for key in error["loc"]:
+            loc = _loc(loc, key)
+        raise _InvalidInput(loc, error["msg"], error["type"]) from None
+
+
+def _members(
+    obj: Any,
+    loc: str,
+    model: type[BaseModel],
+    nested: dict[str, Callable[[Any, str], Any]] | None = None,
+) -> dict[str, Any]:
+    """Return the checked members of `obj` keyed by alias, in field order.
+
+    Members are checked like the model's fields: against the field annotation,
+    between the field's before and after validators, or, for the fields in
+    `nested` (models and fields with custom validators), by their checker.
+    """
+    if not isinstance(obj, dict):
+        raise _InvalidInput(
+            loc,
+            f"Input should be a valid dictionary or instance of {model.__name__}",
+            "model_type",
+        )
+    fields = _FIELDS[model]
+    members = {fields.aliases.get(key, key): value for key, value in obj.items()}
+    checked = {}
+    for field in fields.fields:
+        key = field.key
+        field_loc = _loc(loc, key)
+        if key not in members:
+            if field.required:
+                raise _InvalidInput(field_loc, "Field required", "missing")
+            continue
+        value = members[key]
+        for validator in field.before:
+            value = validator(value)
+        if field.adapter is not None:
+            value = _validate(field.adapter, value, field_loc)
+            for validator in field.after:
+                value = validator(value)
+        elif not (value is None and field.nullable):
+            value = nested[key](value, field_loc)
+        checked[key] = value
+    for key in obj:
+        if key not in fields.aliases:
+            raise _InvalidInput(
+                _loc(loc, key), "Extra inputs are not permitted", "extra_forbidden"
+            )
+    return checked
+
+
+def _list(value: Any, loc: str) -> list:
+    if not isinstance(value, list | tuple):
+        raise _InvalidInput(loc, "Input should be a valid list", "list_type")
+    return list(value)
+
+
+def _dict(value: Any, loc: str) -> dict:
+    if not isinstance(value, dict):
+        raise _InvalidInput(loc, "Input should be a valid dictionary", "dict_type")
+    return value
+
+
+def _check_values(value: Any, loc: str, allowed: frozenset[type]) -> Any:
+    """Check a `value` or `status` list or dict."""
+    if isinstance(value, dict):
+        keys = list(value)
+        items = list(value.values())
+    else:
+        items = _list(value, loc)
+        keys = range(len(items))
+    invalid = rules.first_invalid(items, allowed)
+    if invalid is not None:
+        if allowed is rules.VALUE_TYPES:
+            msg, type_str = (
+                "Input should be a valid number, string or null",
+                "value_type",
+            )
+        else:
+            msg, type_str = "Input should be a valid string", "string_type"
+        raise _InvalidInput(_loc(loc, keys[invalid]), msg, type_str)
+    return value
+
+
+def _check_status(status: Any, loc: str) -> Any:
+    if isinstance(status, str):
+        return status
+    return _check_values(status, loc, rules.STATUS_TYPES)
+
+
+def _check_links(value: Any, loc: str) -> dict:
+    """Check a `link` member: lists of links or embedded documents."""
+    links = _dict(value, loc)
+    for relation, entries in links.items():
+        for i, entry in enumerate(_list(entries, _loc(loc, relation))):
+            _check_link_entry(entry, _loc(_loc(loc, relation), i))
+    return links
+
+
+def _check_link_entry(entry: Any, loc: str) -> None:
+    """Check a `Link | JSONStatSchema` entry, trying the members in order."""
+    try:
+        _check_link(entry, loc)
+    except _InvalidInput:
+        if not (isinstance(entry, dict) and entry.get("class") in _CLASSES):
+            raise
+        _check_document(entry, loc)
+
+
+def _check_link(entry: Any, loc: str) -> None:
+    members = _members(entry, loc, Link)
+    rules.check_link(members.get("href"), members.get("class"))
+
+
+def _check_units(units: Any, loc: str) -> dict:
+    return {
+        key: _members(unit, _loc(loc, key), Unit)
+        for key, unit in _dict(units, loc).items()
+    }
+
+
+def _check_category(category: Any, loc: str) -> tuple[Any, Any]:
+    """Check a category, returning its `index` and `label`."""
+    members = _members(category, loc, Category, {"unit": _check_units})
+    index = members.get("index")
+    label = members.get("label")
+    rules.check_category(
+        index,
+        label,
+        members.get("child"),
+        members.get("coordinates"),
+        members.get("unit"),
+    )
+    return index, label
+
+
+def _check_dimension(dimension: Any, loc: str, model: type[BaseModel]) -> tuple:
+    """Check a root or dataset dimension, returning its category `index`/`label`."""
+    members = _members(
+        dimension, loc, model, {"category": _check_category, "link": _check_links}
+    )
+    category = members.get("category")
+    rules.check_no_item_relation(members.get("link"))
+    rules.check_dimension(category is not None, members.get("href") is not None)
+    return category
+
+
+def _check_role(role: Any, loc: str) -> tuple:
+    members = _members(role, loc, DatasetRole)
+    groups = tuple(members.get(key) for key in ("time", "geo", "metric"))
+    rules.check_dataset_role(*groups)
+    rules.check_role_references(groups)
+    return groups
+
+
+def _check_dimensions(dimensions: Any, loc: str) -> dict:
+    dimensions = _dict(dimensions, loc)
+    invalid = rules.first_invalid(list(dimensions), rules.STATUS_TYPES)
+    if invalid is not None:
+        raise _InvalidInput(loc, "Input should be a valid string", "string_type")
+    return {
+        dim_id: _check_dimension(dimension, _loc(loc, dim_id), DatasetDimension)
+        for dim_id, dimension in dimensions.items()
+    }
+
+
+def _check_dataset(dataset: dict, loc: str) -> None:
+    members = _members(
+        dataset,
+        loc,
+        Dataset,
+        {
+            "role": _check_role,
+            "value": lambda value, loc: _check_values(value, loc, rules.VALUE_TYPES),
+            "status": _check_status,
+            "dimension": _check_dimensions,
+            "link": _check_links,
+        },
+    )
+    ids = members["id"]
+    size = members["size"]
+    value = members["value"]
+    status = members.get("status")
+    categories = members["dimension"]
+    category_counts = [
+        rules.category_count(*categories[dim_id]) if categories.get(dim_id) else None
+        for dim_id in ids
+    ]
+    rules.check_dataset(
+        ids,
+        size,
+        categories,
+        members.get("role"),
+        len(value),
+        status,
+        category_counts,
+        members.get("link"),
+    )
+    n_cells = math.prod(size)
+    if isinstance(value, dict):
+        rules.check_cell_keys("value", value, n_cells)
+    else:
+        rules.check_value_length(len(value), n_cells)
+    if isinstance(status, dict):
+        rules.check_cell_keys("status", status, n_cells)
+
+
+def _check_collection(collection: dict, loc: str) -> None:
+    members = _members(collection, loc, Collection, {"link": _check_links})
+    rules.check_collection(members.get("link"))
+
+
+def _check_document(data: Any, loc: str) -> None:
+    """Check a JSON-stat document of any class."""
+    if not isinstance(data, dict):
+        raise _InvalidInput(loc, "Input should be a valid dictionary", "model_type")
+    class_ = data.get("class", data.get("class_"))
+    if class_ is None:
+        raise _InvalidInput(
+            loc,
+            "Unable to extract tag using discriminator 'class_' | 'class'",
+            "union_tag_not_found",
+        )
+    if class_ == "dataset":
+        _check_dataset(data, _loc(loc, "dataset"))
+    elif class_ == "dimension":
+        _check_dimension(data, _loc(loc, "dimension"), Dimension)
+    elif class_ == "collection":
+        _check_collection(data, _loc(loc, "collection"))
+    else:
+        raise _InvalidInput(
+            loc,
+            f"Input tag '{class_}' found using 'class_' | 'class' does not match any of the "
+            "expected tags: 'dataset', 'dimension', 'collection'",
+            "union_tag_invalid",
+        )
+
+
+def check_jsonstat(data: dict) -> None:
+    """Check a decoded JSON-stat document without building models.
+
+    Args:
+        data: A dictionary containing JSON-stat data
+
+    Raises:
+        JSONStatValidationError: If the data does not conform to the JSON-stat
+                                 specification
+    """
+    try:
+        _check_document(data, "")
+    except _InvalidInput as e:
+        raise validation_error(e.loc, e.msg, e.type_str) from None
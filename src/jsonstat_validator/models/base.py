@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Any, Self
+
 from pydantic import AnyUrl, BaseModel, ConfigDict, Field, RootModel, field_serializer
 
 
@@ -21,6 +25,36 @@ class JSONStatBaseModel(BaseModel):
         """Convert AnyUrl to string, if it exists."""
         return str(href) if href else None
 
+    def __copy__(self) -> Self:
+        """Copy the model without its cached lookups (see `model_copy`)."""
+        return self._without_cache(super().__copy__())
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        """Deep-copy the model without its cached lookups (see `model_copy`)."""
+        return self._without_cache(super().__deepcopy__(memo))
+
+    @classmethod
+    def _without_cache(cls, copy: Self) -> Self:
+        """Drop cached properties, which `model_copy(update=...)` would make stale."""
+        for klass in cls.__mro__:
+            for name, member in vars(klass).items():
+                if isinstance(member, cached_property):
+                    copy.__dict__.pop(name, None)
+        return copy
+
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any]) -> Self:
+        """Build an instance from already validated data, skipping validation.
+
+        Meant for data the library produced itself, such as the `model_dump()`
+        of a validated model: nothing is checked, so invalid data gives an
+        invalid model. Nested models are built the same way.
+        """
+        href = data.get("href")
+        if href and isinstance(href, str):
+            data = {**data, "href": AnyUrl(href)}
+        return cls.model_construct(**data)
+
     model_config = ConfigDict(
         extra="forbid",
         serialize_by_alias=True,
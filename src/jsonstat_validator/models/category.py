@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
+from functools import cached_property
+from typing import Any
+
 from pydantic import Field, model_validator
 
+from jsonstat_validator.hierarchy import Hierarchy
 from jsonstat_validator.models.base import JSONStatBaseModel
 from jsonstat_validator.models.unit import Unit
-from jsonstat_validator.utils import JSONStatValidationError
+from jsonstat_validator.rules import (
+    category_positions,
+    check_category,
+    check_child_cycles,
+)
 
 
 class Category(JSONStatBaseModel):
@@ -72,77 +81,131 @@ class Category(JSONStatBaseModel):
         ),
     )
 
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any]) -> Category:
+        """Build a category from already validated data, skipping validation."""
+        unit = data.get("unit")
+        if unit is not None:
+            data = {
+                **data,
+                "unit": {
+                    category_id: Unit.from_trusted(item)
+                    for category_id, item in unit.items()
+                },
+            }
+        return super().from_trusted(data)
+
+    @cached_property
+    def positions(self) -> dict[str, int]:
+        """The position of each category ID, from `index` (or `label`).
+
+        Built on first use and cached; not serialized.
+        """
+        return category_positions(self.index, self.label)
+
+    @cached_property
+    def ids(self) -> tuple[str, ...]:
+        """The category IDs in position order."""
+        return tuple(self.positions)
+
+    @cached_property
+    def hierarchy(self) -> Hierarchy:
+        """The roots, leaves, depths, ancestors and descendants of `child`.
+
+        Built on first use and cached; not serialized.
+        """
+        return Hierarchy(self.ids, self.positions, self.child)
+
+    def select(self, ids: Sequence[str]) -> Category:
+        """Return the category restricted to `ids`, in that order.
+
+        The members keyed by category ID are filtered to `ids`; hierarchies
+        keep the parents and children selected. The result is not validated.
+        """
+        keep = set(ids)
+        fields = {name: getattr(self, name) for name in self.model_fields_set}
+        if isinstance(self.index, dict):
+            fields["index"] = dict(zip(ids, range(len(ids)), strict=True))
+        elif self.index is not None:
+            fields["index"] = list(ids)
+        if self.label is not None:
+            fields["label"] = {
+                category_id: self.label[category_id]
+                for category_id in ids
+                if category_id in self.label
+            }
+        if self.child is not None:
+            child = {
+                parent: [category_id for category_id in children if category_id in keep]
+                for parent, children in self.child.items()
+                if parent in keep
+            }
+            fields["child"] = {parent: kids for parent, kids in child.items() if kids}
+        for name in ("coordinates", "unit", "note"):
+            members = getattr(self, name)
+            if members is not None:
+                fields[name] = {
+                    category_id: item
+                    for category_id, item in members.items()
+                    if category_id in keep
+                }
+        return Category.model_construct(**fields)
+
+    @classmethod
+    def concat(cls, categories: Sequence[Category]) -> Category:
+        """Return a category holding the categories of each of `categories`.
+
+        `index` follows the form of the first category; the members keyed by
+        category ID are merged, and so are the children of each parent. The
+        result is not validated, but for cycles in the merged `child`.
+
+        Raises:
+            ValueError: If a category ID is in more than one category, or only
+                some of the categories have labels
+            JSONStatValidationError: If the merged `child` has a cycle
+        """
+        ids = [category_id for category in categories for category_id in category.ids]
+        if len(set(ids)) != len(ids):
+            seen: set[str] = set()
+            repeated = next(i for i in ids if i in seen or seen.add(i))
+            raise ValueError(f"Category '{repeated}' is in more than one category")
+        fields: dict[str, Any] = {}
+        if isinstance(categories[0].index, dict):
+            fields["index"] = dict(zip(ids, range(len(ids)), strict=True))
+        else:
+            fields["index"] = ids
+        labelled = [category.label is not None for category in categories]
+        if any(labelled):
+            # With an index, labels must cover every category.
+            if not all(labelled):
+                raise ValueError("Categories must all have labels, or none")
+            fields["label"] = {}
+            for category in categories:
+                fields["label"].update(category.label)
+        for name in ("coordinates", "unit", "note"):
+            members = [getattr(category, name) for category in categories]
+            if any(item is not None for item in members):
+                fields[name] = {}
+                for item in members:
+                    fields[name].update(item or {})
+        if any(category.child for category in categories):
+            child: dict[str, dict[str, None]] = {}
+            for category in categories:
+                for parent, children in (category.child or {}).items():
+                    child.setdefault(parent, {}).update(dict.fromkeys(children))
+            fields["child"] = {parent: list(kids) for parent, kids in child.items()}
+            check_child_cycles(fields["child"])
+        return Category.model_construct(**fields)
+
     @model_validator(mode="after")
     def validate_category(self) -> Category:
         """Category-wide validation checks."""
-        # index, label: at least one of index or label is required
-        if self.index is None and self.label is None:
-            raise JSONStatValidationError(
-                "At least one of `index` or `label` is required."
-            )
-
-        # index, label: same keys if both are dictionaries
-        if self.index and self.label and isinstance(self.label, dict):
-            index_keys = (
-                set(self.index) if isinstance(self.index, list) else set(self.index)
-            )
-            if index_keys != set(self.label):
-                raise JSONStatValidationError(
-                    "`index` and `label` must have the same keys."
-                )
-
-        # index list: unique IDs
-        if isinstance(self.index, list) and len(set(self.index)) != len(self.index):
-            raise JSONStatValidationError(
-                "Category IDs in `index` list must be unique."
-            )
-
-        # coordinates: keys must be valid categories
-        # and values must be length-2 lists of numbers (longitude, latitude).
-        if self.coordinates:
-            for key, value in self.coordinates.items():
-                if (self.index and key not in self.index) or (
-                    self.label and key not in self.label
-                ):
-                    raise JSONStatValidationError(
-                        f"Trying to set coordinates for category ID: {key} "
-                        "but it is not defined neither in `index` nor in `label`."
-                    )
-                if not isinstance(value, list) or len(value) != 2:
-                    raise JSONStatValidationError(
-                        f"Coordinates for category {key} must be a list of 2 numbers: (longitude, latitude)."
-                    )
-
-        # child: references an existing parent
-        if self.child:
-            valid_ids = (
-                set(self.index)
-                if isinstance(self.index, list)
-                else set(self.index or [])
-            )
-            valid_ids |= set(self.label or [])
-            for parent, children in self.child.items():
-                if parent not in valid_ids:
-                    raise JSONStatValidationError(
-                        f"Invalid parent: {parent} in the `child` field."
-                    )
-                for ch in children:
-                    if ch not in valid_ids:
-                        raise JSONStatValidationError(
-                            f"Invalid child: {ch} in `child[{parent}]`."
-                        )
-
-        # unit: keys must exist
-        if self.unit:
-            valid_ids = (
-                set(self.index)
-                if isinstance(self.index, list)
-                else set(self.index or [])
-            )
-            valid_ids |= set(self.label or [])
-            for key in self.unit:
-                if key not in valid_ids:
-                    raise JSONStatValidationError(
-                        f"Invalid unit: {key} in the `unit` field."
-                    )
+        check_category(
+            self.index,
+            self.label,
+            self.child,
+            self.coordinates,
+            self.unit,
+            self.positions,
+        )
         return self
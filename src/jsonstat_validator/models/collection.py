@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Literal
+from collections.abc import Mapping
+from typing import Annotated, Any, Literal
 
 from pydantic import AnyUrl, Field, field_validator, model_validator
 
 from jsonstat_validator.models.base import JSONStatBaseModel, JSONStatSchema
-from jsonstat_validator.models.link import Link, LinkRelationType
-from jsonstat_validator.utils import JSONStatValidationError, is_valid_iso_date
+from jsonstat_validator.models.link import LINK_RELATION_TYPES, Link, trusted_links
+from jsonstat_validator.rules import (
+    check_collection,
+    check_link_relations,
+    check_updated,
+)
 
 
 class Collection(JSONStatBaseModel):
@@ -71,9 +76,7 @@ class Collection(JSONStatBaseModel):
     @classmethod
     def validate_updated_date(cls, v: str | None) -> str | None:
         """Validates the updated date is in ISO 8601 format."""
-        if v and not is_valid_iso_date(v):
-            error_message = f"Updated date: '{v}' is an invalid ISO 8601 format."
-            raise JSONStatValidationError(error_message)
+        check_updated(v)
         return v
 
     @field_validator("link", mode="before")
@@ -83,24 +86,20 @@ class Collection(JSONStatBaseModel):
         if not isinstance(data, dict):
             return data
 
-        allowed_types = {e.value for e in LinkRelationType}
-        invalid_keys = [key for key in data if key not in allowed_types]
-        if invalid_keys:
-            raise JSONStatValidationError(
-                f"Invalid link relation types: {invalid_keys}. Must be one of: "
-            )
+        check_link_relations(data, LINK_RELATION_TYPES)
         return data
 
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any]) -> Collection:
+        """Build a collection from already validated data, skipping validation.
+
+        Links are built without validation; embedded documents are validated.
+        """
+        if data.get("link") is not None:
+            data = {**data, "link": trusted_links(data["link"])}
+        return super().from_trusted(data)
+
     @model_validator(mode="after")
     def validate_collection(self) -> Collection:
-        if not self.link:
-            return self
-        if "item" not in self.link:
-            raise JSONStatValidationError(
-                "Collection links must use 'item' relation type."
-            )
-        # Values must be lists
-        for rel, entries in self.link.items():
-            if not isinstance(entries, list):
-                raise JSONStatValidationError(f"Relation '{rel}' must be a list.")
+        check_collection(self.link)
         return self
@@ -2,15 +2,69 @@
 
 from __future__ import annotations
 
-from collections import Counter
-from typing import Annotated, Literal
+import math
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from functools import cached_property
+from itertools import compress, product, repeat
+from operator import is_not
+from typing import TYPE_CHECKING, Annotated, Any, Literal
 
-from pydantic import AnyUrl, Field, field_validator, model_validator
+from pydantic import (
+    AnyUrl,
+    Field,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
 
+from jsonstat_validator.aggregates import AggregateMismatches, check_aggregates
+from jsonstat_validator.arrays import (
+    from_ndarray,
+    optional_numpy,
+    to_ndarray,
+    transpose_compact,
+)
+from jsonstat_validator.cube import CubeIndex, cell_positions
+from jsonstat_validator.diff import DatasetDiff, diff_datasets
 from jsonstat_validator.models.base import JSONStatBaseModel, JSONStatSchema
+from jsonstat_validator.models.category import Category
 from jsonstat_validator.models.dimension import DatasetDimension
-from jsonstat_validator.models.link import Link, LinkRelationType
-from jsonstat_validator.utils import JSONStatValidationError, is_valid_iso_date
+from jsonstat_validator.models.link import LINK_RELATION_TYPES, Link, trusted_links
+from jsonstat_validator.rules import (
+    category_count,
+    check_cell_keys,
+    check_dataset,
+    check_dataset_role,
+    check_link_relations,
+    check_role_references,
+    check_updated,
+    check_value_length,
+)
+from jsonstat_validator.tabular import category_ids, collect_rows
+from jsonstat_validator.utils import JSONStatValidationError, payload_checksum
+from jsonstat_validator.values import (
+    CompactValues,
+    concat_status,
+    concat_values,
+    dense_status,
+    dense_values,
+    optimal_form,
+    sparse_status,
+    sparse_values,
+    take_status,
+    take_values,
+    transpose_status,
+    transpose_values,
+    validate_status,
+    validate_values,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
 
 ValueType = list[float | int | str | None] | dict[str, float | int | str | None]
 StatusType = str | list[str] | dict[str, str] | None
@@ -51,18 +105,7 @@ class DatasetRole(JSONStatBaseModel):
         - At least one role must be provided.
         - Each dimension can only be referenced in one role.
         """
-        if not self.time and not self.geo and not self.metric:
-            raise JSONStatValidationError("At least one role must be provided.")
-        if (
-            self.time
-            and self.geo
-            and self.metric
-            and len(set(self.time + self.geo + self.metric))
-            != len(self.time + self.geo + self.metric)
-        ):
-            raise JSONStatValidationError(
-                "Each dimension can only be referenced in one role."
-            )
+        check_dataset_role(self.time, self.geo, self.metric)
         return self
 
 
@@ -182,14 +225,512 @@ class Dataset(JSONStatBaseModel):
         ),
     )
 
+    @classmethod
+    def from_trusted(
+        cls, data: Mapping[str, Any], *, checksum: str | None = None
+    ) -> Dataset:
+        """Build a dataset from already validated data, skipping validation.
+
+        Meant for payloads the library produced itself, such as the
+        `model_dump()` of a validated dataset: nothing is checked, so invalid
+        data gives an invalid dataset. Nested dimensions, categories, units and
+        links are built the same way.
+
+        Args:
+            data: The dataset, as a dict
+            checksum: The `payload_checksum` of `data` computed when it was
+                produced, to detect data swapped, reshaped or with changed
+                metadata in between (cells are only sampled)
+
+        Raises:
+            JSONStatValidationError: If `checksum` does not match `data`
+        """
+        if checksum is not None and payload_checksum(data) != checksum:
+            raise JSONStatValidationError("Dataset does not match its checksum.")
+        data = dict(data)
+        if data.get("role") is not None:
+            data["role"] = DatasetRole.from_trusted(data["role"])
+        if data.get("dimension") is not None:
+            data["dimension"] = {
+                dim_id: DatasetDimension.from_trusted(dimension)
+                for dim_id, dimension in data["dimension"].items()
+            }
+        if data.get("link") is not None:
+            data["link"] = trusted_links(data["link"])
+        return super().from_trusted(data)
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Mapping],
+        dims: Sequence[str],
+        value_col: str = "value",
+        status_col: str | None = None,
+        *,
+        order: Literal["first_seen", "sorted"] = "first_seen",
+        from_text: bool = False,
+    ) -> Dataset:
+        """Build a dataset from long-format rows, reading them once.
+
+        Each row holds the category of each dimension in `dims` (which also
+        give the dimension IDs), a value and, optionally, a status. Cells
+        without a row are null. The dataset is valid by construction: only the
+        values and statuses are checked, in one pass, and the models are built
+        without validation.
+
+        Args:
+            rows: Mappings from column name to value; category IDs that are
+                not strings are converted with `str`
+            dims: The columns holding the category of each dimension; none
+                for a single-cell dataset (a single row)
+            value_col: The column holding the value
+            status_col: The column holding the status, if any
+            order: Order categories as first seen, or sorted by ID
+            from_text: Read values and statuses from text fields, as given by
+                `csv.DictReader`: numbers are parsed, and empty fields are
+                null values and no status
+
+        Raises:
+            KeyError: If a row misses a dimension or value column
+            ValueError: If two rows give the same cell, or a value or status
+                is invalid (a `ValidationError`)
+        """
+        collected = collect_rows(
+            rows, dims, value_col, status_col, order, from_text=from_text
+        )
+        size = list(map(len, collected.categories))
+        n_cells = math.prod(size)
+        value = [None] * n_cells
+        for position, item in zip(collected.positions, collected.values, strict=True):
+            value[position] = item
+        status = None
+        if collected.statuses is not None:
+            present = list(map(is_not, collected.statuses, repeat(None)))
+            keys = map(str, compress(collected.positions, present))
+            status = dict(zip(keys, compress(collected.statuses, present), strict=True))
+            status = dense_status(status, n_cells) if status else None
+        categories = dict(zip(dims, collected.categories, strict=True))
+        return cls._from_cube(
+            categories, validate_values(value), validate_status(status)
+        )
+
+    @classmethod
+    def from_numpy(
+        cls, arr: np.ndarray, dimensions: Mapping[str, Sequence[str]]
+    ) -> Dataset:
+        """Build a dataset from an array with an axis per dimension.
+
+        The values are copied once into `CompactValues` storage, without going
+        through Python lists; NaN and masked cells become nulls. Requires NumPy
+        (the `numpy` extra).
+
+        Args:
+            arr: The values, with axes in the order of `dimensions`
+            dimensions: The category IDs of each dimension, by dimension ID;
+                IDs that are not strings are converted with `str`
+
+        Raises:
+            ValueError: If the shape of `arr` does not match the number of
+                categories, or two categories have the same ID
+        """
+        categories = {
+            dim_id: category_ids(ids, dim_id) for dim_id, ids in dimensions.items()
+        }
+        size = tuple(map(len, categories.values()))
+        if arr.shape != size:
+            raise ValueError(
+                f"Array shape {arr.shape} does not match the number of categories "
+                f"of each dimension {size}"
+            )
+        return cls._from_cube(categories, from_ndarray(arr))
+
+    @classmethod
+    def _from_cube(
+        cls,
+        categories: Mapping[str, list[str]],
+        value: list | dict | CompactValues,
+        status: str | list | dict | None = None,
+    ) -> Dataset:
+        """Build a dataset from checked cells and category IDs, unvalidated."""
+        dimension = {
+            dim_id: DatasetDimension.model_construct(
+                category=Category.model_construct(index=ids)
+            )
+            for dim_id, ids in categories.items()
+        }
+        return cls.model_construct(
+            version="2.0",
+            class_="dataset",
+            id=list(categories),
+            size=list(map(len, categories.values())),
+            value=value,
+            status=status,
+            dimension=dimension,
+        )
+
+    @cached_property
+    def _cube(self) -> CubeIndex:
+        """Cell count, strides and category positions, computed on first use.
+
+        Cached properties are not fields: they are neither serialized nor
+        compared.
+        """
+        return CubeIndex(self.id, self.size, self.dimension)
+
+    def _cube_index(self) -> CubeIndex:
+        cube = self._cube
+        if (
+            cube.id != tuple(self.id)
+            or cube.size != tuple(self.size)
+            or cube.dimension is not self.dimension
+        ):
+            # Stale after an assignment (copies drop the cache).
+            del self.__dict__["_cube"]
+            cube = self._cube
+        return cube
+
+    @property
+    def n_cells(self) -> int:
+        """The number of cells of the cube, the product of `size`."""
+        return self._cube_index().n_cells
+
+    @property
+    def strides(self) -> tuple[int, ...]:
+        """The row-major stride of each dimension, in `id` order."""
+        return self._cube_index().strides
+
+    def cell(self, **coords: str) -> float | int | str | None:
+        """Return the value of a cell, given the category of each dimension.
+
+        Dimensions with a single category may be omitted. Dimension IDs that are
+        not valid Python names can be passed as `cell(**{"sex-code": "F"})`.
+
+        Returns:
+            The value of the cell; None for a null or, in dict-form `value`,
+            a missing cell
+
+        Raises:
+            KeyError: If a dimension or category is unknown, or a dimension is
+                missing
+        """
+        position = self._cube_index().position(coords)
+        if isinstance(self.value, dict):
+            return self.value.get(str(position))
+        return self.value[position]
+
+    def cells(
+        self, coords: Sequence[Mapping[str, str]]
+    ) -> list[float | int | str | None]:
+        """Return the values of many cells, see `cell`.
+
+        Positions are computed for all cells at once, a dimension at a time.
+        """
+        positions = self._cube_index().positions_of(coords)
+        if isinstance(self.value, dict):
+            return list(map(self.value.get, map(str, positions)))
+        return list(map(self.value.__getitem__, positions))
+
+    def iter_rows(
+        self,
+        labels: bool = False,
+        include_status: bool = True,
+        skip_null: bool = True,
+    ) -> Iterator[tuple]:
+        """Iterate over the cells as rows, lazily and in `value` order.
+
+        A row is a tuple of the category of each dimension, in `id` order,
+        followed by the value and, if `include_status`, the status of the cell
+        (None if it has none). Categories come from an odometer over the
+        dimensions (`itertools.product`), so memory use does not grow with the
+        cube; the cells of a dict-form `value` are looked up by key as the
+        odometer turns.
+
+        Args:
+            labels: Give category labels instead of IDs
+            include_status: Append the status of each cell
+            skip_null: Skip null cells, and cells missing from a dict-form
+                `value`
+        """
+        categories = [self._row_categories(dim_id, labels) for dim_id in self.id]
+        values = self._iter_cells(self.value)
+        if include_status:
+            # A single status (or none) repeats for every cell.
+            cells = zip(values, self._iter_status(), strict=False)
+        else:
+            cells = zip(values, strict=True)
+        rows = map(tuple.__add__, product(*categories), cells)
+        if skip_null:
+            cells = self._iter_cells(self.value)
+            return compress(rows, map(is_not, cells, repeat(None)))
+        return rows
+
+    def _category(self, dim_id: str) -> Category:
+        """Return the category of a dimension, which must not be href-only."""
+        category = self.dimension[dim_id].category
+        if category is None:
+            raise JSONStatValidationError(
+                f"Dimension '{dim_id}' has no categories, only an `href`."
+            )
+        return category
+
+    def _row_categories(self, dim_id: str, labels: bool) -> Sequence:
+        category = self.dimension[dim_id].category
+        if category is None:
+            return [None] * self.size[self.id.index(dim_id)]
+        if labels and category.label:
+            return list(map(category.label.__getitem__, category.ids))
+        return category.ids
+
+    def _iter_cells(self, cells: Sequence | Mapping) -> Iterator:
+        if isinstance(cells, Mapping):
+            return map(cells.get, map(str, range(self.n_cells)))
+        return iter(cells)
+
+    def _iter_status(self) -> Iterator:
+        status = self.status
+        if isinstance(status, list) and len(status) == 1:
+            status = status[0]
+        if status is None or isinstance(status, str):
+            return repeat(status)
+        return self._iter_cells(status)
+
+    def slice(self, selection: Mapping[str, Sequence[str]]) -> Dataset:
+        """Return the sub-cube with the selected categories of some dimensions.
+
+        Dimensions missing from `selection` keep all their categories; the
+        others keep the categories selected, in the order given. The cells are
+        gathered in bulk from positions computed with the strides, and the
+        result is built without validation.
+
+        Example:
+            `dataset.slice({"geo": ["ES"], "time": ["2010", "2011"]})`
+
+        Raises:
+            KeyError: If a dimension or category is unknown
+            ValueError: If a category is selected twice
+            JSONStatValidationError: If a selected dimension has no categories
+        """
+        cube = self._cube_index()
+        cube._check_dimensions(selection)
+        categories = {dim_id: self._category(dim_id) for dim_id in selection}
+        positions = cube.select(selection)
+        cells = cell_positions(cube.strides, positions)
+        dimension = dict(self.dimension)
+        for dim_id, ids in selection.items():
+            dimension[dim_id] = dimension[dim_id].model_copy(
+                update={"category": categories[dim_id].select(ids)}
+            )
+        return self._replace(
+            size=list(map(len, positions)),
+            value=take_values(self.value, cells),
+            status=take_status(self.status, cells),
+            dimension=dimension,
+        )
+
+    def transpose(self, new_id_order: Sequence[str]) -> Dataset:
+        """Return the dataset with its dimensions in another order.
+
+        `value` and `status` are permuted in bulk: with positions computed from
+        the strides, with NumPy for compact values when it is installed, or by
+        moving the keys of dict-form cells. The result is built without
+        validation.
+
+        Example:
+            `dataset.transpose(["geo", "sex", "time"])`
+
+        Raises:
+            ValueError: If `new_id_order` is not a reordering of `id`
+        """
+        cube = self._cube_index()
+        order = cube.order(new_id_order)
+        value = self.value
+        if isinstance(value, CompactValues) and optional_numpy() is not None:
+            value = transpose_compact(value, cube.size, order)
+        else:
+            value = transpose_values(value, cube.size, order)
+        return self._replace(
+            id=list(new_id_order),
+            size=[cube.size[dim] for dim in order],
+            value=value,
+            status=transpose_status(self.status, cube.size, order),
+            dimension={dim_id: self.dimension[dim_id] for dim_id in new_id_order},
+        )
+
+    @classmethod
+    def concat(cls, datasets: Sequence[Dataset], along: str) -> Dataset:
+        """Join datasets along one of their dimensions, e.g. appending a period.
+
+        The datasets must have the same dimensions, in the same order, and the
+        same categories for each dimension but `along` (compared by identity,
+        then equality). The categories of `along` are joined in the order of
+        `datasets`, and `value` and `status` blocks are interleaved in bulk
+        using the strides. Other metadata comes from the first dataset; the
+        result is built without validation.
+
+        Example:
+            `Dataset.concat([history, latest_month], along="time")`
+
+        Raises:
+            KeyError: If `along` is not a dimension
+            ValueError: If the other dimensions differ, a category of `along` is
+                in more than one dataset, or only some have category labels
+            JSONStatValidationError: If `along` has no categories (only an
+                `href`), or its joined `child` has a cycle
+        """
+        if not datasets:
+            raise ValueError("No datasets to concatenate")
+        first = datasets[0]
+        if along not in first.id:
+            raise KeyError(f"Unknown dimension(s): {along}")
+        for dataset in datasets[1:]:
+            if dataset.id != first.id:
+                raise ValueError(
+                    "Datasets must have the same dimensions in the same order: "
+                    f"{', '.join(first.id)} != {', '.join(dataset.id)}"
+                )
+            for dim_id in first.id:
+                expected = first.dimension[dim_id]
+                dim = dataset.dimension[dim_id]
+                if dim_id == along or dim is expected:
+                    continue
+                if dim != expected:
+                    raise ValueError(f"Dimension '{dim_id}' differs between datasets")
+
+        dim = first.id.index(along)
+        outer = math.prod(first.size[:dim])
+        stride = first.strides[dim]
+        blocks = [dataset.size[dim] * stride for dataset in datasets]
+        category = Category.concat([dataset._category(along) for dataset in datasets])
+        size = list(first.size)
+        size[dim] = len(category.ids)
+        dimension = dict(first.dimension)
+        dimension[along] = dimension[along].model_copy(update={"category": category})
+        value = concat_values([dataset.value for dataset in datasets], blocks, outer)
+        return first._replace(
+            size=size,
+            value=value,
+            status=concat_status(
+                [dataset.status for dataset in datasets],
+                blocks,
+                outer,
+                sparse=isinstance(value, Mapping),
+            ),
+            dimension=dimension,
+        )
+
+    def diff(self, other: Dataset) -> DatasetDiff:
+        """Return the cell-level differences from this dataset to `other`.
+
+        The cubes are aligned by category ID, so `other` may order categories
+        and dimensions differently. Values and statuses of the cells found in
+        both are compared in bulk; the non-null cells of categories found in one
+        dataset only are added or removed. The result holds position arrays,
+        and `DatasetDiff.iter_rows()` yields the differences as rows.
+
+        Example:
+            `previous_release.diff(release).changed_new`
+
+        Raises:
+            ValueError: If the datasets do not have the same dimensions
+            JSONStatValidationError: If a dimension without categories differs
+                in size between the datasets
+        """
+        return diff_datasets(self, other)
+
+    def check_aggregates(
+        self, dim_id: str, tolerance: float = 0.0
+    ) -> AggregateMismatches:
+        """Return the cells where a parent category is not the sum of its children.
+
+        Each parent of the `child` hierarchy of `dim_id` is compared with the sum
+        of its direct children, across every other dimension, adding whole
+        slabs of the value buffer at a time (with NumPy, when installed). Cells
+        where the parent or a child is null or not a number are not checked.
+
+        Args:
+            dim_id: The dimension whose hierarchy is checked
+            tolerance: The largest absolute difference allowed
+
+        Example:
+            `dataset.check_aggregates("geo", tolerance=0.5).iter_rows()`
+
+        Raises:
+            KeyError: If the dimension is unknown
+        """
+        return check_aggregates(self, dim_id, tolerance)
+
+    def _replace(self, **update: Any) -> Dataset:
+        """Return a copy with some fields replaced, without validation.
+
+        Unlike `model_copy`, the copy does not share cached lookups.
+        """
+        fields = {name: getattr(self, name) for name in self.model_fields_set}
+        return Dataset.model_construct(**{**fields, **update})
+
+    def to_numpy(self, dtype: Any = None, null: Any = math.nan) -> np.ndarray:
+        """Return the values as an array with an axis per dimension.
+
+        With compact value storage and no nulls, the array is a read-only view
+        of the dataset's memory, built without copying.
+
+        Args:
+            dtype: The array dtype; by default int64 or float64 for numbers
+                (float64 when there are nulls), object for strings
+            null: The fill value of null cells
+
+        Raises:
+            ImportError: If NumPy is not installed (the `numpy` extra)
+        """
+        return to_ndarray(self.value, self.size, dtype, null)
+
+    def optimal_value_form(self) -> Literal["dense", "sparse"]:
+        """Return the `value` form that serializes to the fewest JSON bytes.
+
+        The sparse form pays off when most cells are null.
+        """
+        return optimal_form(self.value, self.n_cells)
+
+    def to_dense(self) -> Dataset:
+        """Return a copy with `value` as a list, with nulls for missing cells.
+
+        A dict-form `status` becomes a list too if it covers every cell.
+        """
+        n_cells = self.n_cells
+        return self.model_copy(
+            update={
+                "value": dense_values(self.value, n_cells),
+                "status": dense_status(self.status, n_cells),
+            }
+        )
+
+    def to_sparse(self) -> Dataset:
+        """Return a copy with `value` (and a per-cell `status`) as dicts.
+
+        Null cells are dropped from the dict-form `value`.
+        """
+        return self.model_copy(
+            update={
+                "value": sparse_values(self.value),
+                "status": sparse_status(self.status),
+            }
+        )
+
+    def _value_form(self, info: SerializationInfo) -> str | None:
+        """Return the form requested by the `value_form` serialization context."""
+        form = info.context.get("value_form") if info.context else None
+        if form == "auto":
+            return self.optimal_value_form()
+        if form not in (None, "dense", "sparse"):
+            raise ValueError(
+                f"value_form must be 'dense', 'sparse' or 'auto', not {form!r}"
+            )
+        return form
+
     @field_validator("updated", mode="after")
     @classmethod
     def validate_updated_date(cls, v: str | None) -> str | None:
         """Validates the updated date is in ISO 8601 format."""
-        if v and not is_valid_iso_date(v):
-            raise JSONStatValidationError(
-                f"Updated date: '{v}' is an invalid ISO 8601 format."
-            )
+        check_updated(v)
         return v
 
     @field_validator("link", mode="before")
@@ -199,108 +740,133 @@ class Dataset(JSONStatBaseModel):
         if not isinstance(data, dict):
             return data
 
-        allowed_types = {e.value for e in LinkRelationType}
-        invalid_keys = [key for key in data if key not in allowed_types]
-        if invalid_keys:
-            raise JSONStatValidationError(
-                f"Invalid link relation types: {invalid_keys}. Must be one of: {allowed_types}"
-            )
+        check_link_relations(data, LINK_RELATION_TYPES)
         return data
 
+    @field_validator("value", mode="plain", json_schema_input_type=ValueType)
+    @classmethod
+    def validate_value(
+        cls, v: object, info: ValidationInfo
+    ) -> list | dict | CompactValues:
+        """Validate the cells in one pass, instead of a union match per cell.
+
+        Numeric lists are stored compactly if the `compact_values` validation
+        context entry is set (see `jsonstat_validator.values.CompactValues`).
+        """
+        compact = bool(info.context and info.context.get("compact_values"))
+        return validate_values(v, compact=compact)
+
+    @field_validator("status", mode="plain", json_schema_input_type=StatusType)
+    @classmethod
+    def validate_status(cls, v: object) -> str | list | dict | None:
+        """Validate the status cells in one pass."""
+        return validate_status(v)
+
+    @field_serializer("value", mode="wrap")
+    def serialize_value(
+        self,
+        v: list | dict | CompactValues,
+        handler: SerializerFunctionWrapHandler,
+        info: SerializationInfo,
+    ) -> list | dict:
+        """Serialize compact values as the list they were built from.
+
+        The `value_form` serialization context entry ("dense", "sparse", or
+        "auto" for the smaller of the two) converts the value to that form.
+        """
+        form = self._value_form(info)
+        if form == "dense":
+            v = dense_values(v, self.n_cells)
+        elif form == "sparse":
+            v = sparse_values(v)
+        if isinstance(v, CompactValues):
+            return v.tolist()
+        return handler(v)
+
+    @field_serializer("status", mode="wrap")
+    def serialize_status(
+        self,
+        v: str | list | dict | None,
+        handler: SerializerFunctionWrapHandler,
+        info: SerializationInfo,
+    ) -> str | list | dict | None:
+        """Serialize a per-cell status in the same form as `value`."""
+        form = self._value_form(info)
+        if form == "dense":
+            v = dense_status(v, self.n_cells)
+        elif form == "sparse":
+            v = sparse_status(v)
+        return handler(v)
+
+    @field_validator("dimension", mode="wrap")
+    @classmethod
+    def validate_dimension_cached(
+        cls,
+        data: object,
+        handler: ValidatorFunctionWrapHandler,
+        info: ValidationInfo,
+    ) -> dict[str, DatasetDimension]:
+        """Reuse dimensions validated before, if a cache is given.
+
+        The cache is passed as the `dimension_cache` validation context entry
+        (see `jsonstat_validator.cache.DimensionCache`).
+        """
+        cache = info.context.get("dimension_cache") if info.context else None
+        if cache is None or not isinstance(data, dict):
+            return handler(data)
+
+        keys = {}
+        resolved = {}
+        for dim_id, raw in data.items():
+            key = cache.key(raw) if isinstance(raw, dict) else None
+            if key is not None:
+                cached = cache.get(key)
+                if cached is not None:
+                    resolved[dim_id] = cached
+                    continue
+                keys[dim_id] = key
+            resolved[dim_id] = raw
+
+        dimension = handler(resolved)
+        for dim_id, key in keys.items():
+            cache.put(key, dimension[dim_id])
+        return dimension
+
     @field_validator("role", mode="after")
     @classmethod
     def validate_role(cls, v: DatasetRole | None) -> DatasetRole | None:
         """Validate that role references are valid."""
         if v:
-            all_values = [
-                value
-                for values in v.model_dump().values()
-                if values is not None
-                for value in values
-            ]
-            duplicates = [
-                item for item, count in Counter(all_values).items() if count > 1
-            ]
-            if duplicates:
-                raise JSONStatValidationError(
-                    f"Dimension(s): {', '.join(duplicates)} referenced in multiple roles. Each dimension can only be referenced in one role."
-                )
+            check_role_references((v.time, v.geo, v.metric))
         return v
 
     @model_validator(mode="after")
     def validate_dataset(self) -> Dataset:
         """Dataset-wide validation checks."""
-        # siez, id: length must match
-        if len(self.size) != len(self.id):
-            raise JSONStatValidationError(
-                f"Size array length ({len(self.size)}) must match ID array length ({len(self.id)})"
+        category_counts = []
+        for dim_id in self.id:
+            dim = self.dimension.get(dim_id)
+            category = dim.category if dim else None
+            category_counts.append(
+                category_count(category.index, category.label) if category else None
             )
-
-        # size: non-negative
-        if any((s is None) or (s < 0) for s in self.size):
-            raise JSONStatValidationError(
-                "All `size` values must be non-negative integers."
-            )
-        # id: unique
-        if len(set(self.id)) != len(self.id):
-            raise JSONStatValidationError("Dimension IDs in `id` must be unique.")
-
-        # dimension: no missing, no extras
-        missing_dims = [dim_id for dim_id in self.id if dim_id not in self.dimension]
-        if missing_dims:
-            raise JSONStatValidationError(
-                f"Missing dimension definitions: {', '.join(missing_dims)}"
-            )
-
-        extra_dims = [dim_id for dim_id in self.dimension if dim_id not in self.id]
-        if extra_dims:
-            raise JSONStatValidationError(
-                f"Unexpected dimensions not listed in `id`: {', '.join(extra_dims)}"
-            )
-
-        # role membership (if role provided)
-        if self.role:
-            role_dims = []
-            for group in (
-                (self.role.time or []),
-                (self.role.geo or []),
-                (self.role.metric or []),
-            ):
-                role_dims.extend(group)
-            unknown_role_dims = [d for d in role_dims if d not in self.id]
-            if unknown_role_dims:
-                raise JSONStatValidationError(
-                    f"Role references unknown dimensions: {', '.join(unknown_role_dims)}"
-                )
-
-        # status: when array, length must match value length or be single value
-        if isinstance(self.status, list) and len(self.status) not in (
+        check_dataset(
+            self.id,
+            self.size,
+            self.dimension,
+            (self.role.time, self.role.geo, self.role.metric) if self.role else None,
             len(self.value),
-            1,
-        ):
-            raise JSONStatValidationError(
-                f"Status list must match value length ({len(self.value)}) or be single value"
-            )
-
-        # align size[i] with inline category counts when available
-        for i, dim_id in enumerate(self.id):
-            dim = self.dimension[dim_id]
-            if dim.category:
-                idx = dim.category.index
-                if isinstance(idx, list) or isinstance(idx, dict):  # noqa: SIM101
-                    expected_size = len(idx)
-                elif dim.category.label:
-                    expected_size = 1  # constant dimension
-                else:
-                    expected_size = None
-                if expected_size is not None and self.size[i] != expected_size:
-                    raise JSONStatValidationError(
-                        f"`size[{i}]` for dimension '{dim_id}' must equal number of categories ({expected_size})"
-                    )
-
-        # link: only collections may use 'item' relation
-        if self.link and "item" in self.link:
-            raise JSONStatValidationError(
-                "Only collections may use 'item' relation in 'link'."
-            )
+            self.status,
+            category_counts,
+            self.link,
+        )
+        if isinstance(self.value, dict):
+            check_cell_keys("value", self.value, self.n_cells)
+            if isinstance(self.status, list) and len(self.status) > 1:
+                # A status per stored value: key each by the cell of its value.
+                self.status = dict(zip(self.value, self.status, strict=True))
+        else:
+            check_value_length(len(self.value), self.n_cells)
+        if isinstance(self.status, dict):
+            check_cell_keys("status", self.status, self.n_cells)
         return self
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Literal
+from collections.abc import Mapping
+from typing import Annotated, Any, Literal
 
 from pydantic import AnyUrl, Field, field_validator, model_validator
 
 from jsonstat_validator.models.base import JSONStatBaseModel, JSONStatSchema
 from jsonstat_validator.models.category import Category
-from jsonstat_validator.models.link import Link, LinkRelationType
-from jsonstat_validator.utils import JSONStatValidationError, is_valid_iso_date
+from jsonstat_validator.models.link import LINK_RELATION_TYPES, Link, trusted_links
+from jsonstat_validator.rules import (
+    check_dimension,
+    check_link_relations,
+    check_no_item_relation,
+    check_updated,
+)
 
 
 class Dimension(JSONStatBaseModel):
@@ -100,24 +106,24 @@ class Dimension(JSONStatBaseModel):
     @classmethod
     def validate_updated_date(cls, v: str | None) -> str | None:
         """Validates the updated date is in ISO 8601 format."""
-        if v and not is_valid_iso_date(v):
-            raise JSONStatValidationError(
-                f"Updated date: '{v}' is an invalid ISO 8601 format."
-            )
+        check_updated(v)
         return v
 
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any]) -> Dimension:
+        """Build a dimension from already validated data, skipping validation."""
+        data = dict(data)
+        if data.get("category") is not None:
+            data["category"] = Category.from_trusted(data["category"])
+        if data.get("link") is not None:
+            data["link"] = trusted_links(data["link"])
+        return super().from_trusted(data)
+
     @model_validator(mode="after")
     def validate_link_relations(self) -> Dimension:
-        if self.link and "item" in self.link:
-            raise JSONStatValidationError(
-                "Only collections may use 'item' relation in 'link'."
-            )
+        check_no_item_relation(self.link)
         # Validate that category or href is provided
-        if not self.category and not self.href:
-            raise JSONStatValidationError(
-                "A category is required if a reference (href) is not provided. "
-                "For an example, see: https://json-stat.org/full/#href"
-            )
+        check_dimension(self.category is not None, self.href is not None)
         return self
 
 
@@ -210,12 +216,19 @@ class DatasetDimension(JSONStatBaseModel):
     @classmethod
     def validate_updated_date(cls, v: str | None) -> str | None:
         """Validates the updated date is in ISO 8601 format."""
-        if v and not is_valid_iso_date(v):
-            raise JSONStatValidationError(
-                f"Updated date: '{v}' is an invalid ISO 8601 format."
-            )
+        check_updated(v)
         return v
 
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any]) -> DatasetDimension:
+        """Build a dimension from already validated data, skipping validation."""
+        data = dict(data)
+        if data.get("category") is not None:
+            data["category"] = Category.from_trusted(data["category"])
+        if data.get("link") is not None:
+            data["link"] = trusted_links(data["link"])
+        return super().from_trusted(data)
+
     @field_validator("link", mode="before")
     @classmethod
     def validate_link_relations(cls, data: dict | str | None) -> dict | str | None:
@@ -223,26 +236,14 @@ class DatasetDimension(JSONStatBaseModel):
         if not isinstance(data, dict):
             return data
 
-        allowed_types = {e.value for e in LinkRelationType}
-        invalid_keys = [key for key in data if key not in allowed_types]
-        if invalid_keys:
-            raise JSONStatValidationError(
-                f"Invalid link relation types: {invalid_keys}. Must be one of: {allowed_types}"
-            )
+        check_link_relations(data, LINK_RELATION_TYPES)
         return data
 
     @model_validator(mode="after")
     def validate_dataset_dimension(self) -> DatasetDimension:
         """Dataset dimension-wide validation checks."""
-        if not self.category and not self.href:
-            raise JSONStatValidationError(
-                "A category is required if a reference (href) is not provided. "
-                "For an example, see: https://json-stat.org/full/#href"
-            )
+        check_dimension(self.category is not None, self.href is not None)
 
         # link: only collections may use 'item' relation
-        if self.link and "item" in self.link:
-            raise JSONStatValidationError(
-                "Only collections may use 'item' relation in 'link'."
-            )
+        check_no_item_relation(self.link)
         return self
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from enum import Enum
 from typing import Annotated, Literal
 
 from pydantic import AnyUrl, Field, field_validator, model_validator
 
-from jsonstat_validator.models.base import JSONStatBaseModel
-from jsonstat_validator.utils import JSONStatValidationError, is_valid_iso_date
+from jsonstat_validator.models.base import JSONStatBaseModel, JSONStatSchema
+from jsonstat_validator.rules import check_link, check_updated
 
 
 class Link(JSONStatBaseModel):
@@ -64,10 +65,7 @@ class Link(JSONStatBaseModel):
     @field_validator("updated", mode="after")
     @classmethod
     def validate_updated_date(cls, v: str | None) -> str | None:
-        if v and not is_valid_iso_date(v):
-            raise JSONStatValidationError(
-                f"Updated date: '{v}' is an invalid ISO 8601 format."
-            )
+        check_updated(v)
         return v
 
     @field_validator("href", mode="before")
@@ -80,11 +78,33 @@ class Link(JSONStatBaseModel):
 
     @model_validator(mode="after")
     def validate_link(self) -> Link:
-        if self.href is None and self.class_ is None:
-            raise JSONStatValidationError("Link objects must include an 'href'.")
+        check_link(self.href, self.class_)
         return self
 
 
+# Member names of a Link object, by field name and by alias.
+_LINK_KEYS = frozenset(
+    key for name, field in Link.model_fields.items() for key in (name, field.alias)
+) - {None}
+
+
+def trusted_links(link: Mapping[str, list]) -> dict[str, list[Link | JSONStatSchema]]:
+    """Build the `link` member of a model from already validated data.
+
+    Link objects are built without validation; embedded JSON-stat documents
+    (which only appear as collection items) are validated as usual.
+    """
+    return {
+        relation: [
+            Link.from_trusted(item)
+            if item.keys() <= _LINK_KEYS
+            else JSONStatSchema.model_validate(item)
+            for item in items
+        ]
+        for relation, items in link.items()
+    }
+
+
 class LinkRelationType(str, Enum):
     """Link relation types allowed in JSON-stat.
 
@@ -171,3 +191,6 @@ class LinkRelationType(str, Enum):
     WEBMENTION = "webmention"
     WORKING_COPY = "working-copy"
     WORKING_COPY_OF = "working-copy-of"
+
+
+LINK_RELATION_TYPES = frozenset(e.value for e in LinkRelationType)
@@ -0,0 +1,418 @@
+"""Validation rules shared by the models and the check-only engine.
+
+Every rule works on plain Python data (lists, dicts, strings and numbers), so it
+can run inside the model validators as well as directly against a decoded JSON
+document (see `jsonstat_validator.lint`). Keeping the rules in one place keeps
+both validation modes in sync.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from collections.abc import Collection, Iterable, Mapping, Sequence
+from itertools import chain, filterfalse, islice
+from operator import countOf, itemgetter
+
+from jsonstat_validator.utils import JSONStatValidationError, is_valid_iso_date
+
+# Python types accepted for `value` and `status` entries.
+VALUE_TYPES = frozenset((int, float, str, bool, type(None)))
+STATUS_TYPES = frozenset((str,))
+
+# Number of offending dict-form `value`/`status` keys listed in an error.
+MAX_REPORTED_KEYS = 5
+
+
+def first_invalid(items: Iterable, allowed: Collection[type]) -> int | None:
+    """Return the position of the first item whose type is not `allowed`.
+
+    Homogeneous sequences are decided by a single pass over the item types; the
+    position is only searched for when an offender exists.
+    """
+    if set(map(type, items)) <= allowed:
+        return None
+    return next(i for i, item in enumerate(items) if type(item) not in allowed)
+
+
+def check_updated(updated: str | None) -> None:
+    """Check that an `updated` date is in ISO 8601 format."""
+    if updated and not is_valid_iso_date(updated):
+        raise JSONStatValidationError(
+            f"Updated date: '{updated}' is an invalid ISO 8601 format."
+        )
+
+
+def check_link_relations(relations: Iterable[str], allowed: Collection[str]) -> None:
+    """Check that link relations are among the `allowed` relation types."""
+    invalid_keys = [key for key in relations if key not in allowed]
+    if invalid_keys:
+        raise JSONStatValidationError(
+            f"Invalid link relation types: {invalid_keys}. Must be one of: {set(allowed)}"
+        )
+
+
+def check_no_item_relation(link: Collection[str] | None) -> None:
+    """Check that a non-collection does not use the `item` relation."""
+    if link and "item" in link:
+        raise JSONStatValidationError(
+            "Only collections may use 'item' relation in 'link'."
+        )
+
+
+def check_link(href: object | None, class_: str | None) -> None:
+    """Link-wide validation checks."""
+    if href is None and class_ is None:
+        raise JSONStatValidationError("Link objects must include an 'href'.")
+
+
+def check_collection(link: Mapping[str, object] | None) -> None:
+    """Collection-wide validation checks."""
+    if not link:
+        return
+    if "item" not in link:
+        raise JSONStatValidationError("Collection links must use 'item' relation type.")
+    # Values must be lists
+    for rel, entries in link.items():
+        if not isinstance(entries, list):
+            raise JSONStatValidationError(f"Relation '{rel}' must be a list.")
+
+
+def check_dimension(has_category: bool, has_href: bool) -> None:
+    """Check that a dimension has a category or a reference to one."""
+    if not has_category and not has_href:
+        raise JSONStatValidationError(
+            "A category is required if a reference (href) is not provided. "
+            "For an example, see: https://json-stat.org/full/#href"
+        )
+
+
+def category_positions(
+    index: list[str] | dict[str, int] | None, label: dict[str, str] | None
+) -> dict[str, int]:
+    """Return the position of each category ID.
+
+    The IDs come from `index` or, for a constant dimension, from `label`. A dict
+    `index` is ranked by its values, so gapped or offset positions still run
+    from 0 to n-1 (ties keep their order in `index`). A list `index` with
+    duplicate IDs yields fewer positions than IDs.
+    """
+    if isinstance(index, dict) and index:
+        ranked = sorted(index, key=index.__getitem__)
+        return dict(zip(ranked, range(len(ranked)), strict=True))
+    if index:
+        return dict(zip(index, range(len(index)), strict=True))
+    return dict(zip(label or (), range(len(label or ())), strict=True))
+
+
+def check_category(
+    index: list[str] | dict[str, int] | None,
+    label: dict[str, str] | None,
+    child: dict[str, list[str]] | None,
+    coordinates: dict[str, list] | None,
+    unit: Collection[str] | None,
+    positions: Mapping[str, int] | None = None,
+) -> None:
+    """Category-wide validation checks.
+
+    Args:
+        positions: The position of each category ID (see `category_positions`),
+            if already known; every membership check is a lookup in it
+    """
+    # index, label: at least one of index or label is required
+    if index is None and label is None:
+        raise JSONStatValidationError("At least one of `index` or `label` is required.")
+    if positions is None:
+        positions = category_positions(index, label)
+
+    # index, label: same keys if both are dictionaries
+    if index and label and isinstance(label, dict) and positions.keys() != label.keys():
+        raise JSONStatValidationError("`index` and `label` must have the same keys.")
+
+    # index list: unique IDs
+    if isinstance(index, list) and len(positions) != len(index):
+        raise JSONStatValidationError("Category IDs in `index` list must be unique.")
+
+    # coordinates: keys must be valid categories
+    # and values must be length-2 lists of numbers (longitude, latitude).
+    if coordinates and not _valid_coordinates(coordinates, positions):
+        for key, value in coordinates.items():
+            if key not in positions:
+                raise JSONStatValidationError(
+                    f"Trying to set coordinates for category ID: {key} "
+                    "but it is not defined neither in `index` nor in `label`."
+                )
+            if not isinstance(value, list) or len(value) != 2:
+                raise JSONStatValidationError(
+                    f"Coordinates for category {key} must be a list of 2 numbers: (longitude, latitude)."
+                )
+
+    # child: references an existing parent
+    if child:
+        invalid_parent = _first_unknown(child, positions)
+        for parent, children in child.items():
+            if parent == invalid_parent:
+                raise JSONStatValidationError(
+                    f"Invalid parent: {parent} in the `child` field."
+                )
+            invalid_child = _first_unknown(children, positions)
+            if invalid_child is not None:
+                raise JSONStatValidationError(
+                    f"Invalid child: {invalid_child} in `child[{parent}]`."
+                )
+        check_child_cycles(child)
+
+    # unit: keys must exist
+    if unit:
+        invalid_unit = _first_unknown(unit, positions)
+        if invalid_unit is not None:
+            raise JSONStatValidationError(
+                f"Invalid unit: {invalid_unit} in the `unit` field."
+            )
+
+
+def check_child_cycles(child: Mapping[str, Sequence[str]]) -> None:
+    """Check that no category is its own ancestor through `child`.
+
+    Categories are peeled off from the top of the hierarchy down, each parent
+    once its own parents are done (Kahn's algorithm), in linear time. Parents
+    left over lie on or below a cycle, traced back through their parents for
+    the error.
+    """
+    pending = Counter(chain.from_iterable(child.values()))
+    stack = [parent for parent in child if parent not in pending]
+    while stack:
+        for category_id in child.get(stack.pop(), ()):
+            pending[category_id] -= 1
+            if not pending[category_id]:
+                stack.append(category_id)
+    left = {category_id for category_id, count in pending.items() if count > 0}
+    if not left:
+        return
+    # Every category left has a parent left: walk up until one repeats.
+    parent_of = {
+        category_id: parent
+        for parent, children in child.items()
+        if parent in left
+        for category_id in children
+        if category_id in left
+    }
+    path = [next(parent for parent in child if parent in left)]
+    seen = {path[0]: 0}
+    while (parent := parent_of[path[-1]]) not in seen:
+        seen[parent] = len(path)
+        path.append(parent)
+    cycle = [parent, *reversed(path[seen[parent] :])]
+    raise JSONStatValidationError(f"Cycle in `child`: {' -> '.join(cycle)}.")
+
+
+def _first_unknown(ids: Iterable[str], positions: Mapping[str, int]) -> str | None:
+    """Return the first ID without a position, scanning the IDs in C."""
+    return next(filterfalse(positions.__contains__, ids), None)
+
+
+def _valid_coordinates(
+    coordinates: Mapping[str, list], positions: Mapping[str, int]
+) -> bool:
+    """Check all coordinates at once; offenders are located by the caller."""
+    values = coordinates.values()
+    return (
+        _first_unknown(coordinates, positions) is None
+        and set(map(type, values)) <= {list}
+        and set(map(len, values)) <= {2}
+    )
+
+
+def category_count(
+    index: list[str] | dict[str, int] | None, label: dict[str, str] | None
+) -> int | None:
+    """Return the number of categories declared inline, if known."""
+    if isinstance(index, list | dict):
+        return len(index)
+    if label:
+        return 1  # constant dimension
+    return None
+
+
+def check_dataset_role(
+    time: list[str] | None, geo: list[str] | None, metric: list[str] | None
+) -> None:
+    """Dataset role-wide validation checks.
+
+    - At least one role must be provided.
+    - Each dimension can only be referenced in one role.
+    """
+    if not time and not geo and not metric:
+        raise JSONStatValidationError("At least one role must be provided.")
+    if (
+        time
+        and geo
+        and metric
+        and len(set(time + geo + metric)) != len(time + geo + metric)
+    ):
+        raise JSONStatValidationError(
+            "Each dimension can only be referenced in one role."
+        )
+
+
+def check_role_references(roles: Iterable[list[str] | None]) -> None:
+    """Check that no dimension is referenced by more than one role."""
+    all_values = [value for values in roles if values is not None for value in values]
+    duplicates = [item for item, count in Counter(all_values).items() if count > 1]
+    if duplicates:
+        raise JSONStatValidationError(
+            f"Dimension(s): {', '.join(duplicates)} referenced in multiple roles. Each dimension can only be referenced in one role."
+        )
+
+
+def check_value_length(value_length: int, n_cells: int) -> None:
+    """Check that a dense `value` has one entry per cell of the cube."""
+    if value_length != n_cells:
+        raise JSONStatValidationError(
+            f"Value array length ({value_length}) must match the number of cells "
+            f"({n_cells}), the product of `size`"
+        )
+
+
+def cell_positions(keys: Sequence[str]) -> array | list[int] | None:
+    """Parse dict-form `value`/`status` keys into an array of cell positions.
+
+    The keys are checked and parsed in bulk. Returns None unless every key is a
+    position in canonical form (ASCII digits without leading zeros); positions
+    beyond int64, in cubes of more cells, come as a list of Python ints.
+    """
+    if not keys:
+        return array("q")
+    joined = "".join(keys)
+    if not (joined.isascii() and joined.isdigit()) or "" in keys:
+        return None
+    # Only "0" itself may start with a zero.
+    if countOf(map(itemgetter(0), keys), "0") != countOf(keys, "0"):
+        return None
+    positions = list(map(int, keys))
+    try:
+        return array("q", positions)
+    except OverflowError:
+        return positions
+
+
+def _is_position(key: object, n_cells: int | None) -> bool:
+    if not isinstance(key, str) or not (key.isascii() and key.isdigit()):
+        return False
+    if key[0] == "0" and key != "0":
+        return False
+    return n_cells is None or int(key) < n_cells
+
+
+def check_cell_keys(
+    name: str,
+    keys: Iterable[str],
+    n_cells: int | None,
+    max_reported: int = MAX_REPORTED_KEYS,
+) -> array | list[int]:
+    """Check that dict-form `value`/`status` keys are positions inside the cube.
+
+    Runs in linear time; on failure only the first `max_reported` offending
+    keys are searched for and listed.
+
+    Args:
+        name: "value" or "status", for the error message
+        keys: The keys of the dict
+        n_cells: The number of cells of the cube (the product of `size`), or
+            None to check the form of the keys only
+        max_reported: Maximum number of offending keys listed in the error
+
+    Returns:
+        The positions given by the keys
+    """
+    keys = list(keys)
+    positions = cell_positions(keys)
+    if positions is not None and (
+        n_cells is None or not positions or max(positions) < n_cells
+    ):
+        return positions
+    offenders = list(
+        islice(filterfalse(lambda key: _is_position(key, n_cells), keys), max_reported)
+    )
+    bound = "" if n_cells is None else f" below {n_cells}"
+    raise JSONStatValidationError(
+        f"`{name}` keys must be cell positions{bound}; invalid keys: "
+        f"{', '.join(map(repr, offenders))}"
+    )
+
+
+def check_dataset(
+    id: Sequence[str],
+    size: Sequence[int | None],
+    dimension: Collection[str],
+    role: Iterable[list[str] | None] | None,
+    value_length: int,
+    status: object,
+    category_counts: Sequence[int | None],
+    link: Collection[str] | None,
+) -> None:
+    """Dataset-wide validation checks.
+
+    Args:
+        id: The dataset `id`
+        size: The dataset `size`
+        dimension: The IDs of the dimensions defined in `dimension`
+        role: The dimension IDs of each role, if roles are provided
+        value_length: The number of entries in `value`
+        status: The dataset `status`
+        category_counts: For each dimension in `id`, the number of categories
+            declared inline (see `category_count`)
+        link: The link relations of the dataset
+    """
+    # siez, id: length must match
+    if len(size) != len(id):
+        raise JSONStatValidationError(
+            f"Size array length ({len(size)}) must match ID array length ({len(id)})"
+        )
+
+    # size: non-negative
+    if any((s is None) or (s < 0) for s in size):
+        raise JSONStatValidationError(
+            "All `size` values must be non-negative integers."
+        )
+    # id: unique
+    if len(set(id)) != len(id):
+        raise JSONStatValidationError("Dimension IDs in `id` must be unique.")
+
+    # dimension: no missing, no extras
+    missing_dims = [dim_id for dim_id in id if dim_id not in dimension]
+    if missing_dims:
+        raise JSONStatValidationError(
+            f"Missing dimension definitions: {', '.join(missing_dims)}"
+        )
+
+    extra_dims = [dim_id for dim_id in dimension if dim_id not in id]
+    if extra_dims:
+        raise JSONStatValidationError(
+            f"Unexpected dimensions not listed in `id`: {', '.join(extra_dims)}"
+        )
+
+    # role membership (if role provided)
+    if role:
+        role_dims = [dim_id for group in role for dim_id in group or []]
+        unknown_role_dims = [d for d in role_dims if d not in id]
+        if unknown_role_dims:
+            raise JSONStatValidationError(
+                f"Role references unknown dimensions: {', '.join(unknown_role_dims)}"
+            )
+
+    # status: when array, length must match value length or be single value
+    if isinstance(status, list) and len(status) not in (value_length, 1):
+        raise JSONStatValidationError(
+            f"Status list must match value length ({value_length}) or be single value"
+        )
+
+    # align size[i] with inline category counts when available
+    for i, (dim_id, expected_size) in enumerate(zip(id, category_counts, strict=True)):
+        if expected_size is not None and size[i] != expected_size:
+            raise JSONStatValidationError(
+                f"`size[{i}]` for dimension '{dim_id}' must equal number of categories ({expected_size})"
+            )
+
+    # link: only collections may use 'item' relation
+    check_no_item_relation(link)
@@ -0,0 +1,316 @@
+"""Streaming validator for large JSON-stat documents.
+
+The regular validator needs the whole document as a Python dict. For datasets
+with millions of cells the `value` (and `status`) arrays dominate memory, so
+this module parses the document incrementally: every top-level member except
+`value` and `status` is decoded as usual and validated through the models,
+while `value` and `status` are checked batch by batch and never materialized.
+"""
+
+from __future__ import annotations
+
+import codecs
+import heapq
+import json
+import math
+import re
+from collections.abc import Iterator, Sequence
+from itertools import chain
+from pathlib import Path
+from typing import IO, Any
+
+from pydantic import TypeAdapter
+
+from jsonstat_validator.rules import (
+    MAX_REPORTED_KEYS,
+    STATUS_TYPES,
+    VALUE_TYPES,
+    check_cell_keys,
+    check_value_length,
+    first_invalid,
+)
+from jsonstat_validator.utils import JSONStatValidationError, validation_error
+from jsonstat_validator.validator import format_error_location, validate_jsonstat
+
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+# An escape sequence in a JSON string (its first two characters).
+_ESCAPE = re.compile(r"\\.", re.DOTALL)
+_STREAMED_FIELDS = ("value", "status")
+_SIZE = TypeAdapter(list[int])
+
+
+class _JSONStream:
+    """Minimal pull parser over a text or binary file object.
+
+    Only the pieces needed to walk the top-level object of a JSON-stat document
+    are implemented; complete members are decoded with the standard library
+    decoder, so the parser itself only deals with delimiters.
+    """
+
+    def __init__(self, fp: IO[Any], chunk_size: int = CHUNK_SIZE) -> None:
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._bytes_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buf = ""
+        self._pos = 0
+        self._offset = 0  # absolute position of self._buf[0]
+        self._eof = False
+
+    def _fill(self, min_chars: int = 1) -> bool:
+        """Read chunks until at least `min_chars` unconsumed chars are buffered."""
+        if self._pos:
+            self._buf = self._buf[self._pos :]
+            self._offset += self._pos
+            self._pos = 0
+        while len(self._buf) < min_chars and not self._eof:
+            chunk = self._fp.read(self._chunk_size)
+            if not chunk:
+                self._eof = True
+                self._buf += self._bytes_decoder.decode(b"", final=True)
+            elif isinstance(chunk, bytes):
+                self._buf += self._bytes_decoder.decode(chunk)
+            else:
+                self._buf += chunk
+        return len(self._buf) >= min_chars
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume `char`, raising if the next token is something else."""
+        found = self.peek()
+        if found != char:
+            raise _unexpected(f"'{char}'", found)
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode one complete JSON value."""
+        self.peek()
+        want = len(self._buf) - self._pos
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                if self._eof:
+                    raise validation_error(
+                        "", f"Invalid JSON: {e}", "json_invalid"
+                    ) from e
+            else:
+                # A number cut by the end of the buffer decodes as a shorter one;
+                # retry while everything after it could still be part of it.
+                if self._eof or self._buf[end:].lstrip(_NUMBER_CHARS):
+                    self._pos = end
+                    return obj
+            # Grow geometrically so a large member is re-decoded O(log n) times.
+            want = max(want * 2, self._chunk_size)
+            self._fill(want)
+
+    def items(self, close: str) -> Iterator[list]:
+        """Yield the members of the current array or object in batches.
+
+        Each batch decodes everything buffered up to the last comma outside a
+        string in one call. A cut inside a nested container (or past the end of the
+        container) still makes the batch invalid JSON; the members up to the
+        cut are then decoded one at a time, which also locates syntax errors.
+        """
+        is_object = close == "}"
+        if self.peek() == close:
+            self._pos += 1
+            return
+        while True:
+            if len(self._buf) - self._pos < self._chunk_size:
+                self._fill(self._chunk_size)
+            cut = self._buf.rfind(",", self._pos)
+            if cut > self._pos:
+                cut = self._pos + _last_comma(self._buf[self._pos : cut + 1])
+            if cut > self._pos:
+                text = self._buf[self._pos : cut]
+                try:
+                    if is_object:
+                        batch = json.loads("{" + text + "}", object_pairs_hook=list)
+                    else:
+                        batch = json.loads("[" + text + "]")
+                except json.JSONDecodeError:
+                    pass
+                else:
+                    self._pos = cut + 1
+                    yield batch
+                    continue
+            cut = self._buf.rfind(",", self._pos) + self._offset
+            while True:
+                yield [self._member(is_object)]
+                separator = self.peek()
+                if separator == close:
+                    self._pos += 1
+                    return
+                if separator != ",":
+                    raise _unexpected(f"',' or '{close}'", separator)
+                self._pos += 1
+                if self._offset + self._pos > cut:
+                    break
+
+    def _member(self, is_object: bool) -> Any:
+        if not is_object:
+            return self.value()
+        key = self.value()
+        if not isinstance(key, str):
+            raise validation_error(
+                "", "Invalid JSON: object keys must be strings", "json_invalid"
+            )
+        self.expect(":")
+        return key, self.value()
+
+
+def _last_comma(text: str) -> int:
+    """Return the index of the last comma of `text` outside a string, or -1.
+
+    `text` starts at a member and ends with a comma. Once escaped quotes are blanked out (with the
+    other escapes, keeping offsets), an odd number of quotes means that the
+    last string is cut by the end of `text`, so the last comma before its
+    opening quote is taken.
+    """
+    if '\\"' in text:
+        text = _ESCAPE.sub("__", text)
+    if text.count('"') % 2 == 0:
+        return text.rfind(",")
+    return text.rfind(",", 0, text.rfind('"'))
+
+
+def _unexpected(expected: str, found: str) -> JSONStatValidationError:
+    return validation_error(
+        "",
+        f"Invalid JSON: expected {expected} but found "
+        f"{repr(found) if found else 'end of input'}",
+        "json_invalid",
+    )
+
+
+def _check_batch(name: str, items: list, keys: Sequence) -> None:
+    """Check the members of a `value`/`status` batch, reporting the first offender."""
+    invalid = first_invalid(items, VALUE_TYPES if name == "value" else STATUS_TYPES)
+    if invalid is None:
+        return
+    loc = format_error_location(("dataset", name, keys[invalid]))
+    if name == "value":
+        raise validation_error(
+            loc, "Input should be a valid number, string or null", "value_type"
+        )
+    raise validation_error(loc, "Input should be a valid string", "string_type")
+
+
+def _stream_member(stream: _JSONStream, name: str) -> tuple[str, int, list] | Any:
+    """Check a `value`/`status` member, returning its form, length and top keys.
+
+    The top keys are the largest positions of a dict, checked against the cube
+    size once the metadata is known. Scalars (a single status string, or
+    invalid input) are returned as-is so the models can validate them.
+    """
+    opener = stream.peek()
+    if not opener or opener not in "[{":
+        return stream.value()
+    stream.expect(opener)
+    count = 0
+    if opener == "[":
+        for batch in stream.items("]"):
+            _check_batch(name, batch, range(count, count + len(batch)))
+            count += len(batch)
+        return ("list", count, [])
+    largest: list[int] = []
+    for batch in stream.items("}"):
+        keys, items = zip(*batch, strict=True)
+        _check_batch(name, list(items), list(keys))
+        positions = check_cell_keys(name, keys, None)
+        largest = heapq.nlargest(MAX_REPORTED_KEYS, chain(largest, positions))
+        count += len(batch)
+    return ("dict", count, sorted(largest))
+
+
+def validate_jsonstat_stream(
+    fp: IO[str] | IO[bytes] | Path, *, chunk_size: int = CHUNK_SIZE
+) -> bool:
+    """Validate a JSON-stat document incrementally from a file.
+
+    Memory use is bounded by `chunk_size` plus the size of the metadata
+    (everything except the `value` and `status` arrays), no matter how many
+    cells the dataset has.
+
+    Args:
+        fp: A text or binary file object, or the path of a JSON-stat file
+        chunk_size: Number of characters (or bytes) read at a time
+
+    Returns:
+        bool: True if valid, raises JSONStatValidationError otherwise
+
+    Raises:
+        JSONStatValidationError: If the data does not conform to the JSON-stat
+                                 specification or is not valid JSON
+    """
+    if isinstance(fp, Path):
+        with fp.open("rb") as f:
+            return validate_jsonstat_stream(f, chunk_size=chunk_size)
+
+    stream = _JSONStream(fp, chunk_size)
+    header: dict[str, Any] = {}
+    streamed: dict[str, tuple[str, int, list]] = {}
+    stream.expect("{")
+    if stream.peek() == "}":
+        stream.expect("}")
+    else:
+        while True:
+            key = stream.value()
+            stream.expect(":")
+            if key in _STREAMED_FIELDS:
+                member = _stream_member(stream, key)
+                if isinstance(member, tuple):
+                    streamed[key] = member
+                else:
+                    header[key] = member
+            else:
+                header[key] = stream.value()
+            if stream.peek() == ",":
+                stream.expect(",")
+                continue
+            stream.expect("}")
+            break
+    if stream.peek():
+        raise validation_error("", "Invalid JSON: trailing characters", "json_invalid")
+
+    if header.get("class") != "dataset":
+        # Only datasets carry cell data; let the models report misplaced members.
+        for key, (form, _, _) in streamed.items():
+            header[key] = [] if form == "list" else {}
+        return validate_jsonstat(header)
+
+    # Validate metadata with an empty stand-in; the streamed lengths are checked
+    # below against the same rules the Dataset model applies.
+    if "value" in streamed:
+        header["value"] = {}
+    validate_jsonstat(header)
+
+    n_cells = math.prod(_SIZE.validate_python(header["size"]))
+    for key, (form, length, largest) in streamed.items():
+        if form == "dict":
+            check_cell_keys(key, map(str, largest), n_cells)
+        elif key == "value":
+            check_value_length(length, n_cells)
+    if "status" in streamed:
+        status_form, status_len, _ = streamed["status"]
+        value_len = streamed["value"][1] if "value" in streamed else 0
+        if status_form == "list" and status_len not in (value_len, 1):
+            raise JSONStatValidationError(
+                f"Status list must match value length ({value_len}) or be single value"
+            )
+    return True
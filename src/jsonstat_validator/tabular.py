@@ -0,0 +1,156 @@
+"""Collection of long-format rows into the cells of a cube.
+
+Long-format data has a row per cell: a column per dimension holding the
+category, plus a value and, optionally, a status column. `collect_rows` reads
+the rows once, in chunks, assigning category positions through dicts and
+computing the position of every cell; see `Dataset.from_rows`. Rows read from
+text (e.g. by `csv.DictReader`) hold strings only: `text_value` reads numbers
+back and empty fields as nulls.
+"""
+
+from __future__ import annotations
+
+import re
+from array import array
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from itertools import count, islice, repeat
+from operator import add, itemgetter, methodcaller, mul
+from typing import Literal, NamedTuple
+
+from jsonstat_validator.cube import strides, unravel
+
+CHUNK_ROWS = 65_536
+
+# A JSON number: an int without fraction or exponent, a float otherwise.
+_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][+-]?[0-9]+)?")
+
+
+class CollectedRows(NamedTuple):
+    """The cells of a cube collected from rows.
+
+    Attributes:
+        categories: The category IDs of each dimension, in position order
+        positions: The position of the cell of each row
+        values: The value of each row
+        statuses: The status of each row (None where it has none), if collected
+    """
+
+    categories: list[list[str]]
+    positions: list[int]
+    values: list
+    statuses: list | None
+
+
+def text_value(text: str | None) -> float | int | str | None:
+    """Return the value of a text field: null if empty, a number if one.
+
+    Numbers are read as written in JSON, ints without a fraction or exponent;
+    other text is kept as a string value.
+    """
+    if not text:
+        return None
+    match = _NUMBER.fullmatch(text)
+    if match is None:
+        return text
+    return int(text) if match.lastindex is None else float(text)
+
+
+def _text_status(text: str | None) -> str | None:
+    return text or None
+
+
+def category_ids(keys: Iterable[Hashable], dim: str) -> list[str]:
+    """Return category IDs as strings, converting other keys with `str`.
+
+    Raises:
+        ValueError: If two keys have the same string
+    """
+    ids = [key if isinstance(key, str) else str(key) for key in keys]
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"Categories of '{dim}' have the same ID as strings")
+    return ids
+
+
+def collect_rows(
+    rows: Iterable[Mapping],
+    dims: Sequence[str],
+    value_col: str,
+    status_col: str | None = None,
+    order: Literal["first_seen", "sorted"] = "first_seen",
+    chunk_rows: int = CHUNK_ROWS,
+    from_text: bool = False,
+) -> CollectedRows:
+    """Read rows once, collecting the categories and the cell of every row.
+
+    Args:
+        rows: Mappings from column name to value (e.g. from `csv.DictReader`)
+        dims: The columns holding the category of each dimension; none for a
+            cube of a single cell
+        value_col: The column holding the value
+        status_col: The column holding the status, if any; rows may omit it
+        order: Order categories as first seen, or sorted by ID
+        chunk_rows: Number of rows processed at a time
+        from_text: Read values and statuses from text (see `text_value`),
+            empty statuses as none
+
+    Raises:
+        KeyError: If a row misses a dimension or value column
+        ValueError: If two rows give the same cell, or two categories of a
+            dimension have the same ID once converted to strings
+    """
+    if order not in ("first_seen", "sorted"):
+        raise ValueError(f"order must be 'first_seen' or 'sorted', not {order!r}")
+    if len(set(dims)) != len(dims):
+        raise ValueError("Dimension columns must be unique")
+    if value_col in dims or (status_col is not None and status_col in dims):
+        raise ValueError("Value and status columns cannot be dimension columns")
+    maps: list[dict] = [{} for _ in dims]
+    columns = [array("q") for _ in dims]
+    values: list = []
+    statuses: list | None = None if status_col is None else []
+    # Read every column of a row at once, then split the chunk into columns
+    # (a single column is read as a bare value).
+    getter = itemgetter(*dims, value_col)
+    rows = iter(rows)
+    while chunk := list(islice(rows, chunk_rows)):
+        picked = map(getter, chunk) if dims else zip(map(getter, chunk))
+        *dim_keys, chunk_values = zip(*picked, strict=True)
+        for keys, positions, column in zip(dim_keys, maps, columns, strict=True):
+            new = [key for key in dict.fromkeys(keys) if key not in positions]
+            positions.update(zip(new, count(len(positions))))
+            column.extend(map(positions.__getitem__, keys))
+        if from_text:
+            chunk_values = map(text_value, chunk_values)
+        values.extend(chunk_values)
+        if statuses is not None:
+            chunk_statuses = map(methodcaller("get", status_col), chunk)
+            if from_text:
+                chunk_statuses = map(_text_status, chunk_statuses)
+            statuses.extend(chunk_statuses)
+
+    categories = [
+        category_ids(positions, dim) for dim, positions in zip(dims, maps, strict=True)
+    ]
+    if order == "sorted":
+        for dim, ids in enumerate(categories):
+            old = sorted(range(len(ids)), key=ids.__getitem__)
+            new = [0] * len(ids)
+            for position, old_position in enumerate(old):
+                new[old_position] = position
+            categories[dim] = [ids[i] for i in old]
+            columns[dim] = array("q", map(new.__getitem__, columns[dim]))
+
+    sizes = list(map(len, categories))
+    cells = [0] * len(values)
+    for stride, column in zip(strides(sizes), columns, strict=True):
+        cells = list(map(add, cells, map(mul, column, repeat(stride))))
+    if len(set(cells)) != len(cells):
+        seen: set[int] = set()
+        duplicate = next(c for c in cells if c in seen or seen.add(c))
+        coords = unravel(duplicate, strides(sizes))
+        cell = ", ".join(
+            f"{dim}={ids[position]}"
+            for dim, ids, position in zip(dims, categories, coords, strict=True)
+        )
+        raise ValueError(f"Duplicate rows for cell ({cell})")
+    return CollectedRows(categories, cells, values, statuses)
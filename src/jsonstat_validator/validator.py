@@ -1,10 +1,23 @@
 """Validator for JSON-stat."""
 
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, get_args
+
 from pydantic import ValidationError
+from pydantic_core import PydanticCustomError
+from pydantic_core.core_schema import ErrorType
 
+from jsonstat_validator.lint import check_jsonstat
 from jsonstat_validator.models.base import JSONStatSchema
 from jsonstat_validator.utils import JSONStatValidationError
 
+if TYPE_CHECKING:
+    from jsonstat_validator.cache import DimensionCache
+
+_BUILTIN_ERROR_TYPES = frozenset(get_args(ErrorType))
+
 
 def format_error_location(loc: tuple) -> str:
     """Format error location to be more human-readable.
@@ -47,11 +60,44 @@ def format_validation_errors(e: ValidationError) -> str:
     return "\n".join(errors)
 
 
-def validate_jsonstat(data: dict) -> bool:
+def _with_python_messages(e: ValidationError) -> ValidationError:
+    """Re-render errors raised in JSON mode with the Python-mode messages.
+
+    Pydantic words JSON-mode errors in JSON terms ("a valid array", "an object");
+    rebuilding them keeps messages identical to those of `validate_jsonstat`.
+    Custom error types are worded the same in both modes and kept as-is.
+    """
+    details = []
+    for error in e.errors():
+        detail = {key: error[key] for key in ("loc", "input", "ctx") if key in error}
+        if error["type"] in _BUILTIN_ERROR_TYPES:
+            detail["type"] = error["type"]
+        else:
+            detail["type"] = PydanticCustomError(error["type"], error["msg"])
+        details.append(detail)
+    return ValidationError.from_exception_data(e.title, details, input_type="python")
+
+
+def _context(dimension_cache: DimensionCache | None) -> dict | None:
+    if dimension_cache is None:
+        return None
+    return {"dimension_cache": dimension_cache}
+
+
+def validate_jsonstat(
+    data: dict,
+    mode: Literal["model", "check"] = "model",
+    *,
+    dimension_cache: DimensionCache | None = None,
+) -> bool:
     """Validate a JSON-stat 2.0 object against the specification.
 
     Args:
         data: A dictionary containing JSON-stat data
+        mode: "model" builds the Pydantic models; "check" runs the same rules
+            directly against `data` without building any model instance
+        dimension_cache: Cache of validated dataset dimensions, reused across
+            calls (model mode only)
 
     Returns:
         bool: True if valid, raises ValueError otherwise
@@ -60,10 +106,67 @@ def validate_jsonstat(data: dict) -> bool:
         ValueError: If the data does not conform to the JSON-stat specification
                    with a user-friendly error message
     """
+    if mode == "check":
+        check_jsonstat(data)
+        return True
     try:
-        JSONStatSchema.model_validate(data)
+        JSONStatSchema.model_validate(data, context=_context(dimension_cache))
     except ValidationError as e:
         error_message = f"JSON-stat validation failed:\n{format_validation_errors(e)}"
         raise JSONStatValidationError(error_message) from e
     else:
         return True
+
+
+def parse_jsonstat_json(
+    data: bytes | str | Path, *, context: dict | None = None
+) -> JSONStatSchema:
+    """Validate a raw JSON-stat 2.0 document and return its model.
+
+    The document is parsed by pydantic's native JSON parser straight into the
+    models, skipping the intermediate dict built by `json.load`. Errors are
+    worded as those of `validate_jsonstat`.
+
+    Args:
+        data: The JSON text (bytes or str), or the path of a JSON-stat file
+        context: The validation context (e.g. `{"compact_values": True}`)
+
+    Returns:
+        JSONStatSchema: The validated document
+
+    Raises:
+        JSONStatValidationError: If the data does not conform to the JSON-stat
+                                 specification
+    """
+    if isinstance(data, Path):
+        data = data.read_bytes()
+    try:
+        return JSONStatSchema.model_validate_json(data, context=context)
+    except ValidationError as e:
+        errors = format_validation_errors(_with_python_messages(e))
+        error_message = f"JSON-stat validation failed:\n{errors}"
+        raise JSONStatValidationError(error_message) from e
+
+
+def validate_jsonstat_json(
+    data: bytes | str | Path, *, dimension_cache: DimensionCache | None = None
+) -> bool:
+    """Validate a raw JSON-stat 2.0 document against the specification.
+
+    The document is parsed by pydantic's native JSON parser straight into the
+    models, skipping the intermediate dict built by `json.load`.
+
+    Args:
+        data: The JSON text (bytes or str), or the path of a JSON-stat file
+        dimension_cache: Cache of validated dataset dimensions, reused across
+            calls
+
+    Returns:
+        bool: True if valid, raises ValueError otherwise
+
+    Raises:
+        ValueError: If the data does not conform to the JSON-stat specification
+                   with a user-friendly error message
+    """
+    parse_jsonstat_json(data, context=_context(dimension_cache))
+    return True
@@ -0,0 +1,538 @@
+"""Validation, compact storage and dense/sparse forms of dataset values.
+
+`validate_values` and `validate_status` replace pydantic's per-cell union
+matching for `value` and `status`: the cell types are collected in one pass,
+and only cells of an unexpected type go through the (lax) pydantic validators.
+
+A `value` list costs a pointer plus a boxed number per cell (about 32 bytes for
+floats). `CompactValues` keeps numeric cubes in a typed `array` (8 bytes per
+cell) plus a null bitmap (1 bit per cell), and reads back exactly the numbers,
+and number types, it was built from, so datasets serialize to identical JSON.
+
+`value` and `status` come in a dense form (a list with a cell per position) and
+a sparse form (a dict keyed by position strings, holding the non-null cells).
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from itertools import chain, compress, repeat
+from operator import add, countOf, floordiv, is_, is_not, mod, mul
+from typing import Literal, overload
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import InitErrorDetails, PydanticCustomError
+
+from jsonstat_validator.cube import moved_positions, transposed_positions
+
+# Integers a double represents exactly.
+_MAX_EXACT_INT = 2**53
+
+# Type codes: 64-bit integers, doubles, and doubles read back as int when
+# integral (used for mixed int/float lists without integral floats).
+INT = "q"
+FLOAT = "d"
+NUMBER = "n"
+
+# Cell types accepted as-is; others (booleans, decimals...) are coerced.
+_VALUE_TYPES = frozenset((float, int, str, type(None)))
+_STATUS_TYPES = frozenset((str,))
+_VALUE_ITEM = TypeAdapter(float | int | str | None)
+_STATUS_ITEM = TypeAdapter(str)
+
+_BITS = bytes.maketrans(b"\x00\x01", b"01")
+_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def pack_bits(flags: bytes) -> bytearray:
+    """Pack one 0/1 byte per cell into a little-endian bitmap."""
+    if not flags:
+        return bytearray()
+    bits = int(flags[::-1].translate(_BITS), 2)
+    return bytearray(bits.to_bytes((len(flags) + 7) // 8, "little"))
+
+
+def unpack_bits(bits: bytes, length: int) -> bytes:
+    """Unpack a little-endian bitmap into one 0/1 byte per cell."""
+    if not length:
+        return b""
+    digits = format(int.from_bytes(bits, "little"), f"0{length}b")
+    return digits[::-1].encode().translate(_FLAGS)
+
+
+def _of_type(values: list, type_: type) -> Iterator:
+    """Iterate over the members of `values` of exactly `type_`."""
+    return compress(values, map(is_, map(type, values), repeat(type_)))
+
+
+def _kind(values: list, numbers: set[type]) -> str | None:
+    """Return the array kind able to hold `values` exactly, if any."""
+    if numbers <= {int}:
+        return INT
+    if numbers == {float}:
+        return FLOAT
+    # Mixed: integers are told apart from floats by being integral, so no
+    # float may be integral, and every integer must be exact as a double.
+    if any(map(float.is_integer, _of_type(values, float))):
+        return None
+    if max(map(abs, _of_type(values, int))) > _MAX_EXACT_INT:
+        return None
+    return NUMBER
+
+
+class CompactValues(Sequence):
+    """Read-only sequence of numbers and nulls backed by an `array`.
+
+    Build instances with `CompactValues.from_list`.
+
+    Attributes:
+        kind: "q" (all integers), "d" (all floats) or "n" (mixed integers and
+            non-integral floats)
+        data: The numbers, with 0 in place of nulls
+        nulls: Bitmap with bit `i % 8` of byte `i // 8` set when cell `i` is
+            null, or None if there are no nulls
+    """
+
+    __slots__ = ("data", "kind", "nulls")
+
+    def __init__(self, data: array, kind: str, nulls: bytearray | None = None) -> None:
+        self.data = data
+        self.kind = kind
+        self.nulls = nulls
+
+    @classmethod
+    def from_list(cls, values: list) -> CompactValues | None:
+        """Return the compact form of `values`, or None if it has none.
+
+        Lists holding strings or booleans, integers beyond 64 bits, or a mix of
+        integers and integral floats (which a single array cannot tell apart)
+        are left as lists.
+        """
+        types = set(map(type, values))
+        numbers = types - {type(None)}
+        if not types or not numbers <= {int, float}:
+            return None
+        if (kind := _kind(values, numbers)) is None:
+            return None
+        nulls = None
+        if type(None) in types:
+            nulls = pack_bits(bytes(map(is_, values, repeat(None))))
+            values = [0 if item is None else item for item in values]
+        try:
+            return cls(array(INT if kind == INT else FLOAT, values), kind, nulls)
+        except OverflowError:
+            return None
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the values and the null bitmap."""
+        return len(self.data) * self.data.itemsize + len(self.nulls or b"")
+
+    def is_null(self, index: int) -> bool:
+        """Return whether cell `index` is null."""
+        return self.nulls is not None and bool(
+            self.nulls[index >> 3] & (1 << (index & 7))
+        )
+
+    def null_positions(self) -> Iterator[int]:
+        """Yield the positions of the null cells in increasing order."""
+        if self.nulls is None:
+            return
+        for byte_index in compress(range(len(self.nulls)), self.nulls):
+            byte = self.nulls[byte_index]
+            for bit in range(8):
+                if byte & (1 << bit):
+                    yield byte_index * 8 + bit
+
+    def take(self, positions: Sequence[int]) -> CompactValues:
+        """Return the cells at `positions`, in that order."""
+        data = array(self.data.typecode, map(self.data.__getitem__, positions))
+        nulls = None
+        if self.nulls is not None:
+            flags = unpack_bits(self.nulls, len(self.data))
+            nulls = pack_bits(bytes(map(flags.__getitem__, positions)))
+        return CompactValues(data, self.kind, nulls)
+
+    def tolist(self) -> list[int | float | None]:
+        """Return the values as a plain list, as they were validated."""
+        items = self.data.tolist()
+        if self.kind == NUMBER:
+            items = [int(item) if item.is_integer() else item for item in items]
+        for i in self.null_positions():
+            items[i] = None
+        return items
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @overload
+    def __getitem__(self, index: int) -> int | float | None: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[int | float | None]: ...
+
+    def __getitem__(self, index: int | slice) -> int | float | None | list:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self.data[index]
+        if index < 0:
+            index += len(self.data)
+        if self.is_null(index):
+            return None
+        if self.kind == NUMBER and item.is_integer():
+            return int(item)
+        return item
+
+    def __iter__(self) -> Iterator[int | float | None]:
+        if self.nulls is None and self.kind != NUMBER:
+            yield from self.data
+            return
+        for i in range(len(self.data)):
+            yield self[i]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactValues):
+            return self.tolist() == other.tolist()
+        if isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CompactValues(kind={self.kind!r}, len={len(self)})"
+
+
+def _invalid(
+    loc: tuple, error: str | PydanticCustomError, input: object
+) -> ValidationError:
+    """Build a validation error located relative to the validated field."""
+    return ValidationError.from_exception_data(
+        "Dataset", [InitErrorDetails(type=error, loc=loc, input=input)]
+    )
+
+
+def _invalid_cell(loc: tuple, item: object, adapter: TypeAdapter) -> ValidationError:
+    if adapter is _STATUS_ITEM:
+        return _invalid(loc, "string_type", item)
+    error = PydanticCustomError(
+        "value_type", "Input should be a valid number, string or null"
+    )
+    return _invalid(loc, error, item)
+
+
+def _cells(
+    items: list, keys: Sequence, allowed: frozenset[type], adapter: TypeAdapter
+) -> list:
+    """Return the validated cells, coercing those of an unexpected type."""
+    if set(map(type, items)) <= allowed:
+        return items
+    cells = []
+    for key, item in zip(keys, items, strict=True):
+        if type(item) not in allowed:
+            try:
+                item = adapter.validate_python(item)
+            except ValidationError:
+                raise _invalid_cell((key,), item, adapter) from None
+        cells.append(item)
+    return cells
+
+
+def _container(
+    data: object, allowed: frozenset[type], adapter: TypeAdapter
+) -> list | dict:
+    """Validate a list or dict of cells in a single pass over its members.
+
+    The cells are returned in a new list or dict, so later changes to the
+    input do not reach the model.
+    """
+    if isinstance(data, list | tuple):
+        return _cells(list(data), range(len(data)), allowed, adapter)
+    if isinstance(data, dict):
+        keys = list(data)
+        if not set(map(type, keys)) <= _STATUS_TYPES:
+            key = next(key for key in keys if not isinstance(key, str))
+            raise _invalid((key, "[key]"), "string_type", key)
+        cells = _cells(list(data.values()), keys, allowed, adapter)
+        return dict(zip(keys, cells, strict=True))
+    raise _invalid((), "list_type", data)
+
+
+def validate_values(
+    value: object, compact: bool = False
+) -> list | dict | CompactValues:
+    """Validate a dataset `value`, a list or dict of numbers, strings and nulls.
+
+    Args:
+        value: The `value` input
+        compact: Store numeric lists as `CompactValues`
+
+    Raises:
+        ValidationError: Located at the offending cell
+    """
+    if compact and type(value) is list:
+        # Numeric lists need no further checks; skip the intermediate copy.
+        compacted = CompactValues.from_list(value)
+        if compacted is not None:
+            return compacted
+    cells = _container(value, _VALUE_TYPES, _VALUE_ITEM)
+    if compact and isinstance(cells, list):
+        return CompactValues.from_list(cells) or cells
+    return cells
+
+
+def validate_status(status: object) -> str | list | dict | None:
+    """Validate a dataset `status`: a string, or a list or dict of strings.
+
+    Raises:
+        ValidationError: Located at the offending cell
+    """
+    if status is None or type(status) is str:
+        return status
+    if isinstance(status, str):
+        return _STATUS_ITEM.validate_python(status)
+    return _container(status, _STATUS_TYPES, _STATUS_ITEM)
+
+
+def null_count(value: Sequence | Mapping, n_cells: int) -> int:
+    """Return the number of null cells, counting cells missing from a dict."""
+    if isinstance(value, CompactValues):
+        return int.from_bytes(value.nulls or b"").bit_count()
+    if isinstance(value, Mapping):
+        return n_cells - len(value) + countOf(value.values(), None)
+    return countOf(value, None)
+
+
+def optimal_form(value: Sequence | Mapping, n_cells: int) -> Literal["dense", "sparse"]:
+    """Return the form in which `value` serializes to the fewest JSON bytes.
+
+    A null costs 5 bytes in the dense form (`null,`) and nothing in the sparse
+    form, where every other cell costs its quoted position key (`"123":`).
+    """
+    nulls = null_count(value, n_cells)
+    key_bytes = len(str(max(n_cells - 1, 0))) + 3
+    return "sparse" if nulls * 5 > (n_cells - nulls) * key_bytes else "dense"
+
+
+def dense_values(value: Sequence | Mapping, n_cells: int) -> list | CompactValues:
+    """Return `value` as a list of `n_cells` cells, with nulls for missing keys."""
+    if not isinstance(value, Mapping):
+        return value
+    cells = [None] * n_cells
+    for key, item in value.items():
+        cells[int(key)] = item
+    return cells
+
+
+def sparse_values(value: Sequence | Mapping) -> dict:
+    """Return `value` as a dict of its non-null cells keyed by position."""
+    if isinstance(value, Mapping):
+        return dict(compress(value.items(), map(is_not, value.values(), repeat(None))))
+    if isinstance(value, CompactValues):
+        value = value.tolist()
+    present = list(map(is_not, value, repeat(None)))
+    return dict(
+        zip(
+            map(str, compress(range(len(value)), present)),
+            compress(value, present),
+            strict=True,
+        )
+    )
+
+
+def dense_status(status: object, n_cells: int) -> object:
+    """Return a dict-form `status` as a list, if it has a status for every cell.
+
+    Status lists hold strings only, so a dict with gaps is returned unchanged.
+    """
+    if not isinstance(status, Mapping) or len(status) != n_cells or not n_cells:
+        return status
+    cells = [None] * n_cells
+    try:
+        for key, item in status.items():
+            cells[int(key)] = item
+    except IndexError:
+        return status
+    return status if None in cells else cells
+
+
+def sparse_status(status: object) -> object:
+    """Return a per-cell `status` list as a dict keyed by position.
+
+    A single status (a string, or a list of one) applies to every cell and is
+    returned unchanged.
+    """
+    if not isinstance(status, list) or len(status) < 2:
+        return status
+    return dict(zip(map(str, range(len(status))), status, strict=True))
+
+
+def take_values(
+    value: Sequence | Mapping, positions: Sequence[int]
+) -> list | dict | CompactValues:
+    """Return the cells of `value` at `positions`, renumbered from 0.
+
+    `value` keeps its form: a dict keeps the non-null cells only.
+    """
+    if isinstance(value, CompactValues):
+        return value.take(positions)
+    if isinstance(value, Mapping):
+        return sparse_values(list(map(value.get, map(str, positions))))
+    return list(map(value.__getitem__, positions))
+
+
+def take_status(status: object, positions: Sequence[int]) -> object:
+    """Return the status of the cells at `positions`, like `take_values`.
+
+    A single status (a string, or a list of one) is returned unchanged.
+    """
+    if isinstance(status, Mapping) or (isinstance(status, list) and len(status) > 1):
+        return take_values(status, positions)
+    return status
+
+
+def _sorted_cells(positions: list[int], cells: list) -> dict:
+    """Return a dict-form `value` with the cells at `positions`, sorted by key."""
+    ranks = sorted(range(len(positions)), key=positions.__getitem__)
+    keys = map(str, map(positions.__getitem__, ranks))
+    return dict(zip(keys, map(cells.__getitem__, ranks), strict=True))
+
+
+def transpose_values(
+    value: Sequence | Mapping, size: Sequence[int], order: Sequence[int]
+) -> list | dict | CompactValues:
+    """Return the cells of `value` with the dimensions of the cube reordered.
+
+    `value` keeps its form: dict keys are moved, in increasing order, without
+    visiting the null cells.
+
+    Args:
+        value: A dataset `value` (or a per-cell `status`)
+        size: The size of each dimension of the cube
+        order: The dimensions (by index) of the transposed cube
+    """
+    if isinstance(value, Mapping):
+        moved = moved_positions(map(int, value), size, order)
+        return _sorted_cells(moved, list(value.values()))
+    return take_values(value, transposed_positions(size, order))
+
+
+def transpose_status(
+    status: object, size: Sequence[int], order: Sequence[int]
+) -> object:
+    """Return `status` with the dimensions of the cube reordered.
+
+    A single status (a string, or a list of one) is returned unchanged.
+    """
+    if isinstance(status, Mapping) or (isinstance(status, list) and len(status) > 1):
+        return transpose_values(status, size, order)
+    return status
+
+
+def _single_status(status: object) -> str | None:
+    """Return the status shared by every cell, if `status` is a single one."""
+    if isinstance(status, str):
+        return status
+    if isinstance(status, list) and len(status) == 1:
+        return status[0]
+    return None
+
+
+def concat_values(
+    values: Sequence[Sequence | Mapping], blocks: Sequence[int], outer: int
+) -> list | dict | CompactValues:
+    """Interleave the cells of cubes joined along one of their dimensions.
+
+    Each cube holds `outer` blocks of `blocks[i]` cells, one per category of
+    the dimensions before the joined one. The result holds the first block of
+    each cube, then the second block of each cube, and so on. Dicts stay dicts
+    if every `value` is a dict, and compact values stay compact.
+
+    Args:
+        values: The `value` of each cube
+        blocks: The number of cells of a block of each cube (its number of
+            categories of the joined dimension times the stride of that
+            dimension)
+        outer: The number of blocks of each cube
+    """
+    if all(isinstance(value, Mapping) for value in values):
+        total = sum(blocks)
+        positions: list[int] = []
+        cells: list = []
+        offset = 0
+        for value, block in zip(values, blocks, strict=True):
+            keys = list(map(int, value))
+            starts = map(mul, map(floordiv, keys, repeat(block)), repeat(total))
+            shifts = map(add, map(mod, keys, repeat(block)), repeat(offset))
+            positions.extend(map(add, starts, shifts))
+            cells.extend(value.values())
+            offset += block
+        return _sorted_cells(positions, cells)
+
+    dense = [
+        dense_values(value, outer * block)
+        for value, block in zip(values, blocks, strict=True)
+    ]
+    compact = [value for value in dense if isinstance(value, CompactValues)]
+    if len(compact) == len(dense) and len({value.kind for value in compact}) == 1:
+        return _concat_compact(compact, blocks, outer)
+    lists = [
+        value.tolist() if isinstance(value, CompactValues) else value for value in dense
+    ]
+    result = list(
+        chain.from_iterable(
+            value[i * block : (i + 1) * block]
+            for i in range(outer)
+            for value, block in zip(lists, blocks, strict=True)
+        )
+    )
+    if compact:
+        return CompactValues.from_list(result) or result
+    return result
+
+
+def _concat_compact(
+    values: Sequence[CompactValues], blocks: Sequence[int], outer: int
+) -> CompactValues:
+    """Interleave compact values of the same kind, like `concat_values`."""
+    data = array(values[0].data.typecode)
+    for i in range(outer):
+        for value, block in zip(values, blocks, strict=True):
+            data.extend(value.data[i * block : (i + 1) * block])
+    nulls = None
+    if any(value.nulls is not None for value in values):
+        flags = [unpack_bits(value.nulls or b"", len(value)) for value in values]
+        nulls = pack_bits(
+            b"".join(
+                value_flags[i * block : (i + 1) * block]
+                for i in range(outer)
+                for value_flags, block in zip(flags, blocks, strict=True)
+            )
+        )
+    return CompactValues(data, values[0].kind, nulls)
+
+
+def concat_status(
+    statuses: Sequence[object], blocks: Sequence[int], outer: int, sparse: bool
+) -> object:
+    """Interleave the `status` of cubes joined along a dimension.
+
+    A single status shared by every cube is kept as is; otherwise the statuses
+    are joined in dict form (cells without a status left out), and turned into
+    a list if every cell has one, unless the joined `value` is `sparse` (a
+    dict), which a per-cell status list could not match.
+    """
+    singles = set(map(_single_status, statuses))
+    if len(singles) == 1 and None not in singles:
+        return statuses[0]
+    if all(status is None for status in statuses):
+        return None
+    cells = []
+    for status, block in zip(statuses, blocks, strict=True):
+        single = _single_status(status)
+        if single is not None:
+            status = dict.fromkeys(map(str, range(outer * block)), single)
+        cells.append(sparse_status(status) or {})
+    joined = concat_values(cells, blocks, outer)
+    if not joined:
+        return None
+    return joined if sparse else dense_status(joined, outer * sum(blocks))
@@ -0,0 +1,160 @@
+"""Test cases for checking parent totals against their children."""
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from jsonstat_validator import Dataset
+
+SAMPLES_DIR = Path(__file__).parent / "samples"
+
+# time × geo × sex, geo a two-level hierarchy: W = EU + US, EU = FR + DE.
+# 2021 breaks W for F (10 != 9) and EU for F (9 != 4 + 6); EU for M is not
+# checked, a child being a string, nor is the null W for M.
+DATASET = {
+    "version": "2.0",
+    "class": "dataset",
+    "id": ["time", "geo", "sex"],
+    "size": [2, 5, 2],
+    "value": [
+        # 2020: W, EU, FR, DE, US
+        *[15, 25, 10, 20, 4, 9, 6, 11, 5, 5],
+        # 2021
+        *[10, None, 9, 20, 4, "x", 6, 10, 0, 5],
+    ],
+    "dimension": {
+        "time": {"category": {"index": ["2020", "2021"]}},
+        "geo": {
+            "category": {
+                "index": ["W", "EU", "FR", "DE", "US"],
+                "label": {
+                    "W": "World",
+                    "EU": "Europe",
+                    "FR": "France",
+                    "DE": "Germany",
+                    "US": "U.S.",
+                },
+                "child": {"W": ["EU", "US"], "EU": ["FR", "DE"]},
+            }
+        },
+        "sex": {"category": {"index": ["F", "M"]}},
+    },
+}
+
+
+def naive_mismatches(dataset: Dataset, dim_id: str, tolerance: float) -> list[int]:
+    """Return the positions of mismatched parent cells, one cell at a time."""
+    dim = dataset.id.index(dim_id)
+    category = dataset.dimension[dim_id].category
+    stride = dataset.strides[dim]
+    found = []
+    for position in range(dataset.n_cells):
+        coord = position // stride % dataset.size[dim]
+        parent = category.ids[coord]
+        if not category.child.get(parent):
+            continue
+        base = position - coord * stride
+        cells = [dataset.value[position]] + [
+            dataset.value[base + category.positions[kid] * stride]
+            for kid in category.child[parent]
+        ]
+        if all(isinstance(cell, int | float) for cell in cells) and (
+            abs(cells[0] - sum(cells[1:])) > tolerance
+        ):
+            found.append(position)
+    return found
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test with NumPy, when installed, and with the pure Python path."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(
+            "jsonstat_validator.aggregates.optional_numpy", lambda: None
+        )
+    return request.param
+
+
+class TestCheckAggregates:
+    """Test cases for `Dataset.check_aggregates`."""
+
+    @pytest.mark.parametrize("form", ["list", "compact", "sparse"])
+    def test_mismatches(self, engine: str, form: str) -> None:
+        """Test that parents are compared with their direct children."""
+        data = DATASET
+        if form == "compact":
+            data = {
+                **DATASET,
+                "value": [v if v != "x" else None for v in DATASET["value"]],
+            }
+        dataset = Dataset.model_validate(
+            data, context={"compact_values": form == "compact"}
+        )
+        if form == "sparse":
+            dataset = dataset.to_sparse()
+        mismatches = dataset.check_aggregates("geo")
+        assert list(mismatches.positions) == [10, 12]
+        assert list(mismatches.iter_rows(labels=True)) == [
+            ("2021", "World", "F", 10.0, 9.0),
+            ("2021", "Europe", "F", 9.0, 10.0),
+        ]
+        assert repr(mismatches) == "AggregateMismatches(dim_id='geo', cells=2)"
+
+    def test_tolerance(self, engine: str) -> None:
+        """Test that differences within the tolerance are accepted."""
+        dataset = Dataset.model_validate(DATASET)
+        assert list(dataset.check_aggregates("geo", tolerance=0.5).positions) == [
+            10,
+            12,
+        ]
+        assert not dataset.check_aggregates("geo", tolerance=1)
+
+    @pytest.mark.parametrize("dim_id", ["a", "b", "c"])
+    def test_matches_naive_check(self, engine: str, dim_id: str) -> None:
+        """Test every dimension position against a cell-by-cell check."""
+        rng = random.Random(dim_id)
+        size = {"a": 3, "b": 7, "c": 4}
+        index = {dim: [f"{dim}{i}" for i in range(n)] for dim, n in size.items()}
+        ids = index[dim_id]
+        child = {ids[0]: ids[1:3], ids[1]: ids[3:], ids[2]: ids[3:5]}
+        n_cells = 3 * 7 * 4
+        value = [rng.choice([None, 1, 2, 2.5, 3]) for _ in range(n_cells)]
+        dataset = Dataset.model_validate(
+            {
+                "version": "2.0",
+                "class": "dataset",
+                "id": list(size),
+                "size": list(size.values()),
+                "value": value,
+                "dimension": {
+                    dim: {
+                        "category": {
+                            "index": index[dim],
+                            **({"child": child} if dim == dim_id else {}),
+                        }
+                    }
+                    for dim in size
+                },
+            }
+        )
+        mismatches = dataset.check_aggregates(dim_id, tolerance=0.1)
+        assert list(mismatches.positions) == naive_mismatches(dataset, dim_id, 0.1)
+        assert list(mismatches.totals) == [value[p] for p in mismatches.positions]
+
+    def test_sample_with_shared_children(self, engine: str) -> None:
+        """Test the OECD sample, whose areas are not totals of their members."""
+        data = json.loads((SAMPLES_DIR / "oecd.json").read_text())
+        dataset = Dataset.model_validate(data)
+        mismatches = dataset.check_aggregates("area")
+        assert list(mismatches.positions) == naive_mismatches(dataset, "area", 0)
+
+    def test_without_hierarchy(self) -> None:
+        """Test that dimensions without `child` have nothing to check."""
+        dataset = Dataset.model_validate(DATASET)
+        assert not dataset.check_aggregates("sex")
+        with pytest.raises(KeyError, match="Unknown dimension"):
+            dataset.check_aggregates("area")
@@ -0,0 +1,183 @@
+"""Test cases for the asyncio validation API."""
+
+import asyncio
+import copy
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from jsonstat_validator import aio
+from jsonstat_validator.aio import AsyncValidator, avalidate_jsonstat
+from jsonstat_validator.utils import JSONStatValidationError
+
+VALID_DATASET = {
+    "class": "dataset",
+    "id": ["d"],
+    "size": [2],
+    "value": [1, 2],
+    "dimension": {"d": {"category": {"index": ["a", "b"]}}},
+}
+INVALID_DATASET = {**VALID_DATASET, "size": [3]}
+
+
+class TestAsyncValidation:
+    """Test cases for `avalidate_jsonstat` and `AsyncValidator`."""
+
+    def test_inline_validation(self) -> None:
+        """Test that small documents validate with the default validator."""
+        assert asyncio.run(avalidate_jsonstat(VALID_DATASET)) is True
+        with pytest.raises(JSONStatValidationError):
+            asyncio.run(avalidate_jsonstat(json.dumps(INVALID_DATASET)))
+
+    @pytest.mark.parametrize("use_processes", [False, True])
+    @pytest.mark.parametrize("mode", ["model", "check"])
+    def test_offloaded_validation(self, use_processes: bool, mode: str) -> None:
+        """Test that documents above the threshold run in the executor."""
+
+        async def main() -> list:
+            async with AsyncValidator(
+                max_workers=2,
+                use_processes=use_processes,
+                inline_threshold=0,
+                mode=mode,
+            ) as validator:
+                return await asyncio.gather(
+                    validator.validate(VALID_DATASET),
+                    validator.validate(json.dumps(VALID_DATASET).encode()),
+                    validator.validate(INVALID_DATASET),
+                    return_exceptions=True,
+                )
+
+        valid, valid_bytes, invalid = asyncio.run(main())
+        assert valid is True
+        assert valid_bytes is True
+        assert isinstance(invalid, JSONStatValidationError)
+
+    def test_backpressure(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that no more than `max_concurrency` documents are in flight."""
+        lock = threading.Lock()
+        running = peak = 0
+
+        def slow_validate(data: dict, mode: str) -> bool:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return True
+
+        monkeypatch.setattr(aio, "validate_document", slow_validate)
+        executor = ThreadPoolExecutor(max_workers=8)
+        validator = AsyncValidator(executor, max_concurrency=2, inline_threshold=0)
+
+        async def main() -> list:
+            return await asyncio.gather(
+                *(validator.validate(VALID_DATASET) for _ in range(8))
+            )
+
+        assert asyncio.run(main()) == [True] * 8
+        assert peak == 2
+        executor.shutdown()
+
+    def test_cancellation(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that cancelled calls give their concurrency slot back."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_validate(data: dict, mode: str) -> bool:
+            started.set()
+            release.wait(5)
+            return True
+
+        monkeypatch.setattr(aio, "validate_document", blocking_validate)
+        validator = AsyncValidator(max_concurrency=1, inline_threshold=0)
+
+        async def main() -> bool:
+            running = asyncio.create_task(validator.validate(VALID_DATASET))
+            waiting = asyncio.create_task(validator.validate(VALID_DATASET))
+            await asyncio.to_thread(started.wait, 5)
+            waiting.cancel()
+            running.cancel()
+            for task in (running, waiting):
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+            release.set()
+            monkeypatch.setattr(aio, "validate_document", lambda data, mode: True)
+            return await asyncio.wait_for(validator.validate(VALID_DATASET), 5)
+
+        assert asyncio.run(main()) is True
+        validator.close()
+
+    def test_dict_size_estimate(self) -> None:
+        """Test that dict documents are sized from their cells and categories."""
+        small = aio._estimated_size(VALID_DATASET)
+        data = copy.deepcopy(VALID_DATASET)
+        data["value"] = [1] * 1000
+        assert aio._estimated_size(data) > small
+        sparse = {**VALID_DATASET, "size": [1000], "value": {"0": 1}}
+        assert aio._estimated_size(sparse) == aio._estimated_size(data)
+        index = [str(i) for i in range(1000)]
+        dimension = {"class": "dimension", "category": {"index": index}}
+        assert aio._estimated_size(dimension) > small
+        collection = {"class": "collection", "link": {"item": [data, dimension]}}
+        assert aio._estimated_size(collection) > aio._estimated_size(data)
+
+    def test_paths_not_inline(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test that files are read in the executor, never on the event loop."""
+        path = tmp_path / "dataset.json"
+        path.write_text(json.dumps(VALID_DATASET))
+        threads = []
+
+        def validate(data: object, mode: str) -> bool:
+            threads.append(threading.current_thread())
+            return True
+
+        monkeypatch.setattr(aio, "validate_document", validate)
+
+        async def main() -> bool:
+            async with AsyncValidator(inline_threshold=2**30) as validator:
+                return await validator.validate(path)
+
+        assert asyncio.run(main()) is True
+        assert threads != [threading.main_thread()]
+
+    def test_reconfigure_keeps_queued_work(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that replacing the default validator does not cancel its work."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_validate(data: dict, mode: str) -> bool:
+            started.set()
+            release.wait(5)
+            return True
+
+        monkeypatch.setattr(aio, "validate_document", blocking_validate)
+        monkeypatch.setattr(aio, "_default_validator", None)
+        aio.configure_async_validation(max_workers=1, inline_threshold=0)
+
+        async def main() -> list:
+            calls = [
+                asyncio.create_task(avalidate_jsonstat(VALID_DATASET)) for _ in range(2)
+            ]
+            await asyncio.to_thread(started.wait, 5)
+            aio.configure_async_validation(inline_threshold=0)
+            release.set()
+            return await asyncio.wait_for(asyncio.gather(*calls), 5)
+
+        assert asyncio.run(main()) == [True, True]
+        aio.configure_async_validation()
+
+    def test_invalid_concurrency(self) -> None:
+        """Test that a non-positive concurrency is rejected."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            AsyncValidator(max_concurrency=0)
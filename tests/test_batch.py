@@ -0,0 +1,71 @@
+"""Test cases for batch validation."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from jsonstat_validator.batch import validate_many
+
+SAMPLES_DIR = Path(__file__).parent / "samples"
+SAMPLE_PATHS = sorted(SAMPLES_DIR.rglob("*.json"))
+
+VALID_DATASET = {
+    "class": "dataset",
+    "id": ["d"],
+    "size": [2],
+    "value": [1, 2],
+    "dimension": {"d": {"category": {"index": ["a", "b"]}}},
+}
+INVALID_DATASET = {**VALID_DATASET, "size": [3]}
+
+
+class TestValidateMany:
+    """Test cases for `validate_many`."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_official_samples_in_order(self, workers: int) -> None:
+        """Test that paths are validated and yielded in input order."""
+        results = list(validate_many(SAMPLE_PATHS, workers=workers, chunksize=4))
+        assert [key for key, _, _ in results] == SAMPLE_PATHS
+        assert all(ok and errors is None for _, ok, errors in results)
+
+    @pytest.mark.parametrize("mode", ["model", "check"])
+    def test_mixed_inputs(self, mode: str) -> None:
+        """Test dict, str and bytes documents keyed by position."""
+        docs = [
+            VALID_DATASET,
+            json.dumps(INVALID_DATASET),
+            json.dumps(VALID_DATASET).encode(),
+            b'{"class": ',
+        ]
+        results = list(validate_many(docs, workers=2, mode=mode))
+        assert [(key, ok) for key, ok, _ in results] == [
+            (0, True),
+            (1, False),
+            (2, True),
+            (3, False),
+        ]
+        assert "must equal number of categories" in results[1][2]
+        assert "Invalid JSON" in results[3][2]
+
+    def test_completion_order(self) -> None:
+        """Test that unordered results cover every key of a mapping."""
+        docs = {f"doc-{i}": VALID_DATASET for i in range(20)}
+        docs["bad"] = INVALID_DATASET
+        results = list(validate_many(docs, workers=3, chunksize=3, ordered=False))
+        assert {key for key, _, _ in results} == set(docs)
+        assert [key for key, ok, _ in results if not ok] == ["bad"]
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test that unreadable paths are reported as failures."""
+        missing = tmp_path / "missing.json"
+        ((key, ok, errors),) = validate_many([missing], workers=1)
+        assert key == missing
+        assert not ok
+        assert errors
+
+    def test_invalid_chunksize(self) -> None:
+        """Test that a non-positive chunksize is rejected."""
+        with pytest.raises(ValueError, match="chunksize"):
+            list(validate_many([VALID_DATASET], chunksize=0))
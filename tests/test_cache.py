@@ -0,0 +1,113 @@
+"""Test cases for the dimension cache."""
+
+import json
+import math
+
+import pytest
+
+from jsonstat_validator import (
+    DimensionCache,
+    JSONStatSchema,
+    JSONStatValidationError,
+    validate_jsonstat,
+    validate_jsonstat_json,
+)
+
+TIME = {"label": "Year", "category": {"index": ["2023", "2024"]}}
+GEO = {
+    "category": {"index": {"ES": 0, "FR": 1}, "label": {"ES": "Spain", "FR": "France"}}
+}
+
+
+def make_dataset(dimension: dict) -> dict:
+    """Return a dataset over the given dimensions."""
+    size = [len(dim["category"]["index"]) for dim in dimension.values()]
+    return {
+        "class": "dataset",
+        "id": list(dimension),
+        "size": size,
+        "value": list(range(math.prod(size))),
+        "dimension": dimension,
+    }
+
+
+class TestDimensionCache:
+    """Test cases for `DimensionCache`."""
+
+    def test_hits_and_misses(self) -> None:
+        """Test that repeated definitions are served from the cache."""
+        cache = DimensionCache()
+        data = make_dataset({"time": TIME})
+        validate_jsonstat(data, dimension_cache=cache)
+        assert cache.info() == (0, 1, 1024, 1)
+        validate_jsonstat(data, dimension_cache=cache)
+        validate_jsonstat_json(json.dumps(data), dimension_cache=cache)
+        assert cache.info() == (2, 1, 1024, 1)
+
+    def test_cached_instance_is_reused(self) -> None:
+        """Test that datasets share the validated dimension model."""
+        cache = DimensionCache()
+        context = {"dimension_cache": cache}
+        first = JSONStatSchema.model_validate(
+            make_dataset({"time": TIME}), context=context
+        )
+        second = JSONStatSchema.model_validate(
+            make_dataset({"period": TIME}), context=context
+        )
+        assert second.root.dimension["period"] is first.root.dimension["time"]
+        assert (
+            first.model_dump()
+            == JSONStatSchema.model_validate(make_dataset({"time": TIME})).model_dump()
+        )
+
+    def test_key_order_matters(self) -> None:
+        """Test that reordered categories are not served the same dimension."""
+        reordered = {"category": {"index": ["2024", "2023"]}}
+        assert DimensionCache.key(TIME["category"]) != DimensionCache.key(
+            reordered["category"]
+        )
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used dimension is evicted."""
+        cache = DimensionCache(maxsize=2)
+        keys = [DimensionCache.key({"n": n}) for n in range(3)]
+        dimensions = [object() for _ in keys]
+        cache.put(keys[0], dimensions[0])
+        cache.put(keys[1], dimensions[1])
+        assert cache.get(keys[0]) is dimensions[0]
+        cache.put(keys[2], dimensions[2])
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is dimensions[0]
+        assert len(cache) == 2
+
+    def test_invalid_dimension_not_cached(self) -> None:
+        """Test that failed validations leave the cache untouched."""
+        cache = DimensionCache()
+        data = make_dataset({"time": {"category": {"index": ["a", "a"]}}})
+        for _ in range(2):
+            with pytest.raises(JSONStatValidationError):
+                validate_jsonstat(data, dimension_cache=cache)
+        assert len(cache) == 0
+
+    def test_cached_dimension_still_checked_against_dataset(self) -> None:
+        """Test that dataset-wide rules apply to cached dimensions."""
+        cache = DimensionCache()
+        validate_jsonstat(
+            make_dataset({"time": TIME, "geo": GEO}), dimension_cache=cache
+        )
+        data = {**make_dataset({"time": TIME, "geo": GEO}), "size": [2, 3]}
+        with pytest.raises(JSONStatValidationError, match="size\\[1\\]"):
+            validate_jsonstat(data, dimension_cache=cache)
+        assert cache.hits == 2
+
+    def test_clear(self) -> None:
+        """Test that clearing drops entries and statistics."""
+        cache = DimensionCache()
+        validate_jsonstat(make_dataset({"time": TIME}), dimension_cache=cache)
+        cache.clear()
+        assert cache.info() == (0, 0, 1024, 0)
+
+    def test_invalid_maxsize(self) -> None:
+        """Test that the cache must hold at least one entry."""
+        with pytest.raises(ValueError, match="maxsize"):
+            DimensionCache(maxsize=0)
@@ -1,10 +1,27 @@
 """Test cases for the Category model."""
 
+import json
+from pathlib import Path
+
 import pytest
 
+from jsonstat_validator.models.category import Category
 from jsonstat_validator.utils import JSONStatValidationError
 from jsonstat_validator.validator import validate_jsonstat
 
+SAMPLES_DIR = Path(__file__).parent / "samples"
+
+# world > continents > countries, with a group spanning two continents.
+REGIONS = {
+    "index": ["W", "EU", "AM", "FR", "DE", "US", "CA", "G2"],
+    "child": {
+        "W": ["EU", "AM", "G2"],
+        "EU": ["FR", "DE"],
+        "AM": ["US", "CA"],
+        "G2": ["DE", "US"],
+    },
+}
+
 
 class TestCategoryValidCases:
     """Test cases for valid Category objects within dimensions."""
@@ -194,3 +211,176 @@ class TestCategoryInvalidCases:
         }
         with pytest.raises(JSONStatValidationError):
             validate_jsonstat(dimension)
+
+
+class TestCategoryPositions:
+    """Test cases for `Category.positions` and `Category.ids`."""
+
+    @pytest.mark.parametrize(
+        ("category", "positions", "ids"),
+        [
+            ({"index": ["b", "a"]}, {"b": 0, "a": 1}, ("b", "a")),
+            ({"index": {"b": 1, "a": 0}}, {"b": 1, "a": 0}, ("a", "b")),
+            ({"label": {"total": "Total"}}, {"total": 0}, ("total",)),
+        ],
+    )
+    def test_positions_and_ids(
+        self, category: dict, positions: dict, ids: tuple
+    ) -> None:
+        """Test positions and IDs for each form of `index`."""
+        model = Category.model_validate(category)
+        assert model.positions == positions
+        assert model.ids == ids
+
+    def test_positions_not_serialized_or_compared(self) -> None:
+        """Test that the cached positions do not leak into dumps or equality."""
+        model = Category.model_validate({"index": ["a", "b"]})
+        assert model.positions == {"a": 0, "b": 1}
+        assert model.model_dump() == {"index": ["a", "b"]}
+        assert model == Category.model_validate({"index": ["a", "b"]})
+
+    @pytest.mark.parametrize(
+        "index", [{"x": 1, "y": 2}, {"y": 5, "x": 3}, {"x": 0, "y": 0}]
+    )
+    def test_index_positions_ranked(self, index: dict) -> None:
+        """Test that gapped, offset or repeated dict positions are ranked 0..n-1."""
+        model = Category.model_validate({"index": index})
+        assert model.positions == {"x": 0, "y": 1}
+        assert model.ids == ("x", "y")
+        assert model.index == index
+
+    def test_positions_follow_copies(self) -> None:
+        """Test that a copy with another `index` gets its own positions."""
+        model = Category.model_validate({"index": ["a", "b"]})
+        assert model.positions == {"a": 0, "b": 1}
+        copy = model.model_copy(update={"index": ["b", "a"]})
+        assert copy.positions == {"b": 0, "a": 1}
+        assert copy.ids == ("b", "a")
+
+    def test_large_codelist_membership(self) -> None:
+        """Test coordinates, child and unit on a large list index."""
+        ids = [f"c{i}" for i in range(50_000)]
+        model = Category.model_validate(
+            {
+                "index": ids,
+                "coordinates": {i: [0.0, 0.0] for i in ids},
+                "child": {ids[0]: ids[1:]},
+                "unit": {ids[-1]: {"decimals": 0}},
+            }
+        )
+        assert model.positions[ids[-1]] == len(ids) - 1
+        with pytest.raises(JSONStatValidationError, match="Invalid child: x"):
+            Category.model_validate({"index": ids, "child": {ids[0]: ["x"]}})
+
+    @pytest.mark.parametrize(
+        ("category", "message"),
+        [
+            (
+                {"index": ["a", "b"], "coordinates": {"a": [1, 2], "b": [1]}},
+                "Coordinates for category b",
+            ),
+            (
+                {"index": ["a", "b"], "coordinates": {"b": [1], "x": [1, 2]}},
+                "Coordinates for category b",
+            ),
+            (
+                {"index": ["a", "b"], "child": {"a": ["b"], "x": ["a"]}},
+                "Invalid parent: x",
+            ),
+            (
+                {"index": ["a", "b"], "child": {"a": ["b", "y"], "x": ["a"]}},
+                "Invalid child: y in `child\\[a\\]`",
+            ),
+            (
+                {"index": ["a"], "unit": {"a": {"decimals": 0}, "z": {"decimals": 0}}},
+                "Invalid unit: z",
+            ),
+        ],
+    )
+    def test_first_offender_reported(self, category: dict, message: str) -> None:
+        """Test that bulk checks still report the first offender in order."""
+        with pytest.raises(JSONStatValidationError, match=message):
+            Category.model_validate(category)
+
+
+class TestCategoryHierarchy:
+    """Test cases for `Category.hierarchy` and cycles in `child`."""
+
+    def test_tree_queries(self) -> None:
+        """Test roots, leaves, depths and relatives in a tree."""
+        hierarchy = Category.model_validate(
+            {**REGIONS, "child": {"W": ["EU", "AM"], "EU": ["FR", "DE"]}}
+        ).hierarchy
+        assert hierarchy.roots == ("W", "US", "CA", "G2")
+        assert hierarchy.leaves == ("AM", "FR", "DE", "US", "CA", "G2")
+        assert hierarchy.depth("FR") == 2
+        assert hierarchy.ancestors("DE") == ("W", "EU")
+        assert hierarchy.descendants("W") == ("EU", "AM", "FR", "DE")
+        assert hierarchy.children("EU") == ("FR", "DE")
+        assert hierarchy.is_descendant("FR", "W")
+        assert not hierarchy.is_descendant("FR", "AM")
+        assert not hierarchy.is_descendant("W", "W")
+
+    def test_several_parents(self) -> None:
+        """Test that categories below several parents have all their ancestors."""
+        hierarchy = Category.model_validate(REGIONS).hierarchy
+        assert hierarchy.parents("DE") == ("EU", "G2")
+        assert hierarchy.ancestors("US") == ("W", "AM", "G2")
+        assert hierarchy.descendants("G2") == ("DE", "US")
+        assert hierarchy.is_descendant("US", "G2")
+        assert hierarchy.is_descendant("DE", "G2")
+        assert not hierarchy.is_descendant("CA", "G2")
+        assert hierarchy.depth("US") == 2
+
+    def test_sample_with_shared_children(self) -> None:
+        """Test the OECD sample, where EU15 and its members are in OECD."""
+        data = json.loads((SAMPLES_DIR / "oecd.json").read_text())
+        category = Category.model_validate(data["dimension"]["area"]["category"])
+        hierarchy = category.hierarchy
+        assert hierarchy.roots == ("OECD",)
+        assert hierarchy.parents("DK") == ("EU15", "OECD")
+        assert hierarchy.depth("DK") == 2
+        assert len(hierarchy.descendants("OECD")) == len(category.ids) - 1
+
+    def test_unknown_category(self) -> None:
+        """Test that unknown category IDs raise a KeyError."""
+        hierarchy = Category.model_validate(REGIONS).hierarchy
+        with pytest.raises(KeyError, match="Unknown category 'XX'"):
+            hierarchy.ancestors("XX")
+
+    def test_not_serialized(self) -> None:
+        """Test that the cached hierarchy does not leak into dumps."""
+        model = Category.model_validate(REGIONS)
+        assert model.hierarchy.depth("W") == 0
+        assert model.model_dump(exclude_none=True) == REGIONS
+
+    @pytest.mark.parametrize(
+        ("child", "message"),
+        [
+            ({"a": ["a"]}, "a -> a"),
+            ({"a": ["b"], "b": ["c"], "c": ["a"]}, "a -> b -> c -> a"),
+            ({"c": ["a"], "a": ["b"], "b": ["a"]}, "a -> b -> a"),
+        ],
+    )
+    def test_cycle_rejected(self, child: dict, message: str) -> None:
+        """Test that a cycle in `child` fails validation, naming it."""
+        with pytest.raises(
+            JSONStatValidationError, match=f"Cycle in `child`: {message}"
+        ):
+            Category.model_validate({"index": ["a", "b", "c"], "child": child})
+
+    def test_large_hierarchy(self) -> None:
+        """Test a deep chain and a wide level, validated and indexed."""
+        ids = [f"c{i}" for i in range(20_000)]
+        chain = {parent: [kid] for parent, kid in zip(ids, ids[1:10_000], strict=False)}
+        model = Category.model_validate(
+            {"index": ids, "child": {**chain, ids[9_999]: ids[10_000:]}}
+        )
+        hierarchy = model.hierarchy
+        assert hierarchy.depth(ids[-1]) == 10_000
+        assert hierarchy.is_descendant(ids[-1], ids[0])
+        assert len(hierarchy.descendants(ids[5_000])) == 20_000 - 5_001
+        with pytest.raises(JSONStatValidationError, match="Cycle"):
+            Category.model_validate(
+                {"index": ids, "child": {**chain, ids[9_999]: [ids[0]]}}
+            )
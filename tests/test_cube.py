@@ -0,0 +1,565 @@
+"""Test cases for cell lookups."""
+
+import copy
+from itertools import product
+from pathlib import Path
+
+import pytest
+
+from jsonstat_validator.cube import cell_positions, strides
+from jsonstat_validator.models.dataset import Dataset
+from jsonstat_validator.utils import JSONStatValidationError
+
+MINIMAL_DATASET = {
+    "version": "2.0",
+    "class": "dataset",
+    "id": ["metric", "time", "geo"],
+    "size": [1, 2, 3],
+    "value": [1, 2, 3, 4, 5, 6],
+    "dimension": {
+        "metric": {"category": {"label": {"pop": "Population"}}},
+        "time": {"category": {"index": ["2020", "2021"]}},
+        "geo": {"category": {"index": {"US": 0, "EU": 1, "AS": 2}}},
+    },
+}
+SAMPLES_DIR = Path(__file__).parent / "samples"
+
+SPARSE_DATASET = {**MINIMAL_DATASET, "value": {"1": 2, "5": 6}}
+
+# A status per stored value of a dict-form `value`.
+SPARSE_STATUS_DATASET = {**SPARSE_DATASET, "status": ["x", "y"]}
+
+
+def with_category(dataset: Dataset, dim_id: str, category: object) -> Dataset:
+    """Return a copy of the dataset with the category of a dimension replaced."""
+    dimension = dict(dataset.dimension)
+    dimension[dim_id] = dimension[dim_id].model_copy(update={"category": category})
+    return dataset._replace(dimension=dimension)
+
+
+class TestStrides:
+    """Test cases for `strides`."""
+
+    @pytest.mark.parametrize(
+        ("size", "expected"),
+        [([], ()), ([4], (1,)), ([2, 3], (3, 1)), ([2, 3, 4], (12, 4, 1))],
+    )
+    def test_row_major(self, size: list[int], expected: tuple) -> None:
+        """Test that strides follow row-major order."""
+        assert strides(size) == expected
+
+
+class TestCubeShape:
+    """Test cases for `Dataset.n_cells` and `Dataset.strides`."""
+
+    @pytest.mark.parametrize("data", [MINIMAL_DATASET, SPARSE_DATASET])
+    def test_shape(self, data: dict) -> None:
+        """Test that the cell count and strides come from `size`."""
+        dataset = Dataset.model_validate(data)
+        assert dataset.n_cells == 6
+        assert dataset.strides == (6, 3, 1)
+
+    def test_follows_copies(self) -> None:
+        """Test that copies with another `size` get their own shape."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        assert dataset.n_cells == 6
+        copy = dataset.model_copy(update={"size": [1, 2, 2]})
+        assert copy.n_cells == 4
+        assert copy.strides == (4, 2, 1)
+
+
+class TestCellLookup:
+    """Test cases for `Dataset.cell` and `Dataset.cells`."""
+
+    @pytest.mark.parametrize("data", [MINIMAL_DATASET, SPARSE_DATASET])
+    def test_cell(self, data: dict) -> None:
+        """Test lookups on dense and dict-form values."""
+        dataset = Dataset.model_validate(data)
+        assert dataset.cell(metric="pop", time="2020", geo="EU") == 2
+        assert dataset.cell(time="2021", geo="AS") == 6
+
+    def test_missing_sparse_cell(self) -> None:
+        """Test that cells missing from a dict-form value are None."""
+        dataset = Dataset.model_validate(SPARSE_DATASET)
+        assert dataset.cell(time="2020", geo="US") is None
+
+    def test_every_cell(self) -> None:
+        """Test that every cell maps back to its row-major position."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        coords = [
+            {"time": time, "geo": geo}
+            for time in ("2020", "2021")
+            for geo in ("US", "EU", "AS")
+        ]
+        assert [dataset.cell(**c) for c in coords] == MINIMAL_DATASET["value"]
+        assert dataset.cells(coords) == MINIMAL_DATASET["value"]
+
+    @pytest.mark.parametrize("data", [MINIMAL_DATASET, SPARSE_DATASET])
+    def test_cells(self, data: dict) -> None:
+        """Test batch lookups on dense and dict-form values."""
+        dataset = Dataset.model_validate(data)
+        coords = [{"time": "2021", "geo": "AS"}, {"time": "2020", "geo": "EU"}]
+        assert dataset.cells(coords) == [6, 2]
+        assert dataset.cells([]) == []
+
+    def test_gapped_index(self) -> None:
+        """Test that a dict `index` with gaps is read in the order of its values."""
+        data = copy.deepcopy(MINIMAL_DATASET)
+        data["dimension"]["geo"]["category"]["index"] = {"US": 1, "EU": 5, "AS": 3}
+        dataset = Dataset.model_validate(data)
+        assert dataset.cell(time="2020", geo="AS") == 2
+        assert dataset.cell(time="2021", geo="EU") == 6
+
+    def test_compact_values(self) -> None:
+        """Test lookups on compact values."""
+        dataset = Dataset.model_validate(
+            MINIMAL_DATASET, context={"compact_values": True}
+        )
+        assert dataset.cell(time="2021", geo="US") == 4
+        assert dataset.cells([{"time": "2020", "geo": "US"}]) == [1]
+
+    @pytest.mark.parametrize(
+        ("coords", "message"),
+        [
+            ({"time": "2022", "geo": "US"}, "Unknown category '2022'"),
+            ({"time": "2020"}, "Missing category for dimension 'geo'"),
+            ({"time": "2020", "geo": "US", "sex": "F"}, "Unknown dimension"),
+            ({"metric": "gdp", "time": "2020", "geo": "US"}, "dimension 'metric'"),
+        ],
+    )
+    def test_invalid_coordinates(self, coords: dict, message: str) -> None:
+        """Test that invalid coordinates raise a KeyError."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        with pytest.raises(KeyError, match=message):
+            dataset.cell(**coords)
+        with pytest.raises(KeyError, match=message):
+            dataset.cells([{"time": "2020", "geo": "US"}, coords])
+
+    def test_lookup_cache_not_compared(self) -> None:
+        """Test that the cached index does not affect equality or dumps."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        dataset.cell(time="2020", geo="US")
+        assert dataset == Dataset.model_validate(MINIMAL_DATASET)
+        assert "_cube" not in dataset.model_dump()
+
+    def test_stale_index_rebuilt(self) -> None:
+        """Test that the index follows a copy with another shape."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        dataset.cell(time="2020", geo="US")
+        transposed = dataset.model_copy(
+            update={"id": ["metric", "geo", "time"], "size": [1, 3, 2]}
+        )
+        assert transposed.cell(time="2021", geo="US") == 2
+
+    @pytest.mark.parametrize("deep", [False, True])
+    def test_copy_with_reordered_categories(self, deep: bool) -> None:
+        """Test that a copy with another category order gets its own index."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        assert dataset.cell(time="2020", geo="EU") == 2
+        dimension = {
+            **dataset.dimension,
+            "geo": dataset.dimension["geo"].model_copy(
+                update={
+                    "category": dataset.dimension["geo"].category.model_copy(
+                        update={"index": {"EU": 0, "US": 1, "AS": 2}}
+                    )
+                }
+            ),
+        }
+        copy = dataset.model_copy(update={"dimension": dimension}, deep=deep)
+        assert copy.cell(time="2020", geo="EU") == 1
+        assert dataset.cell(time="2020", geo="EU") == 2
+
+
+class TestSlice:
+    """Test cases for `Dataset.slice`."""
+
+    def test_cell_positions(self) -> None:
+        """Test that sub-cube positions follow row-major order."""
+        assert cell_positions((6, 3, 1), [[0], [1, 0], [2, 0]]) == [5, 3, 2, 0]
+        assert cell_positions((3, 1), [[], [0, 1]]) == []
+        assert cell_positions((), []) == [0]
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_slice(self, compact: bool) -> None:
+        """Test that the selected cells are kept, in the order selected."""
+        context = {"compact_values": compact}
+        dataset = Dataset.model_validate(MINIMAL_DATASET, context=context)
+        sliced = dataset.slice({"geo": ["AS", "US"], "time": ["2021"]})
+        assert sliced.size == [1, 1, 2]
+        assert list(sliced.value) == [6, 4]
+        assert sliced.dimension["geo"].category.index == {"AS": 0, "US": 1}
+        assert sliced.dimension["time"].category.index == ["2021"]
+        assert sliced.cell(time="2021", geo="US") == 4
+        assert Dataset.model_validate(sliced.model_dump()).model_dump() == (
+            sliced.model_dump()
+        )
+
+    def test_sparse_values_and_status(self) -> None:
+        """Test that dict-form value and per-cell status are sliced."""
+        dataset = Dataset.model_validate(
+            {**SPARSE_DATASET, "status": {"1": "e", "2": "p"}}
+        )
+        sliced = dataset.slice({"geo": ["EU", "AS"]})
+        assert sliced.value == {"0": 2, "3": 6}
+        assert sliced.status == {"0": "e", "1": "p"}
+        dense = Dataset.model_validate({**MINIMAL_DATASET, "status": list("abcdef")})
+        assert dense.slice({"time": ["2021"]}).status == ["d", "e", "f"]
+
+    def test_status_per_stored_value(self) -> None:
+        """Test that a status list of a dict-form value follows its cells."""
+        dataset = Dataset.model_validate(SPARSE_STATUS_DATASET)
+        sliced = dataset.slice({"geo": ["AS", "EU"]})
+        assert sliced.value == {"1": 2, "2": 6}
+        assert sliced.status == {"1": "x", "2": "y"}
+
+    def test_category_metadata(self) -> None:
+        """Test that labels, hierarchies and units follow the selection."""
+        data = {
+            **MINIMAL_DATASET,
+            "size": [1, 2, 4],
+            "value": list(range(8)),
+            "dimension": {
+                **MINIMAL_DATASET["dimension"],
+                "geo": {
+                    "category": {
+                        "index": ["W", "US", "EU", "AS"],
+                        "label": {
+                            "W": "World",
+                            "US": "U.S.",
+                            "EU": "E.U.",
+                            "AS": "Asia",
+                        },
+                        "child": {"W": ["US", "EU", "AS"], "EU": []},
+                        "coordinates": {"US": [-98.5, 39.8], "EU": [9.0, 50.0]},
+                    }
+                },
+            },
+        }
+        sliced = Dataset.model_validate(data).slice({"geo": ["EU", "W"]})
+        category = sliced.dimension["geo"].category
+        assert category.index == ["EU", "W"]
+        assert category.label == {"EU": "E.U.", "W": "World"}
+        assert category.child == {"W": ["EU"]}
+        assert category.coordinates == {"EU": [9.0, 50.0]}
+        assert sliced.value == [2, 0, 6, 4]
+        Dataset.model_validate(sliced.model_dump())
+
+    def test_href_only_dimension(self) -> None:
+        """Test that a dimension without categories cannot be sliced."""
+        dataset = Dataset.model_validate(
+            {
+                **MINIMAL_DATASET,
+                "dimension": {
+                    **MINIMAL_DATASET["dimension"],
+                    "metric": {"href": "https://example.com/metric"},
+                },
+            }
+        )
+        assert dataset.slice({"geo": ["US"]}).size == [1, 2, 1]
+        with pytest.raises(JSONStatValidationError, match="'metric' has no categories"):
+            dataset.slice({"metric": ["x"]})
+        with pytest.raises(KeyError, match="Unknown dimension"):
+            dataset.slice({"area": ["x"]})
+
+    def test_reordered_categories(self) -> None:
+        """Test that a slice of the same size does not reuse cached positions."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        dataset.cell(time="2020", geo="US")
+        reordered = dataset.slice({"geo": ["AS", "EU", "US"]})
+        assert reordered.cell(time="2020", geo="US") == 1
+        assert reordered.value == [3, 2, 1, 6, 5, 4]
+
+    @pytest.mark.parametrize(
+        ("selection", "error"),
+        [
+            ({"sex": ["F"]}, KeyError),
+            ({"geo": ["XX"]}, KeyError),
+            ({"geo": ["US", "US"]}, ValueError),
+        ],
+    )
+    def test_invalid_selection(self, selection: dict, error: type) -> None:
+        """Test that unknown or repeated categories are rejected."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        with pytest.raises(error):
+            dataset.slice(selection)
+
+
+class TestTranspose:
+    """Test cases for `Dataset.transpose`."""
+
+    @pytest.mark.parametrize("form", ["list", "compact", "compact_python", "sparse"])
+    def test_transpose(self, form: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that every cell keeps its value in the new dimension order."""
+        if form == "compact_python":
+            monkeypatch.setattr(
+                "jsonstat_validator.models.dataset.optional_numpy", lambda: None
+            )
+        data = {**MINIMAL_DATASET, "value": [1, None, 3.5, 4, 5, 6]}
+        if form == "sparse":
+            data["value"] = {"0": 1, "2": 3.5, "3": 4, "4": 5, "5": 6}
+        context = {"compact_values": form.startswith("compact")}
+        dataset = Dataset.model_validate(data, context=context)
+        transposed = dataset.transpose(["geo", "metric", "time"])
+        assert transposed.id == ["geo", "metric", "time"]
+        assert transposed.size == [3, 1, 2]
+        assert list(transposed.dimension) == ["geo", "metric", "time"]
+        for time, geo in product(["2020", "2021"], ["US", "EU", "AS"]):
+            assert transposed.cell(time=time, geo=geo) == dataset.cell(
+                time=time, geo=geo
+            )
+        if form == "sparse":
+            assert transposed.value == {"0": 1, "1": 4, "3": 5, "4": 3.5, "5": 6}
+        else:
+            assert list(transposed.value) == [1, 4, None, 5, 3.5, 6]
+        assert Dataset.model_validate(transposed.model_dump()) == transposed
+
+    def test_status(self) -> None:
+        """Test that per-cell status is permuted and a single one is kept."""
+        dataset = Dataset.model_validate({**MINIMAL_DATASET, "status": list("abcdef")})
+        assert dataset.transpose(["geo", "time", "metric"]).status == list("adbecf")
+        sparse = Dataset.model_validate({**MINIMAL_DATASET, "status": {"4": "e"}})
+        assert sparse.transpose(["geo", "time", "metric"]).status == {"3": "e"}
+        single = Dataset.model_validate({**MINIMAL_DATASET, "status": "e"})
+        assert single.transpose(["geo", "time", "metric"]).status == "e"
+
+    def test_round_trip(self) -> None:
+        """Test that transposing back gives the original dataset."""
+        dataset = Dataset.model_validate_json(
+            (SAMPLES_DIR / "canada.json").read_bytes()
+        )
+        reversed_id = dataset.id[::-1]
+        transposed = dataset.transpose(reversed_id)
+        assert transposed.size == dataset.size[::-1]
+        assert transposed.transpose(dataset.id) == dataset
+
+    @pytest.mark.parametrize(
+        "order", [["time", "geo"], ["time", "geo", "geo"], ["time", "geo", "sex"]]
+    )
+    def test_invalid_order(self, order: list[str]) -> None:
+        """Test that the order must list every dimension once."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        with pytest.raises(ValueError, match="Dimension order"):
+            dataset.transpose(order)
+
+    def test_status_per_stored_value(self) -> None:
+        """Test that a status list of a dict-form value follows its cells."""
+        dataset = Dataset.model_validate(SPARSE_STATUS_DATASET)
+        transposed = dataset.transpose(["geo", "metric", "time"])
+        assert transposed.value == {"2": 2, "5": 6}
+        assert transposed.status == {"2": "x", "5": "y"}
+
+
+class TestConcat:
+    """Test cases for `Dataset.concat`."""
+
+    @pytest.mark.parametrize("form", ["list", "compact", "sparse"])
+    @pytest.mark.parametrize("along", ["time", "geo"])
+    def test_round_trip(self, form: str, along: str) -> None:
+        """Test that joining slices gives back the dataset."""
+        data = {**MINIMAL_DATASET, "value": [1, None, 3.5, 4, 5, 6]}
+        if form == "sparse":
+            data["value"] = {"0": 1, "2": 3.5, "3": 4, "4": 5, "5": 6}
+        dataset = Dataset.model_validate(
+            data, context={"compact_values": form == "compact"}
+        )
+        ids = dataset.dimension[along].category.ids
+        parts = [dataset.slice({along: [category_id]}) for category_id in ids]
+        joined = Dataset.concat(parts, along=along)
+        assert joined.model_dump() == dataset.model_dump()
+        assert type(joined.value) is type(dataset.value)
+
+    def test_append_period(self) -> None:
+        """Test appending a period with labels and a status."""
+        dataset = Dataset.model_validate({**MINIMAL_DATASET, "status": "e"})
+        latest = Dataset.model_validate(
+            {
+                **MINIMAL_DATASET,
+                "size": [1, 1, 3],
+                "value": [7, 8, 9],
+                "status": ["p", "p", "e"],
+                "dimension": {
+                    **MINIMAL_DATASET["dimension"],
+                    "time": {"category": {"index": ["2022"]}},
+                },
+            }
+        )
+        joined = Dataset.concat([dataset, latest], along="time")
+        assert joined.size == [1, 3, 3]
+        assert joined.value == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+        assert joined.status == ["e"] * 6 + ["p", "p", "e"]
+        category = joined.dimension["time"].category
+        assert category.index == ["2020", "2021", "2022"]
+        assert category.label is None
+        assert Dataset.model_validate(joined.model_dump()) == joined
+
+    def test_sparse_status(self) -> None:
+        """Test that a sparse `value` keeps the joined status in dict form."""
+        dataset = Dataset.model_validate(
+            {**MINIMAL_DATASET, "value": {"0": 1, "3": 4}, "status": "e"}
+        )
+        first = dataset.slice({"time": ["2020"]})
+        second = dataset.slice({"time": ["2021"]})._replace(status=["p"])
+        joined = Dataset.concat([first, second], along="time")
+        assert joined.value == {"0": 1, "3": 4}
+        assert joined.status == {
+            "0": "e",
+            "1": "e",
+            "2": "e",
+            "3": "p",
+            "4": "p",
+            "5": "p",
+        }
+        assert Dataset.model_validate(joined.model_dump()) == joined
+
+    def test_labels_and_children(self) -> None:
+        """Test that labels are not made up and merged children are checked."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        first, second = (dataset.slice({"time": [t]}) for t in ("2020", "2021"))
+        labelled = second.dimension["time"].category.model_copy(
+            update={"label": {"2021": "2021*"}}
+        )
+        with pytest.raises(ValueError, match="all have labels"):
+            Dataset.concat(
+                [first, with_category(second, "time", labelled)], along="time"
+            )
+        parts = [
+            with_category(
+                part, "time", part.dimension["time"].category.model_copy(update=child)
+            )
+            for part, child in (
+                (first, {"child": {"2020": ["2021"]}}),
+                (second, {"child": {"2021": ["2020"]}}),
+            )
+        ]
+        with pytest.raises(JSONStatValidationError, match="Cycle in `child`"):
+            Dataset.concat(parts, along="time")
+
+    def test_href_only_dimension(self) -> None:
+        """Test that a dimension without categories cannot be joined along."""
+        dataset = Dataset.model_validate(
+            {
+                **MINIMAL_DATASET,
+                "dimension": {
+                    **MINIMAL_DATASET["dimension"],
+                    "metric": {"href": "https://example.com/metric"},
+                },
+            }
+        )
+        with pytest.raises(JSONStatValidationError, match="'metric' has no categories"):
+            Dataset.concat([dataset, dataset], along="metric")
+
+    def test_status_forms(self) -> None:
+        """Test that a shared status is kept and missing ones are left out."""
+        dataset = Dataset.model_validate({**MINIMAL_DATASET, "status": "e"})
+        parts = [dataset.slice({"geo": [geo]}) for geo in ("US", "EU", "AS")]
+        assert Dataset.concat(parts, along="geo").status == "e"
+        parts[1] = parts[1]._replace(status=None)
+        assert Dataset.concat(parts, along="geo").status == {
+            "0": "e",
+            "2": "e",
+            "3": "e",
+            "5": "e",
+        }
+
+    def test_invalid_datasets(self) -> None:
+        """Test that datasets that do not line up are rejected."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        with pytest.raises(ValueError, match="Category '2020'"):
+            Dataset.concat([dataset, dataset], along="time")
+        with pytest.raises(KeyError):
+            Dataset.concat([dataset], along="sex")
+        first, second = (dataset.slice({"time": [t]}) for t in ("2020", "2021"))
+        with pytest.raises(ValueError, match="Dimension 'geo' differs"):
+            Dataset.concat([first, second.slice({"geo": ["US"]})], along="time")
+        with pytest.raises(ValueError, match="same dimensions"):
+            Dataset.concat(
+                [first, second.transpose(["geo", "time", "metric"])], along="time"
+            )
+        with pytest.raises(ValueError, match="No datasets"):
+            Dataset.concat([], along="time")
+
+
+class TestIterRows:
+    """Test cases for `Dataset.iter_rows`."""
+
+    ROWS = [
+        ("pop", "2020", "US", 1),
+        ("pop", "2020", "EU", 2),
+        ("pop", "2020", "AS", 3),
+        ("pop", "2021", "US", 4),
+        ("pop", "2021", "EU", 5),
+        ("pop", "2021", "AS", 6),
+    ]
+
+    def test_rows(self) -> None:
+        """Test that rows follow value order, with the status appended."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        rows = dataset.iter_rows()
+        assert not isinstance(rows, list)
+        assert list(rows) == [(*row, None) for row in self.ROWS]
+        assert list(dataset.iter_rows(include_status=False)) == self.ROWS
+
+    def test_labels(self) -> None:
+        """Test that labels replace IDs where categories have them."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        rows = dataset.iter_rows(labels=True, include_status=False)
+        assert next(rows) == ("Population", "2020", "US", 1)
+
+    @pytest.mark.parametrize(
+        ("status", "expected"),
+        [
+            ("e", ["e"] * 6),
+            (["e"], ["e"] * 6),
+            (list("abcdef"), list("abcdef")),
+            ({"1": "b", "4": "e"}, [None, "b", None, None, "e", None]),
+        ],
+    )
+    def test_status(self, status: object, expected: list) -> None:
+        """Test that every status form gives one status per row."""
+        dataset = Dataset.model_validate({**MINIMAL_DATASET, "status": status})
+        assert [row[-1] for row in dataset.iter_rows()] == expected
+        sparse = dataset.to_sparse()
+        assert [row[-1] for row in sparse.iter_rows()] == expected
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_skip_null(self, compact: bool) -> None:
+        """Test that null cells are skipped unless asked for."""
+        data = {**MINIMAL_DATASET, "value": [1, None, 3, None, None, 6]}
+        dataset = Dataset.model_validate(data, context={"compact_values": compact})
+        kept = [self.ROWS[0], self.ROWS[2], self.ROWS[5]]
+        assert list(dataset.iter_rows(include_status=False)) == kept
+        every = list(dataset.iter_rows(include_status=False, skip_null=False))
+        assert [row[-1] for row in every] == data["value"]
+
+    def test_sparse_values(self) -> None:
+        """Test that dict-form values give the same rows as dense ones."""
+        dataset = Dataset.model_validate(
+            {**MINIMAL_DATASET, "value": {"5": 6, "1": 2, "3": None}}
+        )
+        assert list(dataset.iter_rows(include_status=False)) == [
+            self.ROWS[1],
+            self.ROWS[5],
+        ]
+        dense = dataset.to_dense()
+        for skip_null in (False, True):
+            assert list(dataset.iter_rows(skip_null=skip_null)) == list(
+                dense.iter_rows(skip_null=skip_null)
+            )
+
+    def test_status_per_stored_value(self) -> None:
+        """Test that a status list of a dict-form value follows its cells."""
+        dataset = Dataset.model_validate(SPARSE_STATUS_DATASET)
+        rows = list(dataset.iter_rows(skip_null=False))
+        assert [row[-2:] for row in rows] == [
+            (None, None),
+            (2, "x"),
+            (None, None),
+            (None, None),
+            (None, None),
+            (6, "y"),
+        ]
+        assert list(dataset.iter_rows()) == [
+            ("pop", "2020", "EU", 2, "x"),
+            ("pop", "2021", "AS", 6, "y"),
+        ]
@@ -36,12 +36,12 @@ class TestDatasetValidCases:
         """Test that a dataset with sparse values validates successfully."""
         data = copy.deepcopy(MINIMAL_DATASET)
         data["value"] = {
-            "0:0": 1,
-            "0:1": 2,
-            "0:2": 3,
-            "1:0": 4,
-            "1:1": 5,
-            "1:2": 6,
+            "0": 1,
+            "1": 2,
+            "2": 3,
+            "3": 4,
+            "4": 5,
+            "5": 6,
         }
         assert validate_jsonstat(data) is True
 
@@ -108,6 +108,56 @@ class TestDatasetInvalidCases:
         with pytest.raises(JSONStatValidationError):
             validate_jsonstat(data)
 
+    @pytest.mark.parametrize(
+        "keys", [["6"], ["-1"], ["01"], ["1.0"], [" 1"], ["1_0"], [""], ["9" * 30]]
+    )
+    @pytest.mark.parametrize("field", ["value", "status"])
+    def test_invalid_dict_keys(self, field: str, keys: list[str]) -> None:
+        """Test that dict keys must be positions inside the cube."""
+        data = copy.deepcopy(MINIMAL_DATASET)
+        data[field] = dict.fromkeys(["0", *keys], "A")
+        with pytest.raises(JSONStatValidationError, match=f"`{field}` keys"):
+            validate_jsonstat(data)
+
+    @pytest.mark.parametrize("value", [[1, 2, 3, 4, 5], [1] * 7, [1], []])
+    def test_value_length_mismatch(self, value: list) -> None:
+        """Test that a dense value needs one entry per cell."""
+        data = copy.deepcopy(MINIMAL_DATASET)
+        data["value"] = value
+        with pytest.raises(JSONStatValidationError, match="number of cells"):
+            validate_jsonstat(data)
+
+    def test_constant_cube(self) -> None:
+        """Test that a dataset without dimensions has a single cell."""
+        data = copy.deepcopy(MINIMAL_DATASET)
+        data.update(id=[], size=[], dimension={}, value=[42])
+        assert validate_jsonstat(data) is True
+
+    def test_invalid_dict_keys_reported(self) -> None:
+        """Test that only the first offending keys are listed."""
+        data = copy.deepcopy(MINIMAL_DATASET)
+        data["value"] = {str(i): i for i in range(100)}
+        with pytest.raises(JSONStatValidationError) as error:
+            validate_jsonstat(data)
+        assert "below 6; invalid keys: '6', '7', '8', '9', '10'" in str(error.value)
+        assert "'11'" not in str(error.value)
+
+    @pytest.mark.parametrize("mode", ["model", "check"])
+    def test_keys_beyond_int64(self, mode: str) -> None:
+        """Test dict keys in a cube of more cells than int64 can count."""
+        data = copy.deepcopy(MINIMAL_DATASET)
+        data["size"] = [2**40, 2**40]
+        data["dimension"] = {
+            "time": {"href": "https://example.com/time"},
+            "geo": {"href": "https://example.com/geo"},
+        }
+        data["value"] = {"0": 1, str(2**80 - 1): 2}
+        assert validate_jsonstat(data, mode=mode) is True
+        data["value"] = {"0": 1, str(2**63): 2, str(2**80): 3}
+        with pytest.raises(JSONStatValidationError) as error:
+            validate_jsonstat(data, mode=mode)
+        assert f"invalid keys: '{2**80}'" in str(error.value)
+
     def test_missing_dimension_definition(self) -> None:
         """Test that missing dimension definition fails validation."""
         data = copy.deepcopy(MINIMAL_DATASET)
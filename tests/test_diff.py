@@ -0,0 +1,177 @@
+"""Test cases for cell-level dataset differences."""
+
+import pytest
+
+from jsonstat_validator import Dataset, JSONStatValidationError
+
+OLD = {
+    "version": "2.0",
+    "class": "dataset",
+    "id": ["time", "geo"],
+    "size": [2, 3],
+    "value": [1, 2, 3, 4, 5, None],
+    "status": "e",
+    "dimension": {
+        "time": {"category": {"index": ["2020", "2021"]}},
+        "geo": {
+            "category": {
+                "index": ["US", "EU", "AS"],
+                "label": {"US": "U.S.", "EU": "E.U.", "AS": "Asia"},
+            }
+        },
+    },
+}
+
+# The same cube with geo first and categories reordered: EU 2021 changed from
+# 5 to 50, AS 2020 from 3 to null.
+NEW = {
+    "version": "2.0",
+    "class": "dataset",
+    "id": ["geo", "time"],
+    "size": [3, 2],
+    "value": [50, 2, 4, 1, None, None],
+    "status": "e",
+    "dimension": {
+        "time": {"category": {"index": ["2021", "2020"]}},
+        "geo": {"category": {"index": ["EU", "US", "AS"]}},
+    },
+}
+
+
+def load(data: dict, form: str) -> Dataset:
+    """Validate a dataset with list, compact or dict-form values."""
+    if form == "sparse":
+        return Dataset.model_validate(data).to_sparse()
+    return Dataset.model_validate(data, context={"compact_values": form != "list"})
+
+
+class TestDiff:
+    """Test cases for `Dataset.diff`."""
+
+    @pytest.mark.parametrize("form", ["list", "compact", "compact_python", "sparse"])
+    def test_changed_cells(self, form: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that cells are aligned by category across orders."""
+        if form == "compact_python":
+            monkeypatch.setattr("jsonstat_validator.diff.optional_numpy", lambda: None)
+        diff = load(OLD, form).diff(load(NEW, form))
+        assert sorted(zip(diff.changed_old, diff.changed_new, strict=True)) == [
+            (2, 5),
+            (4, 0),
+        ]
+        assert not diff.added
+        assert not diff.removed
+        assert not diff.status_old
+        assert list(diff.iter_rows()) == [
+            ("changed", "2020", "AS", 3, None),
+            ("changed", "2021", "EU", 5, 50),
+        ]
+
+    def test_identical(self) -> None:
+        """Test that a dataset does not differ from itself."""
+        dataset = Dataset.model_validate(OLD)
+        diff = dataset.diff(dataset)
+        assert not diff
+        assert repr(diff) == "DatasetDiff(changed=0, added=0, removed=0, status=0)"
+
+    def test_added_and_removed(self) -> None:
+        """Test that non-null cells of new and dropped categories are listed."""
+        old = Dataset.model_validate(OLD)
+        new = old.slice({"geo": ["US", "AS"]})
+        new = Dataset.concat(
+            [
+                new,
+                Dataset.model_validate(
+                    {
+                        **OLD,
+                        "size": [2, 1],
+                        "value": [None, 7],
+                        "dimension": {
+                            **OLD["dimension"],
+                            "geo": {
+                                "category": {
+                                    "index": ["JP"],
+                                    "label": {"JP": "Japan"},
+                                }
+                            },
+                        },
+                    }
+                ),
+            ],
+            along="geo",
+        )
+        diff = old.diff(new)
+        assert list(diff.added) == [5]
+        assert list(diff.removed) == [1, 4]
+        assert list(diff.iter_rows(labels=True)) == [
+            ("added", "2021", "Japan", None, 7),
+            ("removed", "2020", "E.U.", 2, None),
+            ("removed", "2021", "E.U.", 5, None),
+        ]
+
+    def test_status_changes(self) -> None:
+        """Test that status changes are listed apart from value changes."""
+        old = Dataset.model_validate(OLD)
+        new = Dataset.model_validate({**OLD, "status": ["e", "e", "p", "e", "e", "e"]})
+        diff = old.diff(new)
+        assert not diff.changed_old
+        assert list(diff.status_old) == list(diff.status_new) == [2]
+        assert list(diff.iter_rows()) == [("status", "2020", "AS", "e", "p")]
+        sparse = Dataset.model_validate({**OLD, "status": {"2": "p"}})
+        assert list(old.diff(sparse).status_old) == [0, 1, 2, 3, 4, 5]
+
+    def test_different_dimensions(self) -> None:
+        """Test that datasets with other dimensions are rejected."""
+        old = Dataset.model_validate(OLD)
+        other = Dataset.model_validate(
+            {
+                **OLD,
+                "id": ["time", "area"],
+                "dimension": {
+                    "time": OLD["dimension"]["time"],
+                    "area": OLD["dimension"]["geo"],
+                },
+            }
+        )
+        with pytest.raises(ValueError, match="same dimensions"):
+            old.diff(other)
+
+    @pytest.mark.parametrize("form", ["list", "compact", "compact_python"])
+    def test_categories_removed_only(
+        self, form: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that only the cells of dropped categories are removed."""
+        if form == "compact":
+            pytest.importorskip("numpy")
+        if form == "compact_python":
+            monkeypatch.setattr("jsonstat_validator.diff.optional_numpy", lambda: None)
+        old = load(OLD, form)
+        new = load(OLD, form).slice({"geo": ["US", "EU"]})
+        diff = old.diff(new)
+        assert not diff.changed_old
+        assert list(diff.removed) == [2]
+        assert list(diff.iter_rows()) == [("removed", "2020", "AS", 3, None)]
+
+    @pytest.mark.parametrize("form", ["list", "compact", "sparse"])
+    def test_href_only_dimension(self, form: str) -> None:
+        """Test that a dimension without categories is compared by position."""
+        data = {
+            **OLD,
+            "id": ["time", "geo", "metric"],
+            "size": [2, 3, 2],
+            "value": list(range(12)),
+            "dimension": {
+                **OLD["dimension"],
+                "metric": {"href": "https://example.com/metric"},
+            },
+        }
+        dataset = load(data, form)
+        assert not dataset.diff(load(data, form))
+        changed = load({**data, "value": [*range(11), 50]}, form)
+        assert list(dataset.diff(changed).iter_rows()) == [
+            ("changed", "2021", "AS", None, 11, 50)
+        ]
+        other = Dataset.model_validate(
+            {**data, "size": [2, 3, 1], "value": list(range(6))}
+        )
+        with pytest.raises(JSONStatValidationError, match="'metric' has no categories"):
+            dataset.diff(other)
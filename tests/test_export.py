@@ -0,0 +1,102 @@
+"""Test cases for CSV export."""
+
+import csv
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from jsonstat_validator import Dataset, JSONStatValidationError, to_csv
+
+SAMPLES_DIR = Path(__file__).parent / "samples"
+
+MINIMAL_DATASET = {
+    "version": "2.0",
+    "class": "dataset",
+    "id": ["time", "geo"],
+    "size": [2, 2],
+    "value": [1.5, None, 3, 4],
+    "status": ["a", "b", "c", "d"],
+    "dimension": {
+        "time": {"category": {"index": ["2020", "2021"]}},
+        "geo": {
+            "category": {"index": ["US", "EU"], "label": {"US": "U.S.", "EU": "E.U."}}
+        },
+    },
+}
+
+EXPECTED = (
+    "time,geo,value,status\r\n"
+    "2020,US,1.5,a\r\n"
+    "2020,EU,,b\r\n"
+    "2021,US,3,c\r\n"
+    "2021,EU,4,d\r\n"
+)
+
+
+def export(dataset: Dataset, **options: object) -> str:
+    """Return the CSV text of a dataset."""
+    out = io.StringIO(newline="")
+    to_csv(dataset, out, **options)
+    return out.getvalue()
+
+
+class TestToCSV:
+    """Test cases for `to_csv`."""
+
+    @pytest.mark.parametrize("chunk_rows", [1, 3, 10_000])
+    def test_rows(self, chunk_rows: int) -> None:
+        """Test that chunking does not affect the output."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        assert export(dataset, chunk_rows=chunk_rows) == EXPECTED
+
+    def test_options(self) -> None:
+        """Test labels, status, null and delimiter options."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        text = export(
+            dataset, labels=True, include_status=False, skip_null=True, delimiter="\t"
+        )
+        assert text == (
+            "time\tgeo\tvalue\r\n2020\tU.S.\t1.5\r\n2021\tU.S.\t3\r\n2021\tE.U.\t4\r\n"
+        )
+
+    def test_row_count(self) -> None:
+        """Test that the number of data rows is returned."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        assert to_csv(dataset, io.StringIO()) == 4
+        assert to_csv(dataset, io.StringIO(), skip_null=True) == 3
+
+    def test_paths(self, tmp_path: Path) -> None:
+        """Test reading a dataset file and writing to a path."""
+        source = tmp_path / "dataset.json"
+        source.write_text(json.dumps(MINIMAL_DATASET))
+        target = tmp_path / "dataset.csv"
+        assert to_csv(source, target) == 4
+        assert target.read_bytes().decode() == EXPECTED
+
+    def test_official_sample(self, tmp_path: Path) -> None:
+        """Test that a sample exports a row per cell."""
+        target = tmp_path / "canada.csv"
+        to_csv(SAMPLES_DIR / "canada.json", target)
+        with target.open(newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == [
+            "country",
+            "year",
+            "age",
+            "concept",
+            "sex",
+            "value",
+            "status",
+        ]
+        assert len(rows) == 1 + 120
+
+    def test_invalid_files(self, tmp_path: Path) -> None:
+        """Test that invalid files and non-datasets are rejected."""
+        invalid = tmp_path / "invalid.json"
+        invalid.write_text(json.dumps({**MINIMAL_DATASET, "size": [2]}))
+        with pytest.raises(JSONStatValidationError):
+            to_csv(invalid, io.StringIO())
+        with pytest.raises(JSONStatValidationError, match="Expected a dataset"):
+            to_csv(SAMPLES_DIR / "collection.json", io.StringIO())
@@ -0,0 +1,149 @@
+"""Test cases for the check-only validation engine."""
+
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from jsonstat_validator.models.base import JSONStatSchema
+from jsonstat_validator.utils import JSONStatValidationError
+from jsonstat_validator.validator import validate_jsonstat
+
+SAMPLES_DIR = Path(__file__).parent / "samples"
+
+MINIMAL_DATASET = {
+    "version": "2.0",
+    "class": "dataset",
+    "id": ["time", "geo"],
+    "size": [2, 3],
+    "value": [1, 2, 3, 4, 5, 6],
+    "dimension": {
+        "time": {"category": {"index": ["2020", "2021"]}},
+        "geo": {"category": {"index": {"US": 0, "EU": 1, "AS": 2}}},
+    },
+}
+
+
+def dataset(**changes: object) -> dict:
+    """Return a copy of the minimal dataset with some members replaced."""
+    data = copy.deepcopy(MINIMAL_DATASET)
+    data.update(changes)
+    return data
+
+
+def dimension(**category: object) -> dict:
+    """Return a root dimension with the given category."""
+    return {"version": "2.0", "class": "dimension", "category": category}
+
+
+VALID_DOCUMENTS = [
+    dataset(),
+    dataset(value={"0": 1, "5": None}, status={"0": "e"}),
+    dataset(value=[1, 2.5, None, "4", True, 6], status="e"),
+    dataset(role={"time": ["time"], "geo": ["geo"]}, updated="2020-01-01"),
+    dataset(size=["2", 3.0]),
+    dataset(size=["2.0", " 3 "], label=None, source=None),
+    dataset(link={"alternate": [{"href": "https://example.com", "type": "text/csv"}]}),
+    dimension(index=["a", "b"], label={"a": "A", "b": "B"}, child={"a": ["b"]}),
+    dimension(
+        index=["gdp"], unit={"gdp": {"decimals": 1, "symbol": "$", "position": "start"}}
+    ),
+    dimension(label={"only": "Constant"}),
+    {
+        "class": "collection",
+        "link": {"item": [{"class": "dataset", "href": "https://example.com/a"}]},
+    },
+    {"class": "collection", "link": {"item": [copy.deepcopy(MINIMAL_DATASET)]}},
+]
+
+INVALID_DOCUMENTS = [
+    {"version": "2.0"},
+    {"version": "2.0", "class": "unknown"},
+    {"version": "2.0", "class": "dataset"},
+    dataset(size=[2]),
+    dataset(size=[2, -3]),
+    dataset(size="value1"),
+    dataset(id=["time", "time"]),
+    dataset(version=2.0),
+    dataset(version=None),
+    dataset(size=[float("nan"), 3]),
+    dataset(value=[1, 2, [3], 4, 5, 6]),
+    dataset(value="not_array_or_dict"),
+    dataset(status=["A", "B"]),
+    dataset(status=[1, 2, 3, 4, 5, 6]),
+    dataset(value=[1, 2, 3, 4, 5]),
+    dataset(value={"0": 1, "6": 2}),
+    dataset(value={"01": 1, "-1": 2, " 2": 3}),
+    dataset(value={"0": 1}, status={"0:0": "e"}),
+    dataset(updated="invalid-date-format"),
+    dataset(role={}),
+    dataset(role={"time": ["time"], "geo": ["time"]}),
+    dataset(role={"time": ["unknown"]}),
+    dataset(link={"bogus": []}),
+    dataset(link={"item": [{"href": "https://example.com"}]}),
+    dataset(href="not a url"),
+    dataset(extra="member"),
+    dataset(dimension={"time": {"category": {"index": ["2020", "2021"]}}}),
+    dimension(index=["a", "a"]),
+    dimension(index={"a": "x"}),
+    dimension(index=["a", "b"], label={"a": "A"}),
+    dimension(index=["a"], child={"a": ["b"]}),
+    dimension(index=["a", "b"], child={"a": ["b"], "b": ["a"]}),
+    dimension(index=["a"], coordinates={"a": [1.0]}),
+    dimension(index=["a"], coordinates={"a": ["x", 1.0]}),
+    dimension(index=["a"], unit={"a": {"symbol": "$"}}),
+    dimension(index=["a"], unit={"b": {"decimals": 0}}),
+    dimension(index=["a"], unit={"a": {"decimals": 1.5}}),
+    dimension(index=["a"], unit={"a": {"decimals": 1, "position": "middle"}}),
+    dimension(),
+    {"class": "dimension"},
+    {"class": "collection", "link": {"item": [{"label": "no href"}]}},
+    {"class": "collection", "link": {"next": [{"href": "https://example.com"}]}},
+]
+
+
+class TestCheckMode:
+    """Test cases for `validate_jsonstat(..., mode="check")`."""
+
+    @pytest.mark.parametrize("data", VALID_DOCUMENTS)
+    def test_valid_documents(self, data: dict) -> None:
+        """Test that both engines accept the same valid documents."""
+        assert validate_jsonstat(data) is True
+        assert validate_jsonstat(data, mode="check") is True
+
+    @pytest.mark.parametrize("data", INVALID_DOCUMENTS)
+    def test_invalid_documents(self, data: dict) -> None:
+        """Test that both engines reject the same invalid documents."""
+        with pytest.raises(JSONStatValidationError):
+            validate_jsonstat(data)
+        with pytest.raises(JSONStatValidationError):
+            validate_jsonstat(data, mode="check")
+
+    @pytest.mark.parametrize("data", INVALID_DOCUMENTS)
+    def test_same_errors(self, data: dict) -> None:
+        """Test that both engines report the same first error."""
+        with pytest.raises(JSONStatValidationError) as model_error:
+            validate_jsonstat(data)
+        with pytest.raises(JSONStatValidationError) as check_error:
+            validate_jsonstat(data, mode="check")
+        # The model engine lists every type error, the check engine the first.
+        model_lines = str(model_error.value).splitlines()
+        assert str(check_error.value).splitlines() == model_lines[:2]
+
+    @pytest.mark.parametrize(
+        "sample_path", sorted(SAMPLES_DIR.rglob("*.json")), ids=str
+    )
+    def test_official_samples(self, sample_path: Path) -> None:
+        """Test that official samples pass the check engine."""
+        data = json.loads(sample_path.read_text(encoding="utf-8"))
+        assert validate_jsonstat(data, mode="check") is True
+
+    def test_builds_no_models(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the check engine never goes through the models."""
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("models must not be built in check mode")
+
+        monkeypatch.setattr(JSONStatSchema, "model_validate", fail)
+        assert validate_jsonstat(MINIMAL_DATASET, mode="check") is True
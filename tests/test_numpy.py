@@ -0,0 +1,111 @@
+"""Test cases for NumPy interop."""
+
+import pytest
+
+from jsonstat_validator import Dataset, JSONStatSchema
+from jsonstat_validator.values import CompactValues
+
+np = pytest.importorskip("numpy")
+
+MINIMAL_DATASET = {
+    "version": "2.0",
+    "class": "dataset",
+    "id": ["time", "geo"],
+    "size": [2, 3],
+    "value": [1.5, None, 3, 4, 5, 6],
+    "dimension": {
+        "time": {"category": {"index": ["2020", "2021"]}},
+        "geo": {"category": {"index": ["US", "EU", "JP"]}},
+    },
+}
+
+
+def compact(data: dict) -> Dataset:
+    """Validate a dataset with compact value storage."""
+    return JSONStatSchema.model_validate(data, context={"compact_values": True}).root
+
+
+class TestToNumpy:
+    """Test cases for `Dataset.to_numpy`."""
+
+    @pytest.mark.parametrize("store", [Dataset.model_validate, compact])
+    def test_shape_and_nulls(self, store) -> None:
+        """Test that values are reshaped by `size`, with NaN for nulls."""
+        array = store(MINIMAL_DATASET).to_numpy()
+        assert array.shape == (2, 3)
+        assert array.dtype == np.float64
+        np.testing.assert_array_equal(array, [[1.5, np.nan, 3], [4, 5, 6]])
+
+    def test_sparse_values(self) -> None:
+        """Test that dict-form values are filled in with nulls."""
+        dataset = Dataset.model_validate({**MINIMAL_DATASET, "value": {"5": 6}})
+        array = dataset.to_numpy(null=0)
+        np.testing.assert_array_equal(array, [[0, 0, 0], [0, 0, 6]])
+
+    def test_dtype_and_null(self) -> None:
+        """Test the dtype and null fill options."""
+        dataset = compact(MINIMAL_DATASET)
+        array = dataset.to_numpy(dtype=np.float32, null=-1)
+        assert array.dtype == np.float32
+        np.testing.assert_array_equal(array, [[1.5, -1, 3], [4, 5, 6]])
+        assert dataset.value[1] is None
+
+    def test_zero_copy(self) -> None:
+        """Test that compact values without nulls are viewed, not copied."""
+        dataset = compact({**MINIMAL_DATASET, "value": [1, 2, 3, 4, 5, 6]})
+        array = dataset.to_numpy()
+        assert array.dtype == np.int64
+        assert np.shares_memory(array, np.frombuffer(dataset.value.data, np.int64))
+        with pytest.raises(ValueError, match="read-only"):
+            array[0, 0] = 0
+
+    def test_strings(self) -> None:
+        """Test that string values give an object array."""
+        dataset = Dataset.model_validate(
+            {**MINIMAL_DATASET, "value": ["a", None, 1, 2, 3, 4]}
+        )
+        array = dataset.to_numpy(null=None)
+        assert array.dtype == object
+        assert array.tolist() == [["a", None, 1], [2, 3, 4]]
+
+
+class TestFromNumpy:
+    """Test cases for `Dataset.from_numpy`."""
+
+    DIMENSIONS = {"time": ["2020", "2021"], "geo": ["US", "EU", "JP"]}
+
+    def test_float_array(self) -> None:
+        """Test that NaN cells become nulls in a valid dataset."""
+        array = np.array([[1.5, np.nan, 3], [4, 5, 6]])
+        dataset = Dataset.from_numpy(array, self.DIMENSIONS)
+        assert isinstance(dataset.value, CompactValues)
+        assert dataset == Dataset.model_validate(
+            {**MINIMAL_DATASET, "value": [1.5, None, 3.0, 4.0, 5.0, 6.0]}
+        )
+        np.testing.assert_array_equal(dataset.to_numpy(), array)
+
+    def test_integer_and_masked_arrays(self) -> None:
+        """Test integer arrays, with masked cells as nulls."""
+        array = np.ma.array(
+            np.arange(6, dtype=np.uint8).reshape(2, 3), mask=[[0, 1, 0], [0, 0, 0]]
+        )
+        dataset = Dataset.from_numpy(array, self.DIMENSIONS)
+        assert dataset.value == [0, None, 2, 3, 4, 5]
+        assert dataset.value.kind == "q"
+
+    def test_other_arrays(self) -> None:
+        """Test that other arrays are validated as lists."""
+        dataset = Dataset.from_numpy(np.array(["a", "b"]), {"geo": ["US", "EU"]})
+        assert dataset.value == ["a", "b"]
+        with pytest.raises(ValueError):
+            Dataset.from_numpy(np.array([{}, {}]), {"geo": ["US", "EU"]})
+
+    def test_category_ids(self) -> None:
+        """Test that category IDs are converted to strings."""
+        dataset = Dataset.from_numpy(np.zeros(3), {"year": range(2020, 2023)})
+        assert dataset.dimension["year"].category.index == ["2020", "2021", "2022"]
+
+    def test_shape_mismatch(self) -> None:
+        """Test that the shape must match the number of categories."""
+        with pytest.raises(ValueError, match="does not match"):
+            Dataset.from_numpy(np.zeros((3, 2)), self.DIMENSIONS)
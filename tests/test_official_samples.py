@@ -11,7 +11,7 @@ from pathlib import Path
 import pytest
 
 from jsonstat_validator.utils import JSONStatValidationError
-from jsonstat_validator.validator import validate_jsonstat
+from jsonstat_validator.validator import validate_jsonstat, validate_jsonstat_json
 
 # Get the path to the samples directory
 TESTS_DIR = Path(__file__).parent
@@ -42,5 +42,15 @@ def test_official_sample(sample_path: Path) -> None:
         pytest.fail(f"Failed to validate {sample_path}: {e}")
 
 
+@pytest.mark.parametrize("sample_path", official_samples_files)
+def test_official_sample_json(sample_path: Path) -> None:
+    """Test that official JSON-stat samples validate from raw bytes."""
+    try:
+        result = validate_jsonstat_json(sample_path)
+        assert result is True, f"Failed to validate {sample_path}"
+    except JSONStatValidationError as e:
+        pytest.fail(f"Failed to validate {sample_path}: {e}")
+
+
 if __name__ == "__main__":
     pytest.main(["-vs", __file__])
@@ -0,0 +1,201 @@
+"""Test cases for the streaming validator."""
+
+import copy
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from jsonstat_validator.stream import (
+    _JSONStream,
+    _last_comma,
+    validate_jsonstat_stream,
+)
+from jsonstat_validator.utils import JSONStatValidationError
+from jsonstat_validator.validator import validate_jsonstat
+
+SAMPLES_DIR = Path(__file__).parent / "samples"
+
+MINIMAL_DATASET = {
+    "version": "2.0",
+    "class": "dataset",
+    "id": ["time", "geo"],
+    "size": [2, 3],
+    "value": [1, 2.5, None, "4", 5, 6],
+    "status": ["a", "b", "c", "d", "e", "f"],
+    "dimension": {
+        "time": {"category": {"index": ["2020", "2021"]}},
+        "geo": {"category": {"index": {"US": 0, "EU": 1, "AS": 2}}},
+    },
+}
+
+
+def stream_of(data: dict, *, binary: bool = False, indent: int | None = None):
+    """Serialize a document into an in-memory file object."""
+    text = json.dumps(data, indent=indent)
+    return io.BytesIO(text.encode()) if binary else io.StringIO(text)
+
+
+class TestStreamValidCases:
+    """Test cases for documents that stream-validate successfully."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 1 << 16])
+    @pytest.mark.parametrize("binary", [False, True])
+    def test_minimal_dataset(self, chunk_size: int, binary: bool) -> None:
+        """Test that chunk boundaries never affect the result."""
+        fp = stream_of(MINIMAL_DATASET, binary=binary, indent=2)
+        assert validate_jsonstat_stream(fp, chunk_size=chunk_size) is True
+
+    def test_sparse_values(self) -> None:
+        """Test that dict-form value and status are streamed."""
+        data = copy.deepcopy(MINIMAL_DATASET)
+        data["value"] = {"0": 1, "5": "x,y", "3": None}
+        data["status"] = {"0": "a", "5": "b"}
+        assert validate_jsonstat_stream(stream_of(data), chunk_size=5) is True
+
+    def test_value_before_metadata(self) -> None:
+        """Test that member order does not matter."""
+        data = {"value": MINIMAL_DATASET["value"]}
+        data.update({k: v for k, v in MINIMAL_DATASET.items() if k != "value"})
+        assert validate_jsonstat_stream(stream_of(data), chunk_size=4) is True
+
+    def test_large_value_array(self) -> None:
+        """Test a value array spanning many chunks."""
+        data = copy.deepcopy(MINIMAL_DATASET)
+        data["id"] = ["cell"]
+        data["size"] = [50_000]
+        data["value"] = [i * 0.5 if i % 7 else None for i in range(50_000)]
+        data["status"] = "e"
+        data["dimension"] = {
+            "cell": {"category": {"index": [str(i) for i in range(50_000)]}}
+        }
+        assert validate_jsonstat_stream(stream_of(data), chunk_size=4096) is True
+
+    @pytest.mark.parametrize(
+        "sample_path", sorted(SAMPLES_DIR.rglob("*.json")), ids=str
+    )
+    def test_official_samples(self, sample_path: Path) -> None:
+        """Test that official samples stream-validate successfully."""
+        assert validate_jsonstat_stream(sample_path, chunk_size=256) is True
+
+
+class TestBatches:
+    """Test cases for cutting `value`/`status` members into batches."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("1, 2, 3,", 7),
+            ('"a", "b,', 3),
+            ('"a,b", "c,', 5),
+            ('"a\\\\", "b,', 5),
+            ('"a\\"b", "c,', 6),
+            ('"a,', -1),
+        ],
+    )
+    def test_last_comma(self, text: str, expected: int) -> None:
+        """Test that a comma inside a string cut by the end of `text` is skipped."""
+        assert _last_comma(text) == expected
+
+    @pytest.mark.parametrize("cell", ["a,b", ",", 'a\\",b', "a\\\\,b"])
+    def test_commas_in_strings(self, cell: str) -> None:
+        """Test that strings with commas are decoded in batches, not one by one."""
+        cells = [f"{cell}{i}" for i in range(500)]
+        stream = _JSONStream(io.StringIO(json.dumps(cells)[1:]), chunk_size=64)
+        batches = list(stream.items("]"))
+        assert [item for batch in batches for item in batch] == cells
+        assert len(batches) < len(cells) / 2
+
+
+class TestStreamInvalidCases:
+    """Test cases for documents that fail streaming validation."""
+
+    def test_invalid_value_element(self) -> None:
+        """Test that an offending cell is reported by position."""
+        data = copy.deepcopy(MINIMAL_DATASET)
+        data["value"][4] = {"nested": 1}
+        with pytest.raises(JSONStatValidationError, match=r"value\[4\]"):
+            validate_jsonstat_stream(stream_of(data), chunk_size=8)
+
+    @pytest.mark.parametrize(
+        ("field", "cells"),
+        [
+            ("value", [1, 2, 3, {}, 5, 6]),
+            ("value", {"0": 1, "4": []}),
+            ("status", {"3": 1}),
+        ],
+    )
+    def test_same_error_as_models(self, field: str, cells: object) -> None:
+        """Test that offending cells are located as `validate_jsonstat` does."""
+        data = {**MINIMAL_DATASET, field: cells}
+        with pytest.raises(JSONStatValidationError) as from_models:
+            validate_jsonstat(data)
+        with pytest.raises(JSONStatValidationError) as streamed:
+            validate_jsonstat_stream(stream_of(data), chunk_size=8)
+        assert str(streamed.value) == str(from_models.value)
+
+    def test_invalid_status_element(self) -> None:
+        """Test that an offending status is reported by key."""
+        data = copy.deepcopy(MINIMAL_DATASET)
+        data["status"] = {"0": "a", "3": 1}
+        with pytest.raises(JSONStatValidationError, match=r"status\.3"):
+            validate_jsonstat_stream(stream_of(data))
+
+    def test_status_length_mismatch(self) -> None:
+        """Test that the status length is checked against the streamed value."""
+        data = copy.deepcopy(MINIMAL_DATASET)
+        data["status"] = ["a", "b"]
+        with pytest.raises(JSONStatValidationError, match="Status list"):
+            validate_jsonstat_stream(stream_of(data))
+
+    def test_value_length_mismatch(self) -> None:
+        """Test that the streamed value length is checked against the size."""
+        data = copy.deepcopy(MINIMAL_DATASET)
+        data["value"].append(7)
+        with pytest.raises(JSONStatValidationError, match="number of cells"):
+            validate_jsonstat_stream(stream_of(data), chunk_size=8)
+
+    @pytest.mark.parametrize("field", ["value", "status"])
+    def test_dict_key_out_of_cube(self, field: str) -> None:
+        """Test that dict keys are checked once the size is known."""
+        data = {field: {"0": "a", "9": "b", "6": "c"}}
+        data.update({k: v for k, v in MINIMAL_DATASET.items() if k != field})
+        with pytest.raises(
+            JSONStatValidationError, match=f"`{field}` keys .* '6', '9'$"
+        ):
+            validate_jsonstat_stream(stream_of(data), chunk_size=4)
+
+    def test_invalid_dict_key(self) -> None:
+        """Test that non-position keys are rejected while streaming."""
+        data = copy.deepcopy(MINIMAL_DATASET)
+        data["value"] = {"0": 1, "x": 2}
+        with pytest.raises(JSONStatValidationError, match="'x'"):
+            validate_jsonstat_stream(stream_of(data))
+
+    def test_invalid_metadata(self) -> None:
+        """Test that header errors come from the models."""
+        data = copy.deepcopy(MINIMAL_DATASET)
+        data["size"] = [2]
+        with pytest.raises(JSONStatValidationError, match="Size array length"):
+            validate_jsonstat_stream(stream_of(data))
+
+    def test_value_on_dimension(self) -> None:
+        """Test that cell data is rejected on non-dataset documents."""
+        data = {"class": "dimension", "category": {"index": ["a"]}, "value": [1]}
+        with pytest.raises(JSONStatValidationError):
+            validate_jsonstat_stream(stream_of(data))
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '{"class": "dataset", "value": [1, 2',
+            '{"class": "dataset", "value": [1 2]}',
+            '{"class": "dataset"} trailing',
+            "[1, 2]",
+        ],
+    )
+    def test_malformed_json(self, text: str) -> None:
+        """Test that malformed JSON is reported as a validation error."""
+        with pytest.raises(JSONStatValidationError, match="Invalid JSON"):
+            validate_jsonstat_stream(io.StringIO(text), chunk_size=4)
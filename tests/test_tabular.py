@@ -0,0 +1,164 @@
+"""Test cases for building datasets from long-format rows."""
+
+import csv
+import io
+
+import pytest
+
+from jsonstat_validator import Dataset
+from jsonstat_validator.export import to_csv
+from jsonstat_validator.tabular import collect_rows, text_value
+
+ROWS = [
+    {"geo": "US", "year": 2021, "value": 3, "status": "p"},
+    {"geo": "EU", "year": 2020, "value": 2},
+    {"geo": "US", "year": 2020, "value": 1.5, "status": None},
+]
+
+
+def round_trip(dataset: Dataset) -> Dataset:
+    """Validate the dump of a dataset."""
+    return Dataset.model_validate(dataset.model_dump(by_alias=True))
+
+
+class TestFromRows:
+    """Test cases for `Dataset.from_rows`."""
+
+    def test_first_seen_order(self) -> None:
+        """Test that categories keep the order they are first seen in."""
+        dataset = Dataset.from_rows(ROWS, ["geo", "year"])
+        assert dataset.id == ["geo", "year"]
+        assert dataset.size == [2, 2]
+        assert dataset.dimension["geo"].category.index == ["US", "EU"]
+        assert dataset.dimension["year"].category.index == ["2021", "2020"]
+        assert dataset.value == [3, 1.5, None, 2]
+        assert dataset.status is None
+        assert round_trip(dataset) == dataset
+
+    def test_sorted_order(self) -> None:
+        """Test that categories can be sorted by ID."""
+        dataset = Dataset.from_rows(ROWS, ["year", "geo"], order="sorted")
+        assert dataset.dimension["year"].category.index == ["2020", "2021"]
+        assert dataset.dimension["geo"].category.index == ["EU", "US"]
+        assert dataset.value == [2, 1.5, None, 3]
+        assert dataset.cell(year="2021", geo="US") == 3
+
+    def test_status(self) -> None:
+        """Test that rows without a status are left out of a sparse status."""
+        dataset = Dataset.from_rows(ROWS, ["geo", "year"], status_col="status")
+        assert dataset.status == {"0": "p"}
+        assert round_trip(dataset) == dataset
+        rows = [*ROWS, {"geo": "EU", "year": 2021, "value": None}]
+        dense = Dataset.from_rows(
+            [{**row, "status": "e"} for row in rows], ["geo", "year"], "value", "status"
+        )
+        assert dense.status == ["e", "e", "e", "e"]
+
+    def test_csv_rows(self) -> None:
+        """Test building a dataset from `csv.DictReader` rows."""
+        text = "geo,year,obs\nUS,2020,1.5\nUS,2021,\n"
+        dataset = Dataset.from_rows(
+            csv.DictReader(io.StringIO(text)), ["geo", "year"], "obs"
+        )
+        assert dataset.value == ["1.5", ""]
+        assert round_trip(dataset) == dataset
+
+    def test_text_fields(self) -> None:
+        """Test that text fields are read back as numbers and nulls."""
+        text = (
+            "geo,year,obs,flag\nUS,2020,1.5,\nUS,2021,,e\nEU,2020,12,\nEU,2021,n/a,\n"
+        )
+        dataset = Dataset.from_rows(
+            csv.DictReader(io.StringIO(text)),
+            ["geo", "year"],
+            "obs",
+            "flag",
+            from_text=True,
+        )
+        assert dataset.value == [1.5, None, 12, "n/a"]
+        assert dataset.status == {"1": "e"}
+
+    def test_csv_round_trip(self) -> None:
+        """Test reading back a dataset written by `to_csv`."""
+        dataset = Dataset.from_rows(ROWS, ["geo", "year"], status_col="status")
+        out = io.StringIO()
+        to_csv(dataset, out)
+        out.seek(0)
+        read = Dataset.from_rows(
+            csv.DictReader(out), ["geo", "year"], status_col="status", from_text=True
+        )
+        assert read == dataset
+
+    def test_single_cell(self) -> None:
+        """Test that rows without dimension columns give a single cell."""
+        dataset = Dataset.from_rows([{"value": 42}], [])
+        assert dataset.id == []
+        assert dataset.size == []
+        assert dataset.value == [42]
+        assert round_trip(dataset) == dataset
+        with pytest.raises(ValueError, match=r"Duplicate rows for cell \(\)"):
+            Dataset.from_rows([{"value": 1}, {"value": 2}], [])
+
+    def test_empty(self) -> None:
+        """Test that no rows give an empty cube."""
+        dataset = Dataset.from_rows([], ["geo"])
+        assert dataset.size == [0]
+        assert dataset.value == []
+
+    def test_duplicate_cell(self) -> None:
+        """Test that two rows for the same cell are rejected."""
+        rows = [*ROWS, {"geo": "EU", "year": 2020, "value": 9}]
+        with pytest.raises(
+            ValueError, match=r"Duplicate rows for cell \(geo=EU, year=2020\)"
+        ):
+            Dataset.from_rows(rows, ["geo", "year"])
+
+    def test_invalid_input(self) -> None:
+        """Test that missing columns and invalid options are rejected."""
+        with pytest.raises(KeyError):
+            Dataset.from_rows(ROWS, ["geo", "sex"])
+        with pytest.raises(ValueError, match="same ID as strings"):
+            Dataset.from_rows([{"g": 1, "value": 1}, {"g": "1", "value": 2}], ["g"])
+        with pytest.raises(ValueError, match="cannot be dimension columns"):
+            Dataset.from_rows(ROWS, ["geo", "value"])
+        with pytest.raises(ValueError, match="order"):
+            Dataset.from_rows(ROWS, ["geo"], order="random")
+        with pytest.raises(ValueError):
+            Dataset.from_rows([{"geo": "US", "value": [1]}], ["geo"])
+
+
+class TestCollectRows:
+    """Test cases for `collect_rows`."""
+
+    @pytest.mark.parametrize("chunk_rows", [1, 2, 65_536])
+    def test_chunks(self, chunk_rows: int) -> None:
+        """Test that chunking does not affect the collected cells."""
+        collected = collect_rows(
+            iter(ROWS), ["geo", "year"], "value", "status", chunk_rows=chunk_rows
+        )
+        assert collected.categories == [["US", "EU"], ["2021", "2020"]]
+        assert collected.positions == [0, 3, 1]
+        assert collected.values == [3, 2, 1.5]
+        assert collected.statuses == ["p", None, None]
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("", None),
+            ("0", 0),
+            ("-12", -12),
+            ("1.50", 1.5),
+            ("1e3", 1000.0),
+            ("-2.5E-1", -0.25),
+            ("012", "012"),
+            ("1_000", "1_000"),
+            (" 1", " 1"),
+            ("nan", "nan"),
+            ("1.", "1."),
+        ],
+    )
+    def test_text_value(self, text: str, expected: object) -> None:
+        """Test that only JSON numbers are parsed from text."""
+        value = text_value(text)
+        assert value == expected
+        assert type(value) is type(expected)
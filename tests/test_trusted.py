@@ -0,0 +1,135 @@
+"""Test cases for building models from trusted data."""
+
+from pathlib import Path
+
+import pytest
+from pydantic import AnyUrl
+
+from jsonstat_validator import (
+    Category,
+    Collection,
+    Dataset,
+    Dimension,
+    JSONStatSchema,
+    JSONStatValidationError,
+    Link,
+    Unit,
+    payload_checksum,
+)
+from jsonstat_validator.models.dimension import DatasetDimension
+
+SAMPLES_DIR = Path(__file__).parent / "samples"
+
+MINIMAL_DATASET = {
+    "version": "2.0",
+    "class": "dataset",
+    "href": "https://example.com/data",
+    "id": ["metric", "time"],
+    "size": [1, 2],
+    "value": [1.5, None],
+    "role": {"metric": ["metric"], "time": ["time"]},
+    "dimension": {
+        "metric": {
+            "category": {
+                "label": {"gdp": "GDP"},
+                "unit": {"gdp": {"decimals": 1, "symbol": "$"}},
+            }
+        },
+        "time": {
+            "category": {"index": ["2020", "2021"]},
+            "link": {"describedby": [{"href": "https://example.com/time"}]},
+        },
+    },
+    "link": {"alternate": [{"type": "text/csv", "href": "https://example.com/csv"}]},
+}
+
+MODELS = {"dataset": Dataset, "dimension": Dimension, "collection": Collection}
+
+
+class TestFromTrusted:
+    """Test cases for `from_trusted`."""
+
+    @pytest.mark.parametrize(
+        "sample_path", sorted(SAMPLES_DIR.rglob("*.json")), ids=str
+    )
+    def test_official_samples(self, sample_path: Path) -> None:
+        """Test that dumped samples rebuild into equal models."""
+        model = JSONStatSchema.model_validate_json(sample_path.read_bytes()).root
+        trusted = MODELS[model.class_].from_trusted(model.model_dump())
+        assert trusted == model
+        assert trusted.model_dump_json() == model.model_dump_json()
+
+    def test_nested_models(self) -> None:
+        """Test that nested members are built as models."""
+        dataset = Dataset.from_trusted(MINIMAL_DATASET)
+        assert dataset == Dataset.model_validate(MINIMAL_DATASET)
+        assert isinstance(dataset.href, AnyUrl)
+        metric = dataset.dimension["metric"]
+        assert isinstance(metric, DatasetDimension)
+        assert isinstance(metric.category, Category)
+        assert isinstance(metric.category.unit["gdp"], Unit)
+        assert isinstance(dataset.dimension["time"].link["describedby"][0], Link)
+        assert isinstance(dataset.link["alternate"][0], Link)
+
+    def test_lookups(self) -> None:
+        """Test that cached lookups work on trusted datasets."""
+        dataset = Dataset.from_trusted(MINIMAL_DATASET)
+        assert dataset.cell(time="2020") == 1.5
+        assert dataset.n_cells == 2
+
+    def test_no_validation(self) -> None:
+        """Test that trusted data is not checked."""
+        dataset = Dataset.from_trusted({**MINIMAL_DATASET, "size": [5]})
+        assert dataset.size == [5]
+
+    def test_embedded_documents_validated(self) -> None:
+        """Test that documents embedded in a collection are validated."""
+        collection = {
+            "version": "2.0",
+            "class": "collection",
+            "link": {"item": [MINIMAL_DATASET]},
+        }
+        trusted = Collection.from_trusted(collection)
+        assert trusted == Collection.model_validate(collection)
+        invalid = {**MINIMAL_DATASET, "size": [5]}
+        with pytest.raises(JSONStatValidationError, match="Size array length"):
+            Collection.from_trusted({**collection, "link": {"item": [invalid]}})
+
+
+class TestChecksum:
+    """Test cases for trusted payload checksums."""
+
+    def test_matching_checksum(self) -> None:
+        """Test that a matching checksum is accepted."""
+        checksum = payload_checksum(MINIMAL_DATASET)
+        dataset = Dataset.from_trusted(MINIMAL_DATASET, checksum=checksum)
+        assert dataset == Dataset.model_validate(MINIMAL_DATASET)
+
+    def test_changed_payload(self) -> None:
+        """Test that a payload changed after checksumming is rejected."""
+        checksum = payload_checksum(MINIMAL_DATASET)
+        changed = {**MINIMAL_DATASET, "value": [1.5, 2.0]}
+        with pytest.raises(JSONStatValidationError, match="checksum"):
+            Dataset.from_trusted(changed, checksum=checksum)
+
+    def test_sampled_cells(self) -> None:
+        """Test that changed metadata, shape and sampled cells are detected."""
+        checksum = payload_checksum(MINIMAL_DATASET)
+        changes = [
+            {"value": [2.5, None]},
+            {"value": {"0": 1.5}},
+            {"status": "e"},
+            {"href": "https://example.com/other"},
+        ]
+        for change in changes:
+            assert payload_checksum({**MINIMAL_DATASET, **change}) != checksum
+        value = [float(i) for i in range(1000)]
+        sampled = payload_checksum({**MINIMAL_DATASET, "value": value})
+        value[1] = -1.0
+        assert payload_checksum({**MINIMAL_DATASET, "value": value}) == sampled
+
+    def test_equal_data_equal_checksum(self) -> None:
+        """Test that equal payloads give equal checksums."""
+        copy = Dataset.model_validate(MINIMAL_DATASET).model_dump()
+        again = Dataset.from_trusted(copy).model_dump()
+        assert payload_checksum(copy) == payload_checksum(again)
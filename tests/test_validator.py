@@ -0,0 +1,87 @@
+"""Test cases for the validator entry points."""
+
+import copy
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from jsonstat_validator.utils import JSONStatValidationError
+from jsonstat_validator.validator import (
+    parse_jsonstat_json,
+    validate_jsonstat,
+    validate_jsonstat_json,
+)
+from jsonstat_validator.values import CompactValues
+
+MINIMAL_DATASET = {
+    "version": "2.0",
+    "class": "dataset",
+    "id": ["time", "geo"],
+    "size": [2, 3],
+    "value": [1, 2, 3, 4, 5, 6],
+    "dimension": {
+        "time": {"category": {"index": ["2020", "2021"]}},
+        "geo": {"category": {"index": {"US": 0, "EU": 1, "AS": 2}}},
+    },
+}
+
+
+def with_changes(**changes: Any) -> dict:
+    """Return a copy of the minimal dataset with some members replaced."""
+    data = copy.deepcopy(MINIMAL_DATASET)
+    data.update(changes)
+    return data
+
+
+INVALID_DOCUMENTS = [
+    {"version": "2.0", "class": "dataset"},
+    with_changes(size=[2]),
+    with_changes(size="value1"),
+    with_changes(version=2.0),
+    with_changes(value=[1, 2, [3], 4, 5, 6]),
+    with_changes(status=["A", "B"]),
+    with_changes(updated="invalid-date-format"),
+    with_changes(role={"time": ["time"], "geo": ["time"]}),
+    with_changes(link={"bogus": []}),
+    {"class": "dimension", "category": {"index": ["a", "a"]}},
+    {"class": "collection", "link": {"item": [{"label": "no href"}]}},
+]
+
+
+class TestValidateJSON:
+    """Test cases for validating raw JSON documents."""
+
+    @pytest.mark.parametrize("as_bytes", [False, True])
+    def test_valid_document(self, as_bytes: bool) -> None:
+        """Test that raw str and bytes documents validate successfully."""
+        text = json.dumps(MINIMAL_DATASET)
+        assert validate_jsonstat_json(text.encode() if as_bytes else text) is True
+
+    def test_valid_path(self, tmp_path: Path) -> None:
+        """Test that a document is read from a path."""
+        path = tmp_path / "dataset.json"
+        path.write_text(json.dumps(MINIMAL_DATASET), encoding="utf-8")
+        assert validate_jsonstat_json(path) is True
+
+    @pytest.mark.parametrize("data", INVALID_DOCUMENTS)
+    def test_same_errors_as_dict_validation(self, data: dict) -> None:
+        """Test that raw and dict validation report the same errors."""
+        with pytest.raises(JSONStatValidationError) as from_dict:
+            validate_jsonstat(data)
+        with pytest.raises(JSONStatValidationError) as from_json:
+            validate_jsonstat_json(json.dumps(data))
+        assert str(from_json.value) == str(from_dict.value)
+
+    def test_invalid_json(self) -> None:
+        """Test that malformed JSON is reported as a validation error."""
+        with pytest.raises(JSONStatValidationError, match="json_invalid"):
+            validate_jsonstat_json(b'{"class": "dataset",')
+
+    def test_parse_with_context(self) -> None:
+        """Test that the parsed document is returned, built with the context."""
+        document = parse_jsonstat_json(
+            json.dumps(MINIMAL_DATASET), context={"compact_values": True}
+        )
+        assert isinstance(document.root.value, CompactValues)
@@ -0,0 +1,333 @@
+"""Test cases for value validation and compact storage."""
+
+import json
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from jsonstat_validator import CompactValues, Dataset, JSONStatSchema
+from jsonstat_validator.models.dataset import StatusType, ValueType
+from jsonstat_validator.values import (
+    dense_status,
+    dense_values,
+    null_count,
+    optimal_form,
+    sparse_status,
+    sparse_values,
+    validate_status,
+    validate_values,
+)
+
+SAMPLES_DIR = Path(__file__).parent / "samples"
+
+MINIMAL_DATASET = {
+    "version": "2.0",
+    "class": "dataset",
+    "id": ["time"],
+    "size": [4],
+    "value": [1.5, None, 3.25, 4.0],
+    "dimension": {"time": {"category": {"index": ["2020", "2021", "2022", "2023"]}}},
+}
+COMPACT = {"compact_values": True}
+
+
+class TestValidateValues:
+    """Test cases for the one-pass `value` and `status` validators."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            [1, 2.5, None, "a"],
+            (1, 2, 3),
+            [True, 1, Decimal("1.5")],
+            {"0": 1, "5": None, "7": True},
+            [],
+        ],
+    )
+    def test_same_result_as_union(self, value: object) -> None:
+        """Test that cells are coerced as by the `value` union type."""
+        expected = TypeAdapter(ValueType).validate_python(value)
+        result = validate_values(value)
+        assert result == expected
+        cells = result.values() if isinstance(result, dict) else result
+        expected_cells = expected.values() if isinstance(expected, dict) else expected
+        assert list(map(type, cells)) == list(map(type, expected_cells))
+
+    @pytest.mark.parametrize("status", [None, "A", ["A", "B"], ("A",), {"0": "A"}, []])
+    def test_status_same_result_as_union(self, status: object) -> None:
+        """Test that status is validated as by the `status` union type."""
+        assert validate_status(status) == TypeAdapter(StatusType).validate_python(
+            status
+        )
+
+    def test_input_is_copied(self) -> None:
+        """Test that the validated cells do not share the input list."""
+        value = [1, 2]
+        assert validate_values(value) == value
+        assert validate_values(value) is not value
+        assert validate_values((1, 2)) == [1, 2]
+        data = {**MINIMAL_DATASET, "value": [1, 2, 3, 4], "status": ["a"] * 4}
+        dataset = Dataset.model_validate(data)
+        data["value"][0] = 9
+        data["status"][0] = "b"
+        assert dataset.value[0] == 1
+        assert dataset.status[0] == "a"
+
+    @pytest.mark.parametrize(
+        ("value", "loc", "error_type"),
+        [
+            ([1, 2, [3], {}], ("value", 2), "value_type"),
+            ({"0": 1, "4": {}}, ("value", "4"), "value_type"),
+            ({0: 1}, ("value", 0, "[key]"), "string_type"),
+            ("1, 2", ("value",), "list_type"),
+            (None, ("value",), "list_type"),
+        ],
+    )
+    def test_value_errors(self, value: object, loc: tuple, error_type: str) -> None:
+        """Test that a single error points at the offending cell."""
+        data = {**MINIMAL_DATASET, "value": value}
+        with pytest.raises(ValidationError) as exc_info:
+            Dataset.model_validate(data)
+        (error,) = exc_info.value.errors()
+        assert error["loc"] == loc
+        assert error["type"] == error_type
+
+    @pytest.mark.parametrize(
+        ("status", "loc", "error_type"),
+        [
+            (["A", 1, "B", "C"], ("status", 1), "string_type"),
+            ({"3": None}, ("status", "3"), "string_type"),
+            (5, ("status",), "list_type"),
+        ],
+    )
+    def test_status_errors(self, status: object, loc: tuple, error_type: str) -> None:
+        """Test that a single error points at the offending status."""
+        data = {**MINIMAL_DATASET, "status": status}
+        with pytest.raises(ValidationError) as exc_info:
+            Dataset.model_validate(data)
+        (error,) = exc_info.value.errors()
+        assert error["loc"] == loc
+        assert error["type"] == error_type
+
+
+class TestCompactValues:
+    """Test cases for `CompactValues`."""
+
+    @pytest.mark.parametrize(
+        ("values", "kind"),
+        [
+            ([1, 2, None, -(2**63)], "q"),
+            ([1.5, None, 2.0, 1e300], "d"),
+            ([1, 2.5, None, 2**53], "n"),
+            ([None] * 9, "q"),
+        ],
+    )
+    def test_round_trip(self, values: list, kind: str) -> None:
+        """Test that values and their types read back unchanged."""
+        compact = CompactValues.from_list(values)
+        assert compact.kind == kind
+        assert compact.tolist() == values
+        assert list(compact) == values
+        assert [compact[i] for i in range(-len(values), 0)] == values
+        assert compact[1:3] == values[1:3]
+        for original, stored in zip(values, compact, strict=True):
+            assert type(original) is type(stored)
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [],
+            ["a", 1],
+            [True, 1],
+            [2**64],
+            [1, 2.0],
+            [2**53 + 1, 0.5],
+        ],
+    )
+    def test_not_compactable(self, values: list) -> None:
+        """Test that lists a typed array cannot represent are kept as lists."""
+        assert CompactValues.from_list(values) is None
+
+    def test_null_bitmap(self) -> None:
+        """Test the null bitmap layout and null positions."""
+        values = [None if i % 3 == 0 else i for i in range(20)]
+        compact = CompactValues.from_list(values)
+        assert compact.nulls[0] == 0b01001001
+        assert list(compact.null_positions()) == list(range(0, 20, 3))
+        assert compact.is_null(18) and not compact.is_null(19)
+        assert compact.nbytes == 20 * 8 + 3
+
+    def test_equality(self) -> None:
+        """Test comparisons with lists and other compact values."""
+        compact = CompactValues.from_list([1, None])
+        assert compact == [1, None]
+        assert compact == CompactValues.from_list([1, None])
+        assert compact != [1.0, 2]
+
+
+class TestCompactDataset:
+    """Test cases for datasets validated with compact values."""
+
+    def test_opt_in(self) -> None:
+        """Test that values are only compacted when requested."""
+        assert isinstance(Dataset.model_validate(MINIMAL_DATASET).value, list)
+        dataset = Dataset.model_validate(MINIMAL_DATASET, context=COMPACT)
+        assert isinstance(dataset.value, CompactValues)
+        assert dataset == Dataset.model_validate(MINIMAL_DATASET)
+
+    def test_mixed_values_stay_lists(self) -> None:
+        """Test that string values keep the list storage."""
+        data = {**MINIMAL_DATASET, "value": [1, "a", None, 2]}
+        dataset = Dataset.model_validate(data, context=COMPACT)
+        assert dataset.value == [1, "a", None, 2]
+        assert isinstance(dataset.value, list)
+
+    def test_serialization(self) -> None:
+        """Test that compact datasets serialize to identical JSON."""
+        plain = Dataset.model_validate(MINIMAL_DATASET)
+        compact = Dataset.model_validate_json(
+            json.dumps(MINIMAL_DATASET), context=COMPACT
+        )
+        assert compact.model_dump() == plain.model_dump()
+        assert compact.model_dump(mode="json") == plain.model_dump(mode="json")
+        assert compact.model_dump_json() == plain.model_dump_json()
+
+    @pytest.mark.parametrize(
+        "sample_path", sorted(SAMPLES_DIR.rglob("*.json")), ids=lambda p: p.name
+    )
+    def test_official_samples(self, sample_path: Path) -> None:
+        """Test that official samples dump identically with compact values."""
+        payload = sample_path.read_bytes()
+        plain = JSONStatSchema.model_validate_json(payload)
+        compact = JSONStatSchema.model_validate_json(payload, context=COMPACT)
+        assert compact.model_dump_json() == plain.model_dump_json()
+
+
+class TestValueForms:
+    """Test cases for dense/sparse conversions of `value` and `status`."""
+
+    def test_conversions(self) -> None:
+        """Test that the dense and sparse forms convert both ways."""
+        dense = [1, None, "a", None]
+        sparse = {"0": 1, "2": "a"}
+        assert sparse_values(dense) == sparse
+        assert sparse_values(CompactValues.from_list([1, None, 2])) == {"0": 1, "2": 2}
+        assert sparse_values({"0": 1, "1": None}) == {"0": 1}
+        assert dense_values(sparse, 4) == dense
+        assert dense_values(dense, 4) is dense
+
+    def test_null_count(self) -> None:
+        """Test that nulls and cells missing from a dict are counted."""
+        assert null_count([1, None, None], 3) == 2
+        assert null_count({"0": 1, "1": None}, 5) == 4
+        assert null_count(CompactValues.from_list([None, 1.5, None]), 3) == 2
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ([1.5, None, 2.5, 3.5], "dense"),
+            ([1.5] + [None] * 9, "sparse"),
+            ({"3": 1}, "sparse"),
+            ({str(i): 1 for i in range(10)}, "dense"),
+        ],
+    )
+    def test_optimal_form(self, value: list | dict, expected: str) -> None:
+        """Test that the form with the shorter JSON is chosen."""
+        n_cells = 4 if len(value) == 4 else 10
+        assert optimal_form(value, n_cells) == expected
+        sizes = {
+            "dense": len(json.dumps(dense_values(value, n_cells))),
+            "sparse": len(json.dumps(sparse_values(value))),
+        }
+        assert min(sizes, key=sizes.get) == expected
+
+    @pytest.mark.parametrize(
+        ("status", "expected"),
+        [
+            ({"1": "b", "0": "a"}, ["a", "b"]),
+            ({"0": "a"}, {"0": "a"}),
+            ({"0": "a", "5": "b"}, {"0": "a", "5": "b"}),
+            ("a", "a"),
+            (None, None),
+        ],
+    )
+    def test_dense_status(self, status: object, expected: object) -> None:
+        """Test that only a status covering every cell becomes a list."""
+        assert dense_status(status, 2) == expected
+
+    def test_sparse_status(self) -> None:
+        """Test that per-cell status lists become dicts, single ones do not."""
+        assert sparse_status(["a", "b"]) == {"0": "a", "1": "b"}
+        assert sparse_status(["a"]) == ["a"]
+        assert sparse_status("a") == "a"
+
+
+class TestDatasetValueForms:
+    """Test cases for `Dataset.to_dense`, `to_sparse` and `value_form`."""
+
+    def test_round_trip(self) -> None:
+        """Test that converting to sparse and back gives the same dataset."""
+        dataset = Dataset.model_validate({**MINIMAL_DATASET, "status": list("abcd")})
+        sparse = dataset.to_sparse()
+        assert sparse.value == {"0": 1.5, "2": 3.25, "3": 4.0}
+        assert sparse.status == {"0": "a", "1": "b", "2": "c", "3": "d"}
+        assert sparse.to_dense() == dataset
+        assert Dataset.model_validate(sparse.model_dump()) == sparse
+
+    def test_status_per_stored_value(self) -> None:
+        """Test that a status list of a dict-form value dumps densely and validly."""
+        dataset = Dataset.model_validate(
+            {**MINIMAL_DATASET, "value": {"0": 1.5, "3": 4.0}, "status": ["a", "d"]}
+        )
+        assert dataset.status == {"0": "a", "3": "d"}
+        dumped = dataset.model_dump(context={"value_form": "dense"})
+        assert dumped["value"] == [1.5, None, None, 4.0]
+        assert Dataset.model_validate(dumped).to_sparse() == dataset
+
+    def test_compact_values(self) -> None:
+        """Test that compact values convert like lists."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET, context=COMPACT)
+        assert dataset.to_sparse().value == {"0": 1.5, "2": 3.25, "3": 4.0}
+
+    def test_optimal_value_form(self) -> None:
+        """Test that mostly-null datasets prefer the sparse form."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        assert dataset.optimal_value_form() == "dense"
+        mostly_null = [None, None, None, 4.0]
+        assert (
+            dataset.model_copy(update={"value": mostly_null}).optimal_value_form()
+            == "sparse"
+        )
+
+    @pytest.mark.parametrize("form", ["dense", "sparse", "auto"])
+    def test_serialization_context(self, form: str) -> None:
+        """Test that `value_form` serializes value and status in that form."""
+        dataset = Dataset.model_validate(
+            {
+                **MINIMAL_DATASET,
+                "value": [None, None, None, 4.0],
+                "status": list("abcd"),
+            }
+        )
+        dumped = json.loads(dataset.model_dump_json(context={"value_form": form}))
+        expected = dataset.to_dense() if form == "dense" else dataset.to_sparse()
+        assert dumped["value"] == expected.value
+        assert dumped["status"] == expected.status
+        assert Dataset.model_validate(dumped).to_dense() == dataset
+        assert (
+            dataset.model_dump(context={"value_form": form})["value"]
+            == (dumped["value"])
+        )
+
+    def test_default_serialization_unchanged(self) -> None:
+        """Test that value keeps its form without a `value_form` entry."""
+        sparse = Dataset.model_validate(MINIMAL_DATASET).to_sparse()
+        assert sparse.model_dump()["value"] == sparse.value
+
+    def test_invalid_form(self) -> None:
+        """Test that an unknown `value_form` is rejected."""
+        dataset = Dataset.model_validate(MINIMAL_DATASET)
+        with pytest.raises(ValueError, match="value_form"):
+            dataset.model_dump(context={"value_form": "packed"})